@@ -0,0 +1,96 @@
+"""
+On-disk response cache for the live debug/test scripts.
+
+Set ``Q_TEST_CACHE=1`` and call ``install(engine)`` after building an engine
+(or ``install_service(service)`` for a bare data service): the upstream fetch
+methods are wrapped so the results are stored under ``q_python/.cache/`` and
+re-used across runs until their TTL expires. Without the env var both calls
+do nothing, so the scripts keep hitting the live APIs by default.
+
+Results are pickled rather than written as JSON because the services return
+``datetime`` objects that the event detectors compare against.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import time
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+MINUTE = 60
+DAY = 24 * 60 * MINUTE
+
+# (service attribute on the engine, method name) -> TTL in seconds
+CACHED_METHODS = {
+    ('stock_news_service', 'fetch_news'): 7 * DAY,
+    ('lunarcrush_service', 'fetch_coin_news'): 7 * DAY,
+    ('lunarcrush_service', 'fetch_social_metrics'): 15 * MINUTE,
+    ('finnhub_service', 'fetch_earnings_calendar_batch'): 7 * DAY,
+    ('finnhub_service', 'fetch_company_fundamentals_batch'): 30 * DAY,
+}
+
+
+def enabled():
+    """Return True when ``Q_TEST_CACHE`` is switched on."""
+    return os.getenv('Q_TEST_CACHE', '').lower() in ('1', 'true')
+
+
+def _cache_path(name, args, kwargs):
+    key = repr((name, args, sorted(kwargs.items()))).encode('utf-8')
+    return os.path.join(CACHE_DIR, hashlib.md5(key).hexdigest() + '.pkl')
+
+
+def cached(fn, name, ttl):
+    """Wrap ``fn`` so its results are read from / written to the disk cache."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        path = _cache_path(name, args, kwargs)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            if time.time() - entry['timestamp'] < ttl:
+                return entry['payload']
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError):
+            pass
+
+        payload = fn(*args, **kwargs)
+        # Don't pin an empty result (quota gate closed, API down) for a week.
+        if payload:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = path + '.tmp'
+            with open(tmp, 'wb') as f:
+                pickle.dump({'timestamp': time.time(), 'payload': payload}, f)
+            os.replace(tmp, path)
+        return payload
+
+    return wrapper
+
+
+def _wrap(service, method_name, ttl):
+    method = getattr(service, method_name)
+    if hasattr(method, '__wrapped__'):
+        return  # shared service singleton already wrapped
+    name = f"{type(service).__name__}.{method_name}"
+    setattr(service, method_name, cached(method, name, ttl))
+
+
+def install(engine):
+    """Route ``engine``'s upstream fetches through the disk cache if enabled."""
+    if not enabled():
+        return engine
+    for (service_attr, method_name), ttl in CACHED_METHODS.items():
+        service = getattr(engine, service_attr, None)
+        if service is not None and hasattr(service, method_name):
+            _wrap(service, method_name, ttl)
+    return engine
+
+
+def install_service(service):
+    """Route a data service's own cached methods through the disk cache if enabled."""
+    if not enabled():
+        return service
+    for (_, method_name), ttl in CACHED_METHODS.items():
+        if hasattr(service, method_name):
+            _wrap(service, method_name, ttl)
+    return service
@@ -4,6 +4,7 @@ Debug script for Engine 5 - Check why events are 0
 import sys
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -15,18 +16,24 @@ logging.basicConfig(
 )
 
 from src.services.engines.event_risk_engine import EventRiskEngine
-from src.services.data.stock_news_service import StockNewsService
-from src.services.data.lunarcrush_service import LunarCrushService
+from src.services.data.stock_news_service import get_stock_news_service
+from src.services.data.lunarcrush_service import get_lunarcrush_service
+from debug_cache import install as install_debug_cache  # opt-in via Q_TEST_CACHE=1
 
-def debug_stock_news():
+def fetch_stock_news():
+    """Fetch the AAPL articles inspected by ``debug_stock_news``."""
+    return get_stock_news_service().fetch_news('AAPL', limit=10)
+
+def fetch_crypto_news():
+    """Fetch the BTC articles inspected by ``debug_crypto_news``."""
+    return get_lunarcrush_service().fetch_coin_news('BTC', limit=10)
+
+def debug_stock_news(news):
     """Debug stock news fetching."""
     print("\n" + "=" * 80)
     print("DEBUG: Stock News Fetching")
     print("=" * 80)
     
-    service = StockNewsService()
-    news = service.fetch_news('AAPL', limit=10)
-    
     print(f"\nFetched {len(news)} news articles")
     
     if news:
@@ -47,15 +54,12 @@ def debug_stock_news():
     else:
         print("\n⚠️  No news fetched!")
 
-def debug_crypto_news():
+def debug_crypto_news(news):
     """Debug crypto news fetching."""
     print("\n" + "=" * 80)
     print("DEBUG: Crypto News Fetching")
     print("=" * 80)
     
-    service = LunarCrushService()
-    news = service.fetch_coin_news('BTC', limit=10)
-    
     print(f"\nFetched {len(news)} news articles")
     
     if news:
@@ -82,26 +86,35 @@ def debug_event_detection():
     print("DEBUG: Event Detection")
     print("=" * 80)
     
-    engine = EventRiskEngine()
+    engine = install_debug_cache(EventRiskEngine())
     
-    # Test stock
-    print("\n1. Testing AAPL event detection...")
-    events = engine._get_upcoming_events('AAPL', 'stock', days_ahead=30)
-    print(f"   Detected {len(events)} events")
-    if events:
-        for event in events[:3]:
-            print(f"   - {event.get('type')}: {event.get('date')}")
+    # AAPL goes to StockNews/Finnhub and BTC to LunarCrush, so fetch both
+    # at once and print in order afterwards.
+    assets = [
+        {'asset_id': 'AAPL', 'asset_type': 'stock', 'days_ahead': 30},
+        {'asset_id': 'BTC', 'asset_type': 'crypto', 'days_ahead': 30},
+    ]
+    results = run_parallel(engine, assets)
     
-    # Test crypto
-    print("\n2. Testing BTC event detection...")
-    events = engine._get_upcoming_events('BTC', 'crypto', days_ahead=30)
-    print(f"   Detected {len(events)} events")
-    if events:
-        for event in events[:3]:
-            print(f"   - {event.get('type')}: {event.get('date')}")
+    for i, (asset, events) in enumerate(zip(assets, results), 1):
+        print(f"\n{i}. Testing {asset['asset_id']} event detection...")
+        print(f"   Detected {len(events)} events")
+        if events:
+            for event in events[:3]:
+                print(f"   - {event.get('type')}: {event.get('date')}")
+
+def run_parallel(engine, assets):
+    """Run ``engine._get_upcoming_events`` for each kwargs dict concurrently."""
+    with ThreadPoolExecutor(max_workers=len(assets)) as ex:
+        return list(ex.map(lambda a: engine._get_upcoming_events(**a), assets))
 
 if __name__ == '__main__':
-    debug_stock_news()
-    debug_crypto_news()
+    # StockNews and LunarCrush are independent upstreams: fetch both at once,
+    # then print the two reports in order so the output doesn't interleave.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        stock_news = ex.submit(fetch_stock_news)
+        crypto_news = ex.submit(fetch_crypto_news)
+        debug_stock_news(stock_news.result())
+        debug_crypto_news(crypto_news.result())
     debug_event_detection()
 
@@ -6,8 +6,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.services.engines.event_risk_engine import EventRiskEngine
+from debug_cache import install as install_debug_cache  # opt-in via Q_TEST_CACHE=1
 
-engine = EventRiskEngine()
+engine = install_debug_cache(EventRiskEngine())
 
 # Get events for AAPL
 events = engine._get_upcoming_events('AAPL', 'stock', days_ahead=30)
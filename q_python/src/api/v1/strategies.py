@@ -66,8 +66,9 @@ async def parse_strategy(strategy_data: Dict[str, Any] = Body(...)):
         parsed_strategy = parser.parse(strategy_data)
         return {
             "success": True,
-            "parsed_strategy": parsed_strategy,
-            "required_indicators": parser.extract_indicator_requirements(strategy_data)
+            # Underscore keys are executor internals (numpy arrays), not JSON
+            "parsed_strategy": {k: v for k, v in parsed_strategy.items() if not k.startswith('_')},
+            "required_indicators": parsed_strategy['required_indicators']
         }
     except ValueError as e:
         logger.error(f"Error parsing strategy: {str(e)}")
@@ -58,6 +58,22 @@ FINBERT_CONFIG: Dict[str, Any] = {
     # Inference timeout (seconds)
     "inference_timeout": int(os.getenv("FINBERT_INFERENCE_TIMEOUT", "30")),
     
+    # torch.compile the model at load time (off by default: compiling adds
+    # start-up time and memory, which the CPU deployment can't spare).
+    "torch_compile": os.getenv("FINBERT_TORCH_COMPILE", "false").lower() == "true",
+    
+    # Per-text result cache for analyze_batch (0 disables). The same articles
+    # are re-scored on every signal request until the news cache refreshes.
+    "result_cache_size": int(os.getenv("FINBERT_RESULT_CACHE_SIZE", "2048")),
+    
+    # Weight dtype: fp32 (default), fp16 (CUDA only) or bf16 (CUDA, or CPUs
+    # with native bf16 such as Sapphire Rapids / Zen 4).
+    "dtype": os.getenv("FINBERT_DTYPE", "fp32").lower(),
+    
+    # Opt-in mixed precision on GPU (bf16 where supported, else fp16). Off by
+    # default like "dtype": it changes output values. CPU stays fp32.
+    "cuda_autocast": os.getenv("FINBERT_CUDA_AUTOCAST", "false").lower() == "true",
+    
     # Memory management
     "enable_auto_unload": os.getenv("FINBERT_ENABLE_AUTO_UNLOAD", "false").lower() == "true",
     "idle_timeout": int(os.getenv("FINBERT_IDLE_TIMEOUT", "3600")),  # Unload after 1 hour of inactivity
@@ -100,6 +116,10 @@ STOCKNEWS_QUOTA_STATE_PATH = os.getenv(
     os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "stocknews_quota.json"),
 )
 
+# FRED cache. Series publish at most daily (CPI monthly), and every stock's
+# EventRiskEngine run asks for the same FEDFUNDS/CPI/yield-curve values.
+FRED_CACHE_TTL_SECS = int(os.getenv("FRED_CACHE_TTL_SECS", "21600"))  # 6h
+
 # NestJS Backend API Configuration
 NESTJS_API_URL = os.getenv("NESTJS_API_URL", "http://localhost:3000")
 NESTJS_API_TIMEOUT = int(os.getenv("NESTJS_API_TIMEOUT", "10"))
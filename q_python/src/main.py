@@ -188,6 +188,24 @@ async def startup_event():
     asyncio.create_task(background_init())
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Shutdown event - releases the shared signal-generation / FRED thread pools and NestJS client."""
+    # Only if signal generation was ever imported; don't pull in the engines now.
+    signal_generator = sys.modules.get("src.services.strategies.signal_generator")
+    if signal_generator is not None:
+        signal_generator.shutdown_signal_pools()
+    event_risk_engine = sys.modules.get("src.services.engines.event_risk_engine")
+    if event_risk_engine is not None:
+        event_risk_engine.shutdown_fred_pool()
+    fred_service = sys.modules.get("src.services.macro.fred_service")
+    if fred_service is not None:
+        fred_service.shutdown_fetch_pool()
+    market_signals = sys.modules.get("src.services.sentiment.market_signals")
+    if market_signals is not None:
+        market_signals.close_nestjs_client()
+
+
 async def background_init():
     """Initialize heavy services in the background after server starts."""
     import time
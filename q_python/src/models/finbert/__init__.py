@@ -3,6 +3,7 @@ FinBERT Model Package
 Provides financial sentiment analysis using ProsusAI/finbert model.
 """
 import os
+import threading
 from .model import FinBERTModel
 from .inference import FinBERTInference
 
@@ -14,6 +15,7 @@ __all__ = [
 
 # Singleton instance for inference
 _inference_instance: FinBERTInference = None
+_inference_lock = threading.Lock()
 
 
 def get_finbert_inference() -> FinBERTInference:
@@ -27,7 +29,9 @@ def get_finbert_inference() -> FinBERTInference:
     global _inference_instance
     
     if _inference_instance is None:
-        _inference_instance = FinBERTInference()
+        with _inference_lock:
+            if _inference_instance is None:
+                _inference_instance = FinBERTInference()
     
     return _inference_instance
 
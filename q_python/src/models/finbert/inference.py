@@ -3,8 +3,10 @@ FinBERT Inference Pipeline
 Handles sentiment analysis using the ProsusAI/finbert model.
 """
 import logging
+import threading
 import torch
 import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from .model import FinBERTModel
 from src.config import FINBERT_CONFIG
@@ -33,6 +35,11 @@ class FinBERTInference:
         self._tokenizer = None
         self._last_use_time = None
         
+        # text -> result, LRU-bounded; see analyze_batch
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._result_cache_size = FINBERT_CONFIG.get("result_cache_size", 2048)
+        self._result_cache_lock = threading.Lock()
+        
         # Sentiment label mapping (FinBERT outputs: 0=positive, 1=negative, 2=neutral)
         self.label_map = {0: 'positive', 1: 'negative', 2: 'neutral'}
     
@@ -56,7 +63,7 @@ class FinBERTInference:
     
     def _infer_with_timeout(self, model, inputs, device):
         """
-        Run a forward pass under torch.no_grad().
+        Run a forward pass under the model manager's inference context.
 
         This used to spawn a daemon thread and join() it with a timeout to bail
         on a hung inference. That was actively harmful: a Python thread can't be
@@ -72,7 +79,7 @@ class FinBERTInference:
         callers/except-clauses stay valid; the timeout branch simply never
         fires now.
         """
-        with torch.no_grad():
+        with self.model_manager.inference_context():
             return model(**inputs)
     
     def _parse_sentiment(self, logits: torch.Tensor) -> Tuple[str, float]:
@@ -115,12 +122,7 @@ class FinBERTInference:
         """
         if not text or not isinstance(text, str):
             self.logger.warning("Empty or invalid text provided")
-            return {
-                'sentiment': 'neutral',
-                'score': 0.0,
-                'confidence': 0.0,
-                'raw_output': ''
-            }
+            return self._empty_result()
         
         try:
             # Get model and tokenizer
@@ -143,7 +145,7 @@ class FinBERTInference:
             # Run inference with timeout
             try:
                 outputs = self._infer_with_timeout(model, inputs, device)
-                logits = outputs.logits
+                logits = outputs.logits.float()
             except TimeoutError as e:
                 self.logger.error(f"Inference timeout: {str(e)}")
                 return {
@@ -200,19 +202,73 @@ class FinBERTInference:
             return []
         
         batch_size = batch_size or self.batch_size
-        results = []
-        total = len(texts)
+        
+        # Texts scored before (the same article on the next signal request,
+        # or the same item in another phase) are served from the cache, so
+        # only new texts are tokenized and run through the model.
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        invalid = 0
+        with self._result_cache_lock:
+            for idx, text in enumerate(texts):
+                if not text or not isinstance(text, str):
+                    # Same neutral result analyze_sentiment gives; keeps
+                    # None / non-str items out of the cache and length sort.
+                    results[idx] = self._empty_result()
+                    invalid += 1
+                    continue
+                cached = self._result_cache.get(text)
+                if cached is not None:
+                    self._result_cache.move_to_end(text)
+                    results[idx] = dict(cached)
+                else:
+                    pending.setdefault(text, []).append(idx)
+        if invalid:
+            self.logger.warning(f"{invalid} empty or invalid text(s) in batch")
+        
+        # Batch texts of similar length together so short ones aren't padded
+        # out to a long neighbour. Results are keyed by text, so the order
+        # they are computed in doesn't matter. Character count is a good
+        # enough proxy for token count and avoids tokenizing twice.
+        uncached = sorted(pending, key=len)
+        total = len(uncached)
         
         for i in range(0, total, batch_size):
-            batch = texts[i:i + batch_size]
+            batch = uncached[i:i + batch_size]
             batch_results = self._analyze_batch_internal(batch)
-            results.extend(batch_results)
+            for text, result in zip(batch, batch_results):
+                for idx in pending[text]:
+                    results[idx] = dict(result)
+            self._cache_results(batch, batch_results)
             
             if (i + batch_size) % 50 == 0:
                 self.logger.info(f"Processed {min(i + batch_size, total)}/{total} texts")
         
         return results
     
+    @staticmethod
+    def _empty_result() -> Dict[str, Any]:
+        """Neutral, zero-confidence result for empty or invalid input."""
+        return {
+            'sentiment': 'neutral',
+            'score': 0.0,
+            'confidence': 0.0,
+            'raw_output': ''
+        }
+    
+    def _cache_results(self, texts: List[str], results: List[Dict[str, Any]]) -> None:
+        """Store successful batch results, evicting the least recently used."""
+        if self._result_cache_size <= 0:
+            return
+        with self._result_cache_lock:
+            for text, result in zip(texts, results):
+                if result.get('error'):
+                    continue
+                self._result_cache[text] = dict(result)
+                self._result_cache.move_to_end(text)
+            while len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+    
     def _analyze_batch_internal(self, texts: List[str]) -> List[Dict[str, Any]]:
         """Internal method to analyze a batch of texts."""
         try:
@@ -234,9 +290,9 @@ class FinBERTInference:
                 inputs = {k: v.to(device) for k, v in inputs.items()}
             
             # Run inference
-            with torch.no_grad():
+            with self.model_manager.inference_context():
                 outputs = model(**inputs)
-                logits = outputs.logits
+                logits = outputs.logits.float()
             
             # Parse results for each text
             results = []
@@ -12,7 +12,9 @@ os.environ.setdefault("USE_TF", "0")
 os.environ.setdefault("USE_FLAX", "0")
 os.environ.setdefault("TRANSFORMERS_NO_ADVISORY_WARNINGS", "1")
 
+import contextlib
 import logging
+import threading
 import time
 import torch
 from typing import Optional, Tuple
@@ -33,6 +35,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_DTYPES = {"fp32": torch.float32, "fp16": torch.float16, "bf16": torch.bfloat16}
+
 
 class FinBERTModel:
     """
@@ -44,6 +48,7 @@ class FinBERTModel:
     _model: Optional[AutoModelForSequenceClassification] = None
     _tokenizer: Optional[AutoTokenizer] = None
     _is_loaded: bool = False
+    _load_lock = threading.Lock()
     
     def __new__(cls):
         """Singleton pattern implementation."""
@@ -106,10 +111,20 @@ class FinBERTModel:
             self.logger.debug("Model already loaded, returning cached instance")
             return self._model, self._tokenizer
         
+        # Concurrent first requests would otherwise each load their own copy
+        # of the weights; the losers wait here and reuse the winner's.
+        with self._load_lock:
+            if self._is_loaded and self._model is not None and self._tokenizer is not None:
+                return self._model, self._tokenizer
+            return self._load()
+    
+    def _load(self) -> Tuple[AutoModelForSequenceClassification, AutoTokenizer]:
+        """Load model and tokenizer; caller holds ``_load_lock``."""
         try:
             self.logger.info("Loading FinBERT model...")
             self.logger.info(f"Model: {self.model_path}")
-            self.logger.info(f"Using dtype: {torch.float32}")
+            dtype = self._resolve_dtype()
+            self.logger.info(f"Using dtype: {dtype}")
             self.logger.info(f"Device: {self.device}")
             self.logger.info(f"CUDA available: {torch.cuda.is_available()}")
             if torch.cuda.is_available():
@@ -154,14 +169,24 @@ class FinBERTModel:
                     f"Model on CPU (torch threads={torch.get_num_threads()})"
                 )
             
+            if dtype != torch.float32:
+                self._model = self._model.to(dtype)
+            
             # Set to evaluation mode
             self._model.eval()
             
+            eager_model = self._model
+            if FINBERT_CONFIG.get("torch_compile", False):
+                self._model = self._compile(eager_model)
+            
             self._is_loaded = True
             self.logger.info("FinBERT model loaded successfully")
             
-            # Warm up the model
-            self._warm_up()
+            # Warm up the model (this is also where torch.compile does its work)
+            if not self._warm_up() and self._model is not eager_model:
+                self.logger.warning("Compiled model failed warm-up; falling back to eager mode")
+                self._model = eager_model
+                self._warm_up()
             
             return self._model, self._tokenizer
             
@@ -170,10 +195,40 @@ class FinBERTModel:
             self.logger.error(f"Error loading FinBERT model: {error_msg}")
             raise RuntimeError(f"Failed to load FinBERT model: {str(e)}")
     
-    def _warm_up(self):
+    def _resolve_dtype(self) -> "torch.dtype":
+        """Weight dtype from FINBERT_DTYPE; fp16 falls back to fp32 on CPU."""
+        name = FINBERT_CONFIG.get("dtype", "fp32")
+        dtype = _DTYPES.get(name)
+        if dtype is None:
+            self.logger.warning(f"Unknown FINBERT_DTYPE '{name}', using fp32")
+            return torch.float32
+        if dtype == torch.float16 and self.device != "cuda":
+            # Half-precision matmuls on CPU are slow or unsupported.
+            self.logger.warning("FINBERT_DTYPE=fp16 needs CUDA; using fp32 on CPU")
+            return torch.float32
+        return dtype
+    
+    def _compile(self, model):
+        """
+        Wrap the model with torch.compile, or return it unchanged if that fails.
+        Sequence length varies per batch, so compile with dynamic shapes to
+        avoid a recompile for every new padded length.
+        """
+        try:
+            compiled = torch.compile(model, dynamic=True)
+            self.logger.info("Model wrapped with torch.compile")
+            return compiled
+        except Exception as e:
+            self.logger.warning(f"torch.compile unavailable, using eager model: {str(e)}")
+            return model
+    
+    def _warm_up(self) -> bool:
         """
         Warm up the model with a dummy inference to initialize CUDA kernels.
         This reduces latency for the first real inference.
+        
+        Returns:
+            True if the dummy inference ran, False if it failed
         """
         try:
             self.logger.info("Warming up model...")
@@ -189,11 +244,32 @@ class FinBERTModel:
                 if self.device == "cuda" and torch.cuda.is_available():
                     inputs = {k: v.to(self.device) for k, v in inputs.items()}
                 
-                with torch.no_grad():
+                with self.inference_context():
                     _ = self._model(**inputs)
                 self.logger.info("Model warm-up completed")
+            return True
         except Exception as e:
             self.logger.warning(f"Model warm-up failed (non-critical): {str(e)}")
+            return False
+    
+    def inference_context(self) -> contextlib.ExitStack:
+        """
+        Context for a forward pass: torch.inference_mode(), plus opt-in autocast on CUDA.
+        
+        inference_mode skips the autograd bookkeeping no_grad still does. With
+        FINBERT_CUDA_AUTOCAST=true the GPU matmuls run in bf16 (fp16 on cards
+        without bf16); weights stay fp32 so the CPU path is unchanged.
+        """
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if (
+            self.device == "cuda"
+            and torch.cuda.is_available()
+            and FINBERT_CONFIG.get("cuda_autocast", False)
+        ):
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            stack.enter_context(torch.autocast(device_type="cuda", dtype=dtype))
+        return stack
     
     def get_model(self) -> Tuple[AutoModelForSequenceClassification, AutoTokenizer]:
         """
@@ -42,6 +42,25 @@ logger = logging.getLogger(__name__)
 # through bare `float(...)` / `int(...)`.
 # ---------------------------------------------------------------------------
 
+# Upper bound on a server-supplied Retry-After, so a bogus header
+# ("inf", a huge number) can't close the gate until the process restarts.
+_MAX_RETRY_AFTER_SECS = 3600.0
+
+
+def _retry_after_secs(error: requests.exceptions.HTTPError) -> Optional[float]:
+    """Seconds from a 429 response's ``Retry-After`` header, if it is numeric (clamped)."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        secs = float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+    if secs != secs:  # NaN
+        return None
+    return min(max(0.0, secs), _MAX_RETRY_AFTER_SECS)
+
+
 def _first_numeric(*candidates: Any, default: float = 0.0) -> float:
     """Return the first candidate that is a real, finite number, else default."""
     for c in candidates:
@@ -95,6 +114,9 @@ class LunarCrushQuotaGate:
         self._minute_tokens = self._rpm
         self._minute_window = self._current_minute()
 
+        # Set from a 429's Retry-After; no call is let through before it.
+        self._blocked_until = 0.0
+
         # Per-day counter, loaded from disk if a state file exists.
         self._day = self._current_day()
         self._day_count = 0
@@ -178,20 +200,28 @@ class LunarCrushQuotaGate:
                 return False
             if self._minute_tokens <= 0:
                 return False
+            if time.time() < self._blocked_until:
+                return False
             self._minute_tokens -= 1
             self._day_count += 1
             self._save_state()
             return True
 
-    def force_minute_drain(self) -> None:
+    def force_minute_drain(self, retry_after: Optional[float] = None) -> None:
         """
         Defense in depth: if the API itself returns 429 despite our
         gate, drop the in-memory minute bucket to 0 so subsequent
         callers in this minute window are denied immediately.
+
+        ``retry_after`` (seconds, from the response header) keeps the
+        gate closed past the minute boundary when the server asks for
+        a longer pause.
         """
         with self._lock:
             self._refresh_windows_locked()
             self._minute_tokens = 0
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.time() + retry_after)
 
     def snapshot(self) -> Dict[str, Any]:
         with self._lock:
@@ -202,6 +232,7 @@ class LunarCrushQuotaGate:
                 "day_budget": self._daily,
                 "minute_tokens": self._minute_tokens,
                 "minute_capacity": self._rpm,
+                "blocked_for_secs": max(0.0, round(self._blocked_until - time.time(), 1)),
             }
 
 
@@ -450,7 +481,7 @@ class LunarCrushService:
                 status = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
                 if status == 429:
                     self._bump("http_429s")
-                    self._gate.force_minute_drain()
+                    self._gate.force_minute_drain(_retry_after_secs(e))
                     self.logger.warning(
                         f"LunarCrush returned 429 for {symbol} despite gate; draining minute bucket"
                     )
@@ -645,7 +676,7 @@ class LunarCrushService:
                 status = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
                 if status == 429:
                     self._bump("http_429s")
-                    self._gate.force_minute_drain()
+                    self._gate.force_minute_drain(_retry_after_secs(e))
                     self.logger.warning("LunarCrush returned 429 on general feed; draining minute bucket")
                 else:
                     self.logger.error(f"HTTPError fetching general crypto news: {e}")
@@ -830,7 +861,7 @@ class LunarCrushService:
                 status = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
                 if status == 429:
                     self._bump("http_429s")
-                    self._gate.force_minute_drain()
+                    self._gate.force_minute_drain(_retry_after_secs(e))
                     self.logger.warning(
                         f"LunarCrush returned 429 for {symbol} despite gate; draining minute bucket"
                     )
@@ -987,7 +1018,7 @@ class LunarCrushService:
                 status = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
                 if status == 429:
                     self._bump("http_429s")
-                    self._gate.force_minute_drain()
+                    self._gate.force_minute_drain(_retry_after_secs(e))
                     self.logger.warning("LunarCrush 429 on bulk coins list; draining minute bucket")
                 else:
                     self.logger.error(f"HTTPError fetching bulk coins list: {e}")
@@ -4,9 +4,11 @@ Analyzes upcoming events that could impact asset prices.
 Detects events by parsing news articles from StockNewsAPI and LunarCrush.
 """
 from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import logging
 import re
+import threading
 
 from .base_engine import BaseEngine
 from src.services.data.stock_news_service import get_stock_news_service
@@ -14,6 +16,35 @@ from src.services.data.lunarcrush_service import get_lunarcrush_service
 from src.services.data.finnhub_service import FinnhubService
 from src.services.macro.fred_service import FredService
 
+# The FRED lookup for a stock doesn't depend on its news/earnings events, so
+# calculate() runs it here while the events are fetched on the calling thread.
+# Separate from FredService's own fetch pool, which these tasks submit to.
+# Created lazily on first use (importing the engine spawns no threads);
+# shutdown_fred_pool() releases it on app shutdown.
+_fred_pool: Optional[ThreadPoolExecutor] = None
+_fred_pool_lock = threading.Lock()
+
+
+def _get_fred_pool() -> ThreadPoolExecutor:
+    """Return the shared FRED lookup pool, creating it on first use."""
+    global _fred_pool
+    pool = _fred_pool
+    if pool is None:
+        with _fred_pool_lock:
+            pool = _fred_pool
+            if pool is None:
+                pool = _fred_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="event-risk-fred")
+    return pool
+
+
+def shutdown_fred_pool(wait: bool = False) -> None:
+    """Shut down the FRED lookup pool; it is recreated lazily if used again."""
+    global _fred_pool
+    with _fred_pool_lock:
+        pool, _fred_pool = _fred_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,15 +123,19 @@ class EventRiskEngine(BaseEngine):
             if not self.validate_inputs(asset_id, asset_type):
                 return self.handle_error(ValueError("Invalid inputs"), "validation")
 
+            # Get economic risk from FRED (for stocks only), overlapped with the event fetch
+            fred_future = None
+            if asset_type == 'stock' and self.fred_service.is_available():
+                fred_future = _get_fred_pool().submit(self._get_economic_risk_from_fred, stored_fred_data)
+
             # Get upcoming events
             if events is None:
                 asset_symbol = kwargs.get('asset_symbol', asset_id)
                 events = self._get_upcoming_events(asset_id, asset_type, days_ahead=30, asset_symbol=asset_symbol)
 
-            # Get economic risk from FRED (for stocks only)
             economic_risk = None
-            if asset_type == 'stock' and self.fred_service.is_available():
-                economic_risk = self._get_economic_risk_from_fred(stored_fred_data)
+            if fred_future is not None:
+                economic_risk = fred_future.result()
                 events.extend(economic_risk.get('events', []))
                 if economic_risk.get('events'):
                     self.logger.info(
@@ -68,6 +68,56 @@ class FundamentalEngine(BaseEngine):
         except Exception as e:
             return self.handle_error(e, f"calculation for {asset_id}")
     
+    def calculate_batch(self, assets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculate fundamental scores for several assets, sharing upstream fetches.
+
+        Each item holds the keyword arguments for ``calculate``. Stocks share
+        one ``fetch_company_fundamentals_batch`` call, and when two or more
+        crypto assets are requested the LunarCrush social-metrics cache is
+        warmed with a single bulk coins-list request first. Anything that
+        can't use the shared fetch goes through ``calculate`` unchanged.
+
+        Returns:
+            One result dict per asset, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(assets)
+
+        stocks: Dict[int, str] = {}
+        crypto_count = 0
+        for i, asset in enumerate(assets):
+            asset_type = asset.get('asset_type')
+            if asset_type == 'crypto':
+                crypto_count += 1
+            elif asset_type == 'stock' and self.validate_inputs(asset.get('asset_id'), asset_type):
+                symbol = (asset.get('asset_symbol') or asset.get('asset_id') or '').upper()
+                if symbol:
+                    stocks[i] = symbol
+
+        if stocks and self.finnhub_service.api_key:
+            symbols = list(dict.fromkeys(stocks.values()))
+            try:
+                batch = self.finnhub_service.fetch_company_fundamentals_batch(symbols)
+            except Exception as e:
+                self.logger.warning(f"Batch fundamentals fetch failed, falling back per asset: {e}")
+            else:
+                for i, symbol in stocks.items():
+                    try:
+                        results[i] = self._score_stock_fundamentals(symbol, batch)
+                    except Exception as e:
+                        results[i] = self.handle_error(e, f"calculation for {assets[i].get('asset_id')}")
+
+        if crypto_count >= 2:
+            try:
+                self.lunarcrush_service.fetch_coins_list_bulk()
+            except Exception as e:
+                self.logger.warning(f"Bulk LunarCrush warm-up failed: {e}")
+
+        for i, asset in enumerate(assets):
+            if results[i] is None:
+                results[i] = self.calculate(**asset)
+        return results
+
     def _calculate_crypto_fundamental(
         self,
         asset_id: str,
@@ -284,6 +334,10 @@ class FundamentalEngine(BaseEngine):
         except Exception as e:
             return self.handle_error(e, f"finnhub fundamentals fetch for {asset_symbol}")
 
+        return self._score_stock_fundamentals(asset_symbol, batch)
+
+    def _score_stock_fundamentals(self, asset_symbol: str, batch: Any) -> Dict[str, Any]:
+        """Score ``asset_symbol`` from a ``fetch_company_fundamentals_batch`` result."""
         if not isinstance(batch, dict):
             return self.handle_no_data(
                 "Finnhub service returned non-dict response",
@@ -571,6 +571,43 @@ class SentimentEngine(BaseEngine):
             'source': source
         }
     
+    def analyze_text_batch(
+        self,
+        texts: List[str],
+        sources: Optional[List[Optional[str]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of several texts in one batched FinBERT pass.
+        Batched counterpart of ``analyze_text``; results keep input order.
+        
+        Args:
+            texts: Texts to analyze
+            sources: Optional source identifier per text
+        
+        Returns:
+            List of results shaped like ``analyze_text`` output
+        """
+        sources = sources if sources is not None else [None] * len(texts)
+        if not self._ensure_inference_initialized():
+            return [{
+                'sentiment': 'neutral',
+                'score': 0.0,
+                'confidence': 0.0,
+                'error': True,
+                'error_message': 'FinBERT inference not available'
+            } for _ in texts]
+        
+        batch_results = self.finbert_inference.analyze_batch(texts)
+        return [
+            {
+                'sentiment': result['sentiment'],
+                'score': result.get('score', 0.0),
+                'confidence': result['confidence'],
+                'source': source
+            }
+            for result, source in zip(batch_results, sources)
+        ]
+    
     def _detect_news_type(self, text_data: List[Dict[str, Any]]) -> str:
         """
         Detect news type from text data sources.
@@ -3,11 +3,16 @@ FRED API Service
 Fetches economic indicators from Federal Reserve Economic Data (FRED) API.
 Returns numeric time series data (dates + values).
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 import pandas as pd
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import FRED_CACHE_TTL_SECS
 
 try:
     from fredapi import Fred
@@ -18,6 +23,57 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of latest values. FredService is built per EventRiskEngine
+# (so per request), which made an instance-level cache useless.
+_latest_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+_latest_cache_lock = threading.Lock()
+
+# fredapi is blocking, so independent series are fetched on this pool. Tasks
+# submitted here must not submit to it themselves (a waiting parent could
+# starve its own children). Created lazily on first use; shutdown_fetch_pool()
+# releases it on app shutdown.
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+_fetch_pool_lock = threading.Lock()
+
+
+def _get_fetch_pool() -> ThreadPoolExecutor:
+    """Return the shared FRED fetch pool, creating it on first use."""
+    global _fetch_pool
+    pool = _fetch_pool
+    if pool is None:
+        with _fetch_pool_lock:
+            pool = _fetch_pool
+            if pool is None:
+                pool = _fetch_pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="fred-fetch")
+    return pool
+
+
+def shutdown_fetch_pool(wait: bool = False) -> None:
+    """Shut down the FRED fetch pool; it is recreated lazily if used again."""
+    global _fetch_pool
+    with _fetch_pool_lock:
+        pool, _fetch_pool = _fetch_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def _cached_latest(key: str, fetch: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """Return a fresh cached result for ``key`` or call ``fetch`` and cache it.
+
+    Misses (None) aren't cached so a transient FRED error is retried next call.
+    """
+    with _latest_cache_lock:
+        entry = _latest_cache.get(key)
+    if entry is not None and time.time() - entry[1] < FRED_CACHE_TTL_SECS:
+        return dict(entry[0])
+
+    result = fetch()
+    if result is not None:
+        with _latest_cache_lock:
+            _latest_cache[key] = (result, time.time())
+        return dict(result)
+    return None
+
 
 class FredService:
     """
@@ -110,6 +166,10 @@ class FredService:
             logger.error("FRED service not available")
             return None
         
+        return _cached_latest(series_id, lambda: self._fetch_latest_value(series_id))
+    
+    def _fetch_latest_value(self, series_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch the most recent value for ``series_id`` from FRED (uncached)."""
         try:
             # Get latest data point - fetch recent data (last 1 year) and get latest
             end_date = datetime.now().strftime('%Y-%m-%d')
@@ -143,6 +203,58 @@ class FredService:
             logger.error(f"Error getting latest value for {series_id}: {str(e)}")
             return None
     
+    def get_previous_value(self, series_id: str, days: int = 365) -> Optional[Dict[str, Any]]:
+        """
+        Get the observation just before the latest one for an indicator.
+        
+        Fetches the last ``days`` of observations and returns the second-to-last
+        one. Results are cached per (series_id, days) like get_latest_value.
+        The detect_* methods don't call this; they still take the previous
+        value from their caller.
+
+        Args:
+            series_id: FRED series ID
+            days: How far back to look for the previous observation
+        
+        Returns:
+            Dictionary with value, date, and series_id (same shape as
+            get_latest_value), or None if the window has fewer than two points
+        """
+        if not self.is_available():
+            logger.error("FRED service not available")
+            return None
+        
+        return _cached_latest(
+            f"{series_id}:previous:{days}",
+            lambda: self._fetch_previous_value(series_id, days)
+        )
+    
+    def _fetch_previous_value(self, series_id: str, days: int) -> Optional[Dict[str, Any]]:
+        """Fetch the second-to-last observation in the window (uncached)."""
+        try:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+            start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            data = self.fred.get_series(series_id, start=start_date, end=end_date).dropna()
+            
+            if len(data) < 2:
+                logger.warning(f"No previous observation for {series_id} in the last {days} days")
+                return None
+            
+            previous_date = data.index[-2]
+            if isinstance(previous_date, pd.Timestamp):
+                date_str = previous_date.strftime('%Y-%m-%d')
+            else:
+                date_str = str(previous_date)
+            
+            return {
+                'value': float(data.iloc[-2]),
+                'date': date_str,
+                'series_id': series_id
+            }
+        except Exception as e:
+            logger.error(f"Error getting previous value for {series_id}: {str(e)}")
+            return None
+    
     def calculate_yield_curve(self) -> Optional[Dict[str, Any]]:
         """
         Calculate 10Y-2Y Treasury spread (yield curve).
@@ -161,6 +273,11 @@ class FredService:
             logger.error("FRED service not available")
             return None
         
+        # Series ids are upper-case, so this key can't collide with one.
+        return _cached_latest('yield_curve', self._fetch_yield_curve)
+    
+    def _fetch_yield_curve(self) -> Optional[Dict[str, Any]]:
+        """Fetch DGS10/DGS2 from FRED and compute the spread (uncached)."""
         try:
             # Fetch both series - get recent data
             end_date = datetime.now().strftime('%Y-%m-%d')
@@ -238,13 +355,15 @@ class FredService:
                 'gdp': {'value': 28000.0, 'date': '2024-12-01', 'series_id': 'GDP'}
             }
         """
-        indicators = {
-            'cpi': self.get_latest_value('CPIAUCSL'),
-            'fedfunds': self.get_latest_value('FEDFUNDS'),
-            'yield_curve': self.calculate_yield_curve(),
-            'nfp': self.get_latest_value('PAYEMS'),
-            'gdp': self.get_latest_value('GDP')
+        pool = _get_fetch_pool()
+        futures = {
+            'cpi': pool.submit(self.get_latest_value, 'CPIAUCSL'),
+            'fedfunds': pool.submit(self.get_latest_value, 'FEDFUNDS'),
+            'yield_curve': pool.submit(self.calculate_yield_curve),
+            'nfp': pool.submit(self.get_latest_value, 'PAYEMS'),
+            'gdp': pool.submit(self.get_latest_value, 'GDP')
         }
+        indicators = {name: future.result() for name, future in futures.items()}
         
         logger.info(f"Fetched {sum(1 for v in indicators.values() if v is not None)} primary indicators")
         return indicators
@@ -483,6 +602,17 @@ class FredService:
         components = {}
         
         try:
+            # The three checks below each hit FRED for a different series.
+            # Fetch them concurrently up front; the detect_* calls and the
+            # yield-curve check then read the results from the cache.
+            pool = _get_fetch_pool()
+            for future in [
+                pool.submit(self.get_latest_value, 'FEDFUNDS'),
+                pool.submit(self.get_latest_value, 'CPIAUCSL'),
+                pool.submit(self.calculate_yield_curve),
+            ]:
+                future.result()
+            
             # 1. Detect Fed rate changes
             previous_fed = stored_data.get('fedfunds', {}) if stored_data else {}
             rate_change = self.detect_fed_rate_change(
@@ -5,6 +5,7 @@ Loads keywords from JSON file with fallback to hardcoded dictionary.
 """
 import re
 import json
+import functools
 import logging
 import os
 from pathlib import Path
@@ -12,6 +13,18 @@ from typing import Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=None)
+def _word_pattern(keyword: str) -> re.Pattern:
+    """Compiled word-boundary pattern for a single-word keyword."""
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
+
 
 class CryptoKeywordAnalyzer:
     """
@@ -47,8 +60,8 @@ class CryptoKeywordAnalyzer:
             )
         
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # The analyzer is built per SentimentEngine, so this runs per request.
+            data = _json_loads(json_path.read_bytes())
             
             # Flatten the nested structure
             positive = {}
@@ -76,7 +89,7 @@ class CryptoKeywordAnalyzer:
             
             return positive, negative, neutral
             
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             raise ValueError(f"Invalid JSON format in crypto_keywords.json: {str(e)}")
         except Exception as e:
             raise RuntimeError(f"Failed to load keywords from JSON: {str(e)}")
@@ -186,11 +199,15 @@ class CryptoKeywordAnalyzer:
         Returns:
             True if keyword found, False otherwise
         """
+        # Plain substring test first: most keywords are absent from any given
+        # text, and `in` rejects them without running a regex.
+        if keyword not in text:
+            return False
+        
         # For multi-word keywords, use exact phrase matching
         if ' ' in keyword:
-            return keyword in text
+            return True
         
         # For single-word keywords, use word boundary matching
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        return bool(re.search(pattern, text))
+        return bool(_word_pattern(keyword).search(text))
 
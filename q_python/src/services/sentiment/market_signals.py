@@ -3,8 +3,11 @@ Market Signal Analyzer
 Analyzes market data (price momentum, volume, social metrics) for sentiment confirmation.
 Fetches OHLCV data from NestJS backend API.
 """
+import json
 import logging
-import requests
+import threading
+import httpx
+import numpy as np
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -13,6 +16,56 @@ import os
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # stdlib json also accepts bytes, so callers can pass response.content either way
+    _json_loads = json.loads
+
+
+def _as_number(value: Any) -> float:
+    """``float(value)``, or 0.0 when it is missing, non-numeric or NaN.
+
+    Candle and LunarCrush fields can be null or strings; a bad value zeroes
+    only the field it sits in, not the whole analysis.
+    """
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return number if number == number else 0.0
+
+
+# Pooled HTTP/2 client for NestJS candle fetches. Analyzers are created per
+# SentimentEngine (i.e. per signal request), so the client is process-wide:
+# every analyzer shares one connection pool instead of opening its own.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_nestjs_client() -> httpx.Client:
+    """Return the process-wide NestJS HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                    timeout=NESTJS_API_TIMEOUT,
+                )
+    return _client
+
+
+def close_nestjs_client() -> None:
+    """Close the shared NestJS client; it is recreated lazily if used again."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
 
 class MarketSignalAnalyzer:
     """
@@ -90,8 +143,10 @@ class MarketSignalAnalyzer:
             # Clamp to [-1.0, 1.0]
             final_score = max(-1.0, min(1.0, final_score))
             
-            # Calculate confidence based on data availability
-            confidence = self._calculate_confidence(ohlcv_data, social_metrics)
+            # Confidence based on data availability (both: 0.8, one: 0.5, none: 0.2)
+            has_ohlcv = bool(ohlcv_data)
+            has_social = bool(social_metrics)
+            confidence = 0.8 if (has_ohlcv and has_social) else 0.5 if (has_ohlcv or has_social) else 0.2
             
             return {
                 'score': final_score,
@@ -100,8 +155,8 @@ class MarketSignalAnalyzer:
                     'momentum': momentum_score,
                     'volume': volume_score,
                     'social': social_score,
-                    'ohlcv_available': ohlcv_data is not None and len(ohlcv_data) > 0,
-                    'social_available': bool(social_metrics)
+                    'ohlcv_available': has_ohlcv,
+                    'social_available': has_social
                 }
             }
             
@@ -161,12 +216,12 @@ class MarketSignalAnalyzer:
             }
             
             self.logger.info(f"Fetching OHLCV data for {symbol} from NestJS API...")
-            response = requests.get(url, params=params, timeout=self.api_timeout)
+            response = _get_nestjs_client().get(url, params=params, timeout=self.api_timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             
-            if data.get('success') and data.get('data'):
+            if isinstance(data, dict) and data.get('success') and data.get('data'):
                 candles = data['data']
                 self.logger.info(f"Fetched {len(candles)} candles for {symbol}")
                 return candles
@@ -174,11 +229,11 @@ class MarketSignalAnalyzer:
                 self.logger.warning(f"No OHLCV data returned for {symbol}")
                 return None
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.warning(f"Failed to fetch OHLCV data from NestJS API: {str(e)}")
             return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error fetching OHLCV data: {str(e)}")
+        except ValueError as e:
+            self.logger.error(f"Invalid OHLCV payload from NestJS API: {str(e)}")
             return None
     
     def _analyze_price_momentum(self, ohlcv_data: Optional[list]) -> float:
@@ -194,38 +249,30 @@ class MarketSignalAnalyzer:
         if not ohlcv_data or len(ohlcv_data) < 4:
             return 0.0
         
-        try:
-            # Get latest candles
-            candles = sorted(ohlcv_data, key=lambda x: x.get('openTime', 0))
-            
-            if len(candles) < 4:
-                return 0.0
-            
-            # Current price (latest close)
-            current_price = candles[-1].get('close', 0)
-            
-            # Price 1 hour ago
-            price_1h_ago = candles[-2].get('close', 0) if len(candles) >= 2 else current_price
-            
-            # Price 4 hours ago
-            price_4h_ago = candles[-5].get('close', 0) if len(candles) >= 5 else current_price
-            
-            if current_price == 0 or price_1h_ago == 0:
-                return 0.0
-            
-            # Calculate percentage changes
-            change_1h = ((current_price - price_1h_ago) / price_1h_ago) * 100 if price_1h_ago > 0 else 0.0
-            change_4h = ((current_price - price_4h_ago) / price_4h_ago) * 100 if price_4h_ago > 0 else 0.0
-            
-            # Weighted momentum: 1h (60%) + 4h (40%)
-            momentum = (0.6 * change_1h + 0.4 * change_4h) / 10.0  # Normalize to [-1, 1] range
-            
-            # Clamp to [-1.0, 1.0]
-            return max(-1.0, min(1.0, momentum))
-            
-        except Exception as e:
-            self.logger.error(f"Error analyzing price momentum: {str(e)}")
+        # Get latest candles
+        candles = sorted(ohlcv_data, key=lambda x: x.get('openTime') or 0)
+        
+        # Current price (latest close)
+        current_price = _as_number(candles[-1].get('close'))
+        
+        # Price 1 hour ago
+        price_1h_ago = _as_number(candles[-2].get('close'))
+        
+        # Price 4 hours ago
+        price_4h_ago = _as_number(candles[-5].get('close')) if len(candles) >= 5 else current_price
+        
+        if current_price <= 0 or price_1h_ago <= 0:
             return 0.0
+        
+        # Calculate percentage changes
+        change_1h = ((current_price - price_1h_ago) / price_1h_ago) * 100
+        change_4h = ((current_price - price_4h_ago) / price_4h_ago) * 100 if price_4h_ago > 0 else 0.0
+        
+        # Weighted momentum: 1h (60%) + 4h (40%)
+        momentum = (0.6 * change_1h + 0.4 * change_4h) / 10.0  # Normalize to [-1, 1] range
+        
+        # Clamp to [-1.0, 1.0]
+        return max(-1.0, min(1.0, momentum))
     
     def _analyze_volume(self, ohlcv_data: Optional[list], social_metrics: Dict[str, Any]) -> float:
         """
@@ -239,34 +286,33 @@ class MarketSignalAnalyzer:
             Volume score in range [-1.0, 1.0]
         """
         # Use LunarCrush volume_24h if available
-        volume_24h = social_metrics.get('volume_24h', 0)
+        volume_24h = _as_number(social_metrics.get('volume_24h'))
         
         if volume_24h > 0 and ohlcv_data:
-            try:
-                # Calculate average volume from OHLCV
-                volumes = [c.get('volume', 0) for c in ohlcv_data if c.get('volume', 0) > 0]
-                if volumes:
-                    avg_volume = sum(volumes) / len(volumes)
-                    current_volume = volumes[-1] if volumes else 0
-                    
-                    if avg_volume > 0:
-                        # Volume spike ratio
-                        volume_ratio = current_volume / avg_volume
-                        
-                        # Normalize: 1.0 = normal, >1.5 = spike (positive), <0.7 = low (negative)
-                        if volume_ratio >= 1.5:
-                            score = min(1.0, (volume_ratio - 1.5) / 1.0)  # 1.5-2.5 maps to 0-1.0
-                        elif volume_ratio <= 0.7:
-                            score = max(-1.0, (volume_ratio - 0.7) / 0.7)  # 0-0.7 maps to -1.0-0
-                        else:
-                            score = 0.0  # Normal volume
-                        
-                        return max(-1.0, min(1.0, score))
-            except Exception as e:
-                self.logger.error(f"Error analyzing volume: {str(e)}")
+            # Calculate average volume from OHLCV
+            volumes = np.fromiter(
+                (_as_number(c.get('volume')) for c in ohlcv_data), dtype=np.float64, count=len(ohlcv_data)
+            )
+            volumes = volumes[volumes > 0]
+            if volumes.size:
+                avg_volume = float(volumes.mean())
+                current_volume = float(volumes[-1])
+                
+                # Volume spike ratio
+                volume_ratio = current_volume / avg_volume
+                
+                # Normalize: 1.0 = normal, >1.5 = spike (positive), <0.7 = low (negative)
+                if volume_ratio >= 1.5:
+                    score = min(1.0, (volume_ratio - 1.5) / 1.0)  # 1.5-2.5 maps to 0-1.0
+                elif volume_ratio <= 0.7:
+                    score = max(-1.0, (volume_ratio - 0.7) / 0.7)  # 0-0.7 maps to -1.0-0
+                else:
+                    score = 0.0  # Normal volume
+                
+                return max(-1.0, min(1.0, score))
         
         # Fallback: use LunarCrush price_change_24h as proxy
-        price_change = social_metrics.get('price_change_24h', 0)
+        price_change = _as_number(social_metrics.get('price_change_24h'))
         if price_change != 0:
             # Normalize price change to [-1, 1] (assuming ±10% is significant)
             return max(-1.0, min(1.0, price_change / 10.0))
@@ -286,41 +332,8 @@ class MarketSignalAnalyzer:
         if not social_metrics:
             return 0.0
         
-        try:
-            # Use price_change_24h as primary signal
-            price_change = social_metrics.get('price_change_24h', 0)
-            
-            # Normalize to [-1, 1] (assuming ±10% is significant)
-            score = max(-1.0, min(1.0, price_change / 10.0))
-            
-            return score
-            
-        except Exception as e:
-            self.logger.error(f"Error analyzing social metrics: {str(e)}")
-            return 0.0
-    
-    def _calculate_confidence(
-        self,
-        ohlcv_data: Optional[list],
-        social_metrics: Dict[str, Any]
-    ) -> float:
-        """
-        Calculate confidence based on data availability.
-        
-        Args:
-            ohlcv_data: OHLCV data
-            social_metrics: Social metrics
-        
-        Returns:
-            Confidence in range [0.0, 1.0]
-        """
-        has_ohlcv = ohlcv_data is not None and len(ohlcv_data) > 0
-        has_social = bool(social_metrics)
+        # Use price_change_24h as primary signal
+        price_change = _as_number(social_metrics.get('price_change_24h'))
         
-        if has_ohlcv and has_social:
-            return 0.8
-        elif has_ohlcv or has_social:
-            return 0.5
-        else:
-            return 0.2
-
+        # Normalize to [-1, 1] (assuming ±10% is significant)
+        return max(-1.0, min(1.0, price_change / 10.0))
@@ -2,11 +2,131 @@
 Custom Strategy Parser
 Parses entry/exit rules from JSON and converts them to executable format.
 """
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional
+import json
 import logging
+import re
+import threading
+
+import numpy as np
+
+from .strategy_executor import _OPS
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _canonical_json(data: Any) -> bytes:
+        """Serialize with sorted keys (orjson: C-level, returns bytes)."""
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+except ImportError:
+    def _canonical_json(data: Any) -> str:
+        """Serialize with sorted keys (stdlib fallback)."""
+        return json.dumps(data, sort_keys=True, default=str)
+
+
+# --- Parsed-strategy cache ----------------------------------------------------
+# A strategy's rules rarely change between ticks, but parse() re-validates and
+# rebuilds every rule on every signal. Parsers are created per request (via
+# SignalGenerator), so the LRU lives at module level and is shared by all of
+# them. Keyed by (strategy_id, hash of the canonical JSON of strategy_data) so
+# an edited strategy misses the cache immediately.
+_PARSE_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+_PARSE_CACHE_SIZE = 256
+
+# Compiled form of the same strategies (rule closures from
+# StrategyExecutor.compile_strategy), under the same keys and lock, so a
+# strategy's rules are compiled once rather than on every signal.
+_COMPILED_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+
+# Marks a key that is absent from a rule (distinct from an explicit None)
+_MISSING = object()
+
+# Engines whose output strategy rules can reference, and fusion-result fields
+# that field rules may read without depending on any single engine
+_ENGINE_NAMES = ('sentiment', 'trend', 'fundamental', 'liquidity', 'event_risk')
+_FUSION_FIELDS = frozenset({'final_score', 'score', 'confidence', 'action'})
+
+# Indicator-only rule lists at least this long also get a vectorized form
+# (parallel numpy arrays) so the executor compares them in one pass. Shorter
+# lists stay on the per-rule path, where numpy's setup cost would dominate.
+_VECTORIZE_MIN_RULES = 8
+
+# Finite decimal literal as accepted by float(), e.g. '30', '-0.3', '.5', '1e-3'
+_NUMERIC_RE = re.compile(r'^\s*[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?\s*$')
+
+
+@lru_cache(maxsize=1024)
+def _validate_rule_signature(operator: Any, value: Any, indicator: Any, field: Any) -> bool:
+    """
+    Validate a rule from its (operator, value, indicator, field) signature.
+    
+    The same rules are validated repeatedly (validate_syntax, then parse on
+    every signal), so results are memoized. Checks run cheapest-first and stop
+    at the first failure.
+    """
+    # Must have operator and value
+    if operator is _MISSING or value is _MISSING:
+        return False
+    
+    # Validate operator
+    if operator not in CustomStrategyParser.valid_operators:
+        return False
+    
+    # Must have either 'indicator' (for indicator-based rules) or 'field' (for field-based rules)
+    if indicator is _MISSING and field is _MISSING:
+        return False
+    
+    # If it's an indicator-based rule, validate the indicator
+    if indicator is not _MISSING and indicator not in CustomStrategyParser.valid_indicators:
+        return False
+    
+    # If it's a field-based rule, validate the field path
+    # Allow fields like 'final_score', 'metadata.engine_details.event_risk.score', etc.
+    if field is not _MISSING and not (isinstance(field, str) and field):
+        return False
+    
+    # Validate value (must be numeric). Type/regex checks only; the actual
+    # float() coercion happens once in _parse_rules.
+    return isinstance(value, (int, float)) or (isinstance(value, str) and _NUMERIC_RE.match(value) is not None)
+
+
+def _as_list(value: Any) -> Any:
+    """Return ``value`` if it is a list, else an empty tuple."""
+    return value if isinstance(value, list) else ()
+
+
+def _vectorize_rules(rules: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Build the vectorized form of parsed rules, or None to use the rule dicts.
+    
+    Only homogeneous indicator rule lists are vectorized: field rules resolve
+    dotted paths one at a time anyway. Arrays are read-only because parsed
+    strategies are shared through the parse cache.
+    """
+    if len(rules) < _VECTORIZE_MIN_RULES or not all('indicator' in rule for rule in rules):
+        return None
+    
+    opcodes = np.fromiter((_OPS[rule['operator']] for rule in rules), dtype=np.int8, count=len(rules))
+    values = np.fromiter((rule['value'] for rule in rules), dtype=np.float64, count=len(rules))
+    opcodes.setflags(write=False)
+    values.setflags(write=False)
+    return {
+        'indicators': tuple(rule['indicator'] for rule in rules),
+        'opcodes': opcodes,
+        'values': values,
+    }
+
+
+def _strategy_cache_key(strategy_id: Optional[str], strategy_data: Dict[str, Any]) -> tuple:
+    """Build a stable cache key for a strategy payload."""
+    return (strategy_id, hash(_canonical_json(strategy_data)))
+
 
 class CustomStrategyParser:
     """
@@ -14,35 +134,100 @@ class CustomStrategyParser:
     Converts JSON strategy rules into executable format.
     """
     
-    def __init__(self):
-        self.valid_indicators = [
-            'MA20', 'MA50', 'MA200', 'RSI', 'MACD', 'ATR',
-            'BB', 'STOCH', 'ADX', 'CCI', 'OBV', 'VOLUME'
-        ]
-        self.valid_operators = [
-            '>', '<', '>=', '<=', '==', '!=',
-            'cross_above', 'cross_below'
-        ]
+    # Static vocabularies, built once per process and checked with O(1) membership
+    valid_indicators = frozenset({
+        'MA20', 'MA50', 'MA200', 'RSI', 'MACD', 'ATR',
+        'BB', 'STOCH', 'ADX', 'CCI', 'OBV', 'VOLUME'
+    })
+    valid_operators = frozenset({
+        '>', '<', '>=', '<=', '==', '!=',
+        'cross_above', 'cross_below'
+    })
     
-    def parse(self, strategy_data: Dict[str, Any]) -> Dict[str, Any]:
+    def parse(self, strategy_data: Dict[str, Any], strategy_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Parse strategy rules from JSON format.
         
+        Results are memoized in a bounded LRU shared across parser instances;
+        repeated calls with the same payload return a shallow copy of the
+        cached result.
+        
         Args:
             strategy_data: Strategy data with entry_rules, exit_rules, indicators
+            strategy_id: Optional strategy identifier, used to scope the cache key
         
         Returns:
             Parsed strategy in executable format
         """
+        return dict(self._parse_cached(_strategy_cache_key(strategy_id, strategy_data), strategy_data))
+    
+    def parse_compiled(
+        self,
+        strategy_data: Dict[str, Any],
+        compile_strategy: Callable[[Dict[str, Any]], Dict[str, Any]],
+        strategy_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse strategy rules and compile them with ``compile_strategy``.
+        
+        The compiled strategy is cached next to the parsed one, under the same
+        key, so its rule closures are built once per strategy rather than once
+        per signal.
+        
+        Args:
+            strategy_data: Strategy data with entry_rules, exit_rules, indicators
+            compile_strategy: Compiler for a parsed strategy
+                (StrategyExecutor.compile_strategy)
+            strategy_id: Optional strategy identifier, used to scope the cache key
+        
+        Returns:
+            Shallow copy of the cached compiled strategy
+        """
+        key = _strategy_cache_key(strategy_id, strategy_data)
+        with _PARSE_CACHE_LOCK:
+            cached = _COMPILED_CACHE.get(key)
+            if cached is not None:
+                _COMPILED_CACHE.move_to_end(key)
+                return dict(cached)
+        
+        compiled = compile_strategy(self._parse_cached(key, strategy_data))
+        
+        with _PARSE_CACHE_LOCK:
+            _COMPILED_CACHE[key] = compiled
+            if len(_COMPILED_CACHE) > _PARSE_CACHE_SIZE:
+                _COMPILED_CACHE.popitem(last=False)
+        return dict(compiled)
+    
+    def _parse_cached(self, key: tuple, strategy_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the cached parse for ``key`` (shared: callers must copy it)."""
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(key)
+                return cached
+        
+        parsed = self._parse_uncached(strategy_data)
+        
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = parsed
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        return parsed
+    
+    def _parse_uncached(self, strategy_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse strategy rules without consulting the cache."""
         try:
             # Handle None values - convert to empty lists if None
             entry_rules = strategy_data.get('entry_rules') or []
             exit_rules = strategy_data.get('exit_rules') or []
             indicators = strategy_data.get('indicators') or []
             
+            parsed_entry_rules = self._parse_rules(entry_rules if isinstance(entry_rules, list) else [])
+            parsed_exit_rules = self._parse_rules(exit_rules if isinstance(exit_rules, list) else [])
+            
             parsed = {
-                'entry_rules': self._parse_rules(entry_rules if isinstance(entry_rules, list) else []),
-                'exit_rules': self._parse_rules(exit_rules if isinstance(exit_rules, list) else []),
+                'entry_rules': parsed_entry_rules,
+                'exit_rules': parsed_exit_rules,
                 'indicators': self._parse_indicators(indicators if isinstance(indicators, list) else []),
                 'timeframe': strategy_data.get('timeframe'),
                 'stop_loss': {
@@ -52,7 +237,13 @@ class CustomStrategyParser:
                 'take_profit': {
                     'type': strategy_data.get('take_profit_type'),
                     'value': strategy_data.get('take_profit_value')
-                }
+                },
+                'required_indicators': self.extract_indicator_requirements(strategy_data),
+                # Executor-only; not part of the JSON-facing parse result
+                '_vectorized': {
+                    'entry_rules': _vectorize_rules(parsed_entry_rules),
+                    'exit_rules': _vectorize_rules(parsed_exit_rules),
+                },
             }
             
             return parsed
@@ -134,40 +325,16 @@ class CustomStrategyParser:
         if not isinstance(rule, dict):
             return False
         
-        # Must have operator and value
-        if 'operator' not in rule or 'value' not in rule:
-            return False
-        
-        # Must have either 'indicator' (for indicator-based rules) or 'field' (for field-based rules)
-        has_indicator = 'indicator' in rule
-        has_field = 'field' in rule
-        
-        if not (has_indicator or has_field):
-            return False
-        
-        # If it's an indicator-based rule, validate the indicator
-        if has_indicator:
-            if rule['indicator'] not in self.valid_indicators:
-                return False
-        
-        # If it's a field-based rule, validate the field path
-        if has_field:
-            # Allow fields like 'final_score', 'metadata.engine_details.event_risk.score', etc.
-            field = rule['field']
-            if not isinstance(field, str) or len(field) == 0:
-                return False
-        
-        # Validate operator
-        if rule['operator'] not in self.valid_operators:
-            return False
-        
-        # Validate value (must be numeric)
         try:
-            float(rule['value'])
-        except (ValueError, TypeError):
+            return _validate_rule_signature(
+                rule.get('operator', _MISSING),
+                rule.get('value', _MISSING),
+                rule.get('indicator', _MISSING),
+                rule.get('field', _MISSING),
+            )
+        except TypeError:
+            # Unhashable component (e.g. a list value) - never a valid rule
             return False
-        
-        return True
     
     def _validate_indicator(self, indicator: Dict[str, Any]) -> bool:
         """Validate an indicator configuration."""
@@ -192,30 +359,60 @@ class CustomStrategyParser:
         Returns:
             List of required indicator names
         """
-        indicators = set()
+        # One pass over entry + exit rules, then the indicator configs.
+        # None / non-list sections are treated as empty.
+        indicators = {
+            rule['indicator']
+            for key in ('entry_rules', 'exit_rules')
+            for rule in _as_list(strategy_data.get(key))
+            if isinstance(rule, dict) and 'indicator' in rule
+        }
+        indicators.update(
+            indicator['name']
+            for indicator in _as_list(strategy_data.get('indicators'))
+            if isinstance(indicator, dict) and 'name' in indicator
+        )
         
-        # From entry rules (handle None)
-        entry_rules = strategy_data.get('entry_rules') or []
-        if isinstance(entry_rules, list):
-            for rule in entry_rules:
-                if isinstance(rule, dict) and 'indicator' in rule:
-                    indicators.add(rule['indicator'])
+        return list(indicators)
+    
+    def required_engines(self, parsed_strategy: Dict[str, Any]) -> frozenset:
+        """
+        Determine which engines a parsed strategy's rules read directly.
         
-        # From exit rules (handle None)
-        exit_rules = strategy_data.get('exit_rules') or []
-        if isinstance(exit_rules, list):
-            for rule in exit_rules:
-                if isinstance(rule, dict) and 'indicator' in rule:
-                    indicators.add(rule['indicator'])
+        Indicator rules and indicator configs need the trend engine (it
+        computes MA/RSI/MACD/ATR). Field rules need the engine named in their
+        path (``metadata.engine_details.<engine>.*`` or ``<engine>.*``).
+        A field path that can't be attributed to one engine could resolve
+        against any engine's output, so it conservatively requires all.
         
-        # From indicator configs (handle None)
-        indicator_configs = strategy_data.get('indicators') or []
-        if isinstance(indicator_configs, list):
-            for indicator in indicator_configs:
-                if isinstance(indicator, dict) and 'name' in indicator:
-                    indicators.add(indicator['name'])
+        Args:
+            parsed_strategy: Output of :meth:`parse`
         
-        return list(indicators)
+        Returns:
+            Frozenset of engine names (e.g. ``{'trend', 'liquidity'}``)
+        """
+        required = set()
+        if parsed_strategy.get('indicators'):
+            required.add('trend')
+        
+        for key in ('entry_rules', 'exit_rules'):
+            for rule in parsed_strategy.get(key) or ():
+                if 'indicator' in rule:
+                    required.add('trend')
+                    continue
+                field = rule.get('field')
+                if field is None or field in _FUSION_FIELDS:
+                    continue
+                parts = field.split('.')
+                if len(parts) >= 3 and parts[0] == 'metadata' and parts[1] == 'engine_details' \
+                        and parts[2] in _ENGINE_NAMES:
+                    required.add(parts[2])
+                elif parts[0] in _ENGINE_NAMES:
+                    required.add(parts[0])
+                else:
+                    return frozenset(_ENGINE_NAMES)
+        
+        return frozenset(required)
     
     def validate_syntax(self, strategy_data: Dict[str, Any]) -> Dict[str, Any]:
         """
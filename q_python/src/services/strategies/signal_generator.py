@@ -7,17 +7,20 @@ import logging
 import os
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property
 
 from ..engines.technical_engine import TechnicalEngine
 from ..engines.fundamental_engine import FundamentalEngine
 from ..engines.liquidity_engine import LiquidityEngine
 from ..engines.event_risk_engine import EventRiskEngine
 from ..engines.sentiment_engine import SentimentEngine
-from ..engines.fusion_engine import FusionEngine
+from ..engines.fusion_engine import FusionEngine, _normalize_weights
 from ..engines.confidence_engine import ConfidenceEngine
 from ..engines.options_engine import OptionsEngine
 from .custom_strategy_parser import CustomStrategyParser
-from .strategy_executor import StrategyExecutor
+from .strategy_executor import StrategyExecutor, Indicators
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +63,86 @@ def _cached_engine(cacheable: bool, key: str, compute):
     return result
 
 
+# --- Shared thread pools -------------------------------------------------------
+# engine:       Trend, fundamental, event-risk and sentiment have no data
+#               dependencies on each other (only fusion consumes their combined
+#               output) and are mostly I/O-bound: candle fetches, CoinGecko /
+#               LunarCrush / news APIs, FinBERT. Running them concurrently makes
+#               a signal cost max(engine) instead of sum(engine).
+# signal_batch: Asset-level concurrency for generate_signals_batch. Kept
+#               separate from the engine pool: batch workers block on engine
+#               futures, so sharing one pool could starve it. Small by default —
+#               each in-flight asset holds its engine state.
+#
+# SignalGenerator is constructed per request, so the pools are process-wide
+# and created lazily on first use (scripts that never generate a signal don't
+# spawn threads). shutdown_signal_pools() releases them on app shutdown.
+_POOL_SIZES = {
+    'engine': ("ENGINE_POOL_WORKERS", "6"),
+    'signal_batch': ("SIGNAL_BATCH_WORKERS", "2"),
+}
+_POOLS: Dict[str, ThreadPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _pool(name: str) -> ThreadPoolExecutor:
+    """Return the shared pool ``name``, creating it on first use."""
+    pool = _POOLS.get(name)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(name)
+            if pool is None:
+                env_var, default = _POOL_SIZES[name]
+                pool = ThreadPoolExecutor(
+                    max_workers=int(os.getenv(env_var, default)),
+                    thread_name_prefix=f"{name}_",
+                )
+                _POOLS[name] = pool
+    return pool
+
+
+def shutdown_signal_pools(wait: bool = False) -> None:
+    """Shut down the shared pools; they are recreated lazily if used again."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+# Per-asset keys of a generate_signals_batch entry that map onto positional
+# generate_signal arguments; anything else is forwarded as a kwarg.
+_BATCH_ASSET_ARGS = frozenset({
+    'asset_id', 'asset_type', 'market_data', 'ohlcv_data', 'order_book', 'portfolio_value',
+})
+
+
+# Engines reported in a signal's `engine_scores`, in response order
+_ENGINE_KEYS = ('sentiment', 'trend', 'fundamental', 'liquidity', 'event_risk')
+
+# Trend-engine metadata keys feeding each Indicators field, in field order
+# (MA20, MA50, MA200, RSI, MACD, ATR)
+_TREND_INDICATOR_KEYS = ('ma20', 'ma50', 'ma200', 'rsi_14', 'macd', 'atr')
+
+# Confidence penalty for missing input data, indexed by
+# (missing technical data) * 2 + (missing liquidity data):
+# 10% for missing OHLCV, 5% for a missing order book / price.
+_CONF_PENALTY = (0.0, 0.05, 0.10, 0.15)
+
+# Invariant part of the signal returned when generation fails. Treat as
+# read-only: callers splat it into a fresh dict.
+_ERROR_SIGNAL_BASE = {
+    'final_score': 0.0,
+    'action': 'HOLD',
+    'confidence': 0.0,
+}
+
+
+def _skipped_engine_result(reason: str) -> Dict[str, Any]:
+    """Placeholder for an engine that was intentionally not run."""
+    return {'score': None, 'confidence': 0.0, 'metadata': {'skipped': True, 'reason': reason}}
+
+
 def _pass_through_engine_result(raw: Any) -> Dict[str, Any]:
     """
     Normalize a per-engine result dict for the API response.
@@ -79,15 +162,10 @@ def _pass_through_engine_result(raw: Any) -> Dict[str, Any]:
     """
     if not isinstance(raw, dict):
         return {'score': None, 'confidence': 0.0, 'metadata': {'status': 'missing'}}
-    out: Dict[str, Any] = {'score': raw.get('score'), 'confidence': raw.get('confidence', 0.0)}
-    if 'metadata' in raw:
-        out['metadata'] = raw['metadata']
-    # Carry through anything else the engine attached (engine name, timestamp,
-    # legacy 'error' fields), without forcing a schema.
-    for k, v in raw.items():
-        if k not in out:
-            out[k] = v
-    return out
+    # `score`/`confidence` lead and default; the splat carries through metadata
+    # and anything else the engine attached (engine name, timestamp, legacy
+    # 'error' fields) in one dict merge, without forcing a schema.
+    return {'score': raw.get('score'), 'confidence': raw.get('confidence', 0.0), **raw}
 
 
 class SignalGenerator:
@@ -99,19 +177,85 @@ class SignalGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Initialize engines
-        self.technical_engine = TechnicalEngine()
-        self.fundamental_engine = FundamentalEngine()
-        self.liquidity_engine = LiquidityEngine()
-        self.event_risk_engine = EventRiskEngine()
-        self.sentiment_engine = SentimentEngine()
-        self.fusion_engine = FusionEngine()
-        self.confidence_engine = ConfidenceEngine()
-        self.options_engine = OptionsEngine()
+        # Engines are created lazily (see the cached properties below): a
+        # strategy that never reads an engine never constructs it, and tools
+        # that only need the parser don't pay for engine start-up at all.
         
         # Initialize strategy components
         self.parser = CustomStrategyParser()
         self.executor = StrategyExecutor()
+        
+        # Pre-bound hot-path callables: the strategy components are never
+        # reassigned, so generate_signal skips the attribute lookup.
+        self._parse_compiled = self.parser.parse_compiled
+        self._execute = self.executor.execute
+    
+    # --- Engines (constructed on first use) --------------------------------
+    
+    @cached_property
+    def technical_engine(self) -> TechnicalEngine:
+        return TechnicalEngine()
+    
+    @cached_property
+    def fundamental_engine(self) -> FundamentalEngine:
+        return FundamentalEngine()
+    
+    @cached_property
+    def liquidity_engine(self) -> LiquidityEngine:
+        return LiquidityEngine()
+    
+    @cached_property
+    def event_risk_engine(self) -> EventRiskEngine:
+        return EventRiskEngine()
+    
+    @cached_property
+    def sentiment_engine(self) -> SentimentEngine:
+        return SentimentEngine()
+    
+    @cached_property
+    def fusion_engine(self) -> FusionEngine:
+        return FusionEngine()
+    
+    @cached_property
+    def confidence_engine(self) -> ConfidenceEngine:
+        return ConfidenceEngine()
+    
+    @cached_property
+    def options_engine(self) -> OptionsEngine:
+        return OptionsEngine()
+    
+    # Bound ``calculate`` of each engine, cached like the engine itself so the
+    # hot path is a single instance-dict lookup. Resolve these on the calling
+    # thread before handing work to the engine pool, so an engine is never
+    # constructed twice by racing workers.
+    
+    @cached_property
+    def _calc_trend(self):
+        return self.technical_engine.calculate
+    
+    @cached_property
+    def _calc_fundamental(self):
+        return self.fundamental_engine.calculate
+    
+    @cached_property
+    def _calc_liquidity(self):
+        return self.liquidity_engine.calculate
+    
+    @cached_property
+    def _calc_event_risk(self):
+        return self.event_risk_engine.calculate
+    
+    @cached_property
+    def _calc_sentiment(self):
+        return self.sentiment_engine.calculate
+    
+    @cached_property
+    def _calc_fusion(self):
+        return self.fusion_engine.calculate
+    
+    @cached_property
+    def _calc_confidence(self):
+        return self.confidence_engine.calculate
     
     def generate_signal(
         self,
@@ -142,15 +286,142 @@ class SignalGenerator:
         Returns:
             Complete signal with all engine scores, final action, and position sizing
         """
+        # Stamp the signal once, up front, for both the success and error paths
+        timestamp = self._get_current_timestamp()
+        return self._generate_signal(
+            strategy_id, asset_id, asset_type, strategy_data, market_data,
+            ohlcv_data, order_book, portfolio_value,
+            timestamp=timestamp, prepared=None, **kwargs
+        )
+    
+    def generate_signals_batch(
+        self,
+        strategy_id: str,
+        strategy_data: Dict[str, Any],
+        asset_batch: List[Dict[str, Any]],
+        portfolio_value: Optional[float] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate signals for many assets against one strategy.
+        
+        The strategy is parsed and its engine requirements resolved once, and
+        every signal in the batch shares one timestamp. Assets are processed
+        concurrently on a small dedicated pool; each asset's engines still fan
+        out on the shared engine pool.
+        
+        Args:
+            strategy_id: Strategy identifier
+            strategy_data: Strategy configuration (entry_rules, exit_rules, etc.)
+            asset_batch: One dict per asset with ``asset_id`` and ``asset_type``,
+                plus optional ``market_data``, ``ohlcv_data``, ``order_book`` and
+                ``portfolio_value``. Other keys (``asset_symbol``,
+                ``connection_id``, ``exchange``, ...) are forwarded as kwargs.
+            portfolio_value: Default portfolio value for assets that don't set one
+            **kwargs: Additional parameters applied to every asset
+        
+        Returns:
+            Signals in the same order as ``asset_batch``
+        """
+        timestamp = self._get_current_timestamp()
+        try:
+            prepared = self._prepare_strategy(strategy_id, strategy_data)
+        except Exception as e:
+            self.logger.error(f"Error preparing strategy {strategy_id} for batch: {str(e)}")
+            return [
+                self._error_signal(strategy_id, asset.get('asset_id'), asset.get('asset_type'), timestamp, e)
+                for asset in asset_batch
+            ]
+        
+        def _run(asset: Dict[str, Any]) -> Dict[str, Any]:
+            extra = {k: v for k, v in asset.items() if k not in _BATCH_ASSET_ARGS}
+            return self._generate_signal(
+                strategy_id,
+                asset.get('asset_id'),
+                asset.get('asset_type'),
+                strategy_data,
+                asset.get('market_data') or {},
+                asset.get('ohlcv_data'),
+                asset.get('order_book'),
+                asset.get('portfolio_value', portfolio_value),
+                timestamp=timestamp,
+                prepared=prepared,
+                **{**kwargs, **extra}
+            )
+        
+        return list(_pool('signal_batch').map(_run, asset_batch))
+    
+    def _prepare_strategy(self, strategy_id: str, strategy_data: Dict[str, Any]) -> tuple:
+        """
+        Parse and compile a strategy and resolve the engines it needs.
+        
+        An engine is skipped only when nothing reads it: no rule references it
+        and the strategy's fusion profile gives it zero weight. event_risk
+        always runs because fusion's safety veto reads it regardless of weight.
+        Position-sizing needs are added per asset in _generate_signal.
+        
+        Returns:
+            ``(parsed_strategy, strategy_engines)``
+        """
+        parsed_strategy = self._parse_compiled(
+            strategy_data, self.executor.compile_strategy, strategy_id=strategy_id
+        )
+        strategy_engines = set(self.parser.required_engines(parsed_strategy))
+        strategy_engines.update(
+            k for k, w in _normalize_weights(strategy_data.get('engine_weights')).items() if w > 0
+        )
+        strategy_engines.add('event_risk')
+        return parsed_strategy, frozenset(strategy_engines)
+    
+    def _generate_signal(
+        self,
+        strategy_id: str,
+        asset_id: str,
+        asset_type: str,
+        strategy_data: Dict[str, Any],
+        market_data: Dict[str, Any],
+        ohlcv_data: Optional[Any],
+        order_book: Optional[Dict],
+        portfolio_value: Optional[float],
+        timestamp: str,
+        prepared: Optional[tuple],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate one signal; ``prepared`` is a cached _prepare_strategy result."""
         try:
+            # Strategy settings read more than once below
+            timeframe = strategy_data.get('timeframe')
+            risk_level = strategy_data.get('risk_level', 'medium')
+            stop_loss_value = strategy_data.get('stop_loss_value')
+            entry_rules = strategy_data.get('entry_rules') or ()
+            exit_rules = strategy_data.get('exit_rules') or ()
+            
             # Parse strategy
-            parsed_strategy = self.parser.parse(strategy_data)
+            parsed_strategy, strategy_engines = prepared or self._prepare_strategy(strategy_id, strategy_data)
             
             # Check if we should skip external API calls (for testing with DB data)
             skip_external_apis = kwargs.get('skip_external_apis', False)
             
-            # Run all engines
+            # Pull the strategy's per-engine weights and any optional BUY/SELL
+            # threshold overrides out of strategy_data so each strategy
+            # actually uses its own fusion profile (instead of the default one).
+            strategy_weights = strategy_data.get('engine_weights')
+            strategy_buy_threshold = strategy_data.get('buy_threshold')
+            strategy_sell_threshold = strategy_data.get('sell_threshold')
+            
+            # Engines this signal needs: the strategy's own set, plus trend and
+            # sentiment when position sizing (trend strength, sentiment
+            # confidence) will read them.
+            needed_engines = strategy_engines
+            if portfolio_value:
+                needed_engines = strategy_engines | {'trend', 'sentiment'}
+            
+            # Run all engines. The four independent, I/O-bound engines are
+            # submitted to the shared pool up front; liquidity is cheap and
+            # CPU-only so it runs inline while they are in flight. Results are
+            # collected in the original order so engine_scores is unchanged.
             engine_scores = {}
+            engine_pool = _pool('engine')
             
             # Technical Engine
             # Forward connection info so TechnicalEngine can fetch OHLCV from NestJS when available.
@@ -158,58 +429,80 @@ class SignalGenerator:
             exchange = kwargs.get('exchange', 'binance')
             # Use asset_symbol if provided (for OHLCV fetching), otherwise use asset_id
             asset_symbol = kwargs.get('asset_symbol', asset_id)
-            timeframe = strategy_data.get('timeframe')
+            # Sentiment Engine input: text_data from kwargs if provided
+            text_data = kwargs.get('text_data', None)
 
             # Engine-result reuse (system signals only). trend/sentiment vary by
             # timeframe; fundamental/event_risk are asset-level. See _cached_engine.
-            _cacheable = (connection_id is None) and (kwargs.get('text_data') is None)
+            _cacheable = (connection_id is None) and (text_data is None)
 
-            technical_result = _cached_engine(
-                _cacheable,
-                f"trend:{asset_type}:{asset_id}:{timeframe}",
-                lambda: self.technical_engine.calculate(
-                    asset_id=asset_id,
-                    asset_type=asset_type,
-                    timeframe=timeframe,
-                    ohlcv_data=ohlcv_data,
-                    connection_id=connection_id,
-                    exchange=exchange,
-                    asset_symbol=asset_symbol,
-                ),
-            )
-            # When the engine has no data (e.g. OHLCV unavailable because coin
-            # isn't on Binance), return score=None so fusion EXCLUDES this
-            # engine and redistributes its weight to the engines that did
-            # have data. Coercing to 0.0 silently drags strategies (especially
-            # Trend + Sentiment) below their BUY threshold even when the
-            # engines that DID work all said BUY.
-            engine_scores['trend'] = technical_result if technical_result is not None else {'score': None, 'confidence': 0.0}
+            technical_future = None
+            if 'trend' in needed_engines:
+                calc_trend = self._calc_trend
+                technical_future = engine_pool.submit(
+                    _cached_engine,
+                    _cacheable,
+                    f"trend:{asset_type}:{asset_id}:{timeframe}",
+                    lambda: calc_trend(
+                        asset_id=asset_id,
+                        asset_type=asset_type,
+                        timeframe=timeframe,
+                        ohlcv_data=ohlcv_data,
+                        connection_id=connection_id,
+                        exchange=exchange,
+                        asset_symbol=asset_symbol,
+                    ),
+                )
             
-            # Fundamental Engine
+            # Fundamental and Event Risk engines.
             # Pass asset_symbol for external API calls (CoinGecko, LunarCrush need symbols, not UUIDs)
             # Skip if skip_external_apis is True (for testing with DB data only)
-            if skip_external_apis:
-                engine_scores['fundamental'] = {
-                    'score': 0.0, 
-                    'confidence': 0.0, 
-                    'metadata': {'skipped': True, 'reason': 'skip_external_apis=True'}
-                }
-            else:
-                try:
-                    fundamental_result = _cached_engine(
+            fundamental_future = None
+            event_risk_future = None
+            if not skip_external_apis:
+                if 'fundamental' in needed_engines:
+                    calc_fundamental = self._calc_fundamental
+                    fundamental_future = engine_pool.submit(
+                        _cached_engine,
                         _cacheable,
                         f"fund:{asset_type}:{asset_id}",
-                        lambda: self.fundamental_engine.calculate(
+                        lambda: calc_fundamental(
                             asset_id=asset_id,
                             asset_type=asset_type,
                             asset_symbol=asset_symbol,
                         ),
                     )
-                    # See trend-engine comment above — null when no data, not 0.
-                    engine_scores['fundamental'] = fundamental_result if fundamental_result is not None else {'score': None, 'confidence': 0.0}
-                except Exception as e:
-                    logger.warning(f"Fundamental engine error for {asset_symbol} (asset_id: {asset_id}): {str(e)}")
-                    engine_scores['fundamental'] = {'score': None, 'confidence': 0.0, 'error': True, 'error_message': str(e)}
+                calc_event_risk = self._calc_event_risk
+                event_risk_future = engine_pool.submit(
+                    _cached_engine,
+                    _cacheable,
+                    f"evr:{asset_type}:{asset_id}",
+                    lambda: calc_event_risk(
+                        asset_id=asset_id,
+                        asset_type=asset_type,
+                        asset_symbol=asset_symbol,
+                    ),
+                )
+            
+            # Sentiment Engine
+            # Also pass connection_id, exchange, and asset_symbol for MarketSignalAnalyzer to fetch OHLCV
+            sentiment_future = None
+            if 'sentiment' in needed_engines:
+                calc_sentiment = self._calc_sentiment
+                sentiment_future = engine_pool.submit(
+                    _cached_engine,
+                    _cacheable,
+                    f"sent:{asset_type}:{asset_id}:{timeframe}",
+                    lambda: calc_sentiment(
+                        asset_id=asset_id,
+                        asset_type=asset_type,
+                        timeframe=timeframe,
+                        text_data=text_data,
+                        connection_id=connection_id,
+                        exchange=exchange,
+                        asset_symbol=asset_symbol,  # Pass symbol for OHLCV fetching
+                    ),
+                )
             
             # Liquidity Engine — branches on asset_type.
             #
@@ -221,8 +514,10 @@ class SignalGenerator:
             #             which the cron always passes in market_data.
             current_price = market_data.get('price')
             is_stock = (asset_type or '').lower() == 'stock'
-            if is_stock and current_price:
-                liquidity_result = self.liquidity_engine.calculate(
+            if 'liquidity' not in needed_engines:
+                liquidity_result = _skipped_engine_result('not used by strategy')
+            elif is_stock and current_price:
+                liquidity_result = self._calc_liquidity(
                     asset_id=asset_id,
                     asset_type=asset_type,
                     current_price=current_price,
@@ -230,9 +525,8 @@ class SignalGenerator:
                     avg_volume_30d=market_data.get('avg_volume_30d'),
                     market_cap=market_data.get('market_cap'),
                 )
-                engine_scores['liquidity'] = liquidity_result
             elif order_book and current_price:
-                liquidity_result = self.liquidity_engine.calculate(
+                liquidity_result = self._calc_liquidity(
                     asset_id=asset_id,
                     asset_type=asset_type,
                     order_book=order_book,
@@ -240,60 +534,66 @@ class SignalGenerator:
                     volume_24h=market_data.get('volume_24h'),
                     avg_volume_30d=market_data.get('avg_volume_30d')
                 )
-                engine_scores['liquidity'] = liquidity_result
             else:
-                engine_scores['liquidity'] = {'score': None, 'confidence': 0.0}
+                liquidity_result = {'score': None, 'confidence': 0.0}
             
-            # Event Risk Engine
-            # Pass asset_symbol for external API calls (LunarCrush needs symbols, not UUIDs)
-            # Skip if skip_external_apis is True (for testing with DB data only)
-            if skip_external_apis:
+            technical_result = (
+                technical_future.result() if technical_future is not None
+                else _skipped_engine_result('not used by strategy')
+            )
+            # When the engine has no data (e.g. OHLCV unavailable because coin
+            # isn't on Binance), return score=None so fusion EXCLUDES this
+            # engine and redistributes its weight to the engines that did
+            # have data. Coercing to 0.0 silently drags strategies (especially
+            # Trend + Sentiment) below their BUY threshold even when the
+            # engines that DID work all said BUY.
+            engine_scores['trend'] = technical_result if technical_result is not None else {'score': None, 'confidence': 0.0}
+            
+            if fundamental_future is None and not skip_external_apis:
+                engine_scores['fundamental'] = _skipped_engine_result('not used by strategy')
+            elif fundamental_future is None:
+                engine_scores['fundamental'] = {
+                    'score': 0.0, 
+                    'confidence': 0.0, 
+                    'metadata': {'skipped': True, 'reason': 'skip_external_apis=True'}
+                }
+            else:
+                try:
+                    fundamental_result = fundamental_future.result()
+                    # See trend-engine comment above — null when no data, not 0.
+                    engine_scores['fundamental'] = fundamental_result if fundamental_result is not None else {'score': None, 'confidence': 0.0}
+                except Exception as e:
+                    logger.warning(f"Fundamental engine error for {asset_symbol} (asset_id: {asset_id}): {str(e)}")
+                    engine_scores['fundamental'] = {'score': None, 'confidence': 0.0, 'error': True, 'error_message': str(e)}
+            
+            engine_scores['liquidity'] = liquidity_result
+            
+            if event_risk_future is None:
                 engine_scores['event_risk'] = {
                     'score': 0.0, 
                     'confidence': 0.0, 
                     'metadata': {'skipped': True, 'reason': 'skip_external_apis=True'}
                 }
             else:
-                event_risk_result = _cached_engine(
-                    _cacheable,
-                    f"evr:{asset_type}:{asset_id}",
-                    lambda: self.event_risk_engine.calculate(
-                        asset_id=asset_id,
-                        asset_type=asset_type,
-                        asset_symbol=asset_symbol,
-                    ),
-                )
-                engine_scores['event_risk'] = event_risk_result
+                engine_scores['event_risk'] = event_risk_future.result()
 
-            # Sentiment Engine
-            # Extract text_data from kwargs if provided
-            # Also pass connection_id, exchange, and asset_symbol for MarketSignalAnalyzer to fetch OHLCV
-            text_data = kwargs.get('text_data', None)
-            sentiment_result = _cached_engine(
-                _cacheable,
-                f"sent:{asset_type}:{asset_id}:{timeframe}",
-                lambda: self.sentiment_engine.calculate(
-                    asset_id=asset_id,
-                    asset_type=asset_type,
-                    timeframe=timeframe,
-                    text_data=text_data,
-                    connection_id=connection_id,
-                    exchange=exchange,
-                    asset_symbol=asset_symbol,  # Pass symbol for OHLCV fetching
-                ),
+            engine_scores['sentiment'] = (
+                sentiment_future.result() if sentiment_future is not None
+                else _skipped_engine_result('not used by strategy')
             )
-            engine_scores['sentiment'] = sentiment_result
             
-            # Fusion Engine (combines all scores).
-            # Pull the strategy's per-engine weights and any optional BUY/SELL
-            # threshold overrides out of strategy_data so each strategy
-            # actually uses its own profile (instead of the default one).
-            # Without this, all strategies collapse onto the same fusion math.
-            strategy_weights = strategy_data.get('engine_weights')
-            strategy_buy_threshold = strategy_data.get('buy_threshold')
-            strategy_sell_threshold = strategy_data.get('sell_threshold')
-
-            fusion_result = self.fusion_engine.calculate(
+            # Flat {engine: score} view, extracted once for the reads below.
+            # Scores stay raw (None = "engine had no opinion"); consumers that
+            # need a number coerce locally.
+            scores = {
+                name: (result.get('score') if isinstance(result, dict) else None)
+                for name, result in engine_scores.items()
+            }
+            
+            # Fusion Engine (combines all scores) with the strategy's own
+            # weights/thresholds. Without these, all strategies collapse onto
+            # the same fusion math.
+            fusion_result = self._calc_fusion(
                 asset_id=asset_id,
                 asset_type=asset_type,
                 engine_scores=engine_scores,
@@ -303,7 +603,7 @@ class SignalGenerator:
             )
             
             # Extract indicator values for strategy execution
-            indicators = {}
+            indicators = Indicators()
             if 'trend' in engine_scores and 'metadata' in engine_scores['trend']:
                 trend_meta = engine_scores['trend']['metadata']
                 trend_indicators = trend_meta.get('indicators', {})
@@ -318,17 +618,10 @@ class SignalGenerator:
                             trend_indicators = tf_indicators
                             break
 
-                indicators.update({
-                    'MA20': trend_indicators.get('ma20'),
-                    'MA50': trend_indicators.get('ma50'),
-                    'MA200': trend_indicators.get('ma200'),
-                    'RSI': trend_indicators.get('rsi_14'),
-                    'MACD': trend_indicators.get('macd'),
-                    'ATR': trend_indicators.get('atr'),
-                })
+                indicators = Indicators(*(trend_indicators.get(key) for key in _TREND_INDICATOR_KEYS))
             
             # Execute strategy rules (pass engine_scores and fusion_result for field-based rules)
-            execution_result = self.executor.execute(
+            execution_result = self._execute(
                 strategy=parsed_strategy,
                 market_data=market_data,
                 indicators=indicators,
@@ -338,9 +631,7 @@ class SignalGenerator:
             
             # Determine final action: Use fusion engine action if no strategy rules,
             # otherwise use strategy executor action (which can override fusion)
-            entry_rules = strategy_data.get('entry_rules', [])
-            exit_rules = strategy_data.get('exit_rules', [])
-            has_strategy_rules = (entry_rules and len(entry_rules) > 0) or (exit_rules and len(exit_rules) > 0)
+            has_strategy_rules = bool(entry_rules or exit_rules)
 
             if has_strategy_rules:
                 # Check if the executor could actually evaluate the rules.
@@ -376,57 +667,54 @@ class SignalGenerator:
                 # Get actual sentiment confidence
                 sentiment_confidence = engine_scores.get('sentiment', {}).get('confidence', 0.5)
                 
-                confidence_result = self.confidence_engine.calculate(
+                confidence_result = self._calc_confidence(
                     asset_id=asset_id,
                     asset_type=asset_type,
                     sentiment_confidence=sentiment_confidence,
-                    # `or 0.0` guards against engine_scores['trend']['score'] being
-                    # None when the trend engine had no data — abs(None) would crash.
-                    trend_strength=abs(engine_scores['trend'].get('score') or 0.0),
+                    # `or 0.0` guards against the trend score being None when
+                    # the trend engine had no data — abs(None) would crash.
+                    trend_strength=abs(scores['trend'] or 0.0),
                     data_freshness=1.0,  # TODO: Calculate from data timestamps
                     diversification_weight=1.0,  # TODO: Calculate from portfolio
-                    risk_level=strategy_data.get('risk_level', 'medium'),
+                    risk_level=risk_level,
                     portfolio_value=portfolio_value,
-                    stop_loss_distance=strategy_data.get('stop_loss_value'),
+                    stop_loss_distance=stop_loss_value,
                     max_allocation=0.10
                 )
             
             # Adjust confidence based on available data
             # Reduce confidence if critical engines are missing data
             base_confidence = fusion_result.get('confidence', 0.0)
-            has_technical_data = ohlcv_data is not None
-            has_liquidity_data = order_book is not None and market_data.get('price') is not None
+            missing_technical = ohlcv_data is None
+            missing_liquidity = order_book is None or market_data.get('price') is None
             
-            # Penalize confidence if engines are missing data
-            confidence_penalty = 0.0
-            if not has_technical_data:
-                confidence_penalty += 0.1  # 10% penalty for missing technical data
-            if not has_liquidity_data:
-                confidence_penalty += 0.05  # 5% penalty for missing liquidity data
+            # Penalize confidence if engines are missing data (see _CONF_PENALTY)
+            confidence_penalty = _CONF_PENALTY[missing_technical * 2 + missing_liquidity]
             
             adjusted_confidence = max(0.0, min(1.0, base_confidence - confidence_penalty))
             
-            # Ensure fusion_result has a score (handle error cases)
-            fusion_score = 0.0
-            if isinstance(fusion_result, dict) and 'score' in fusion_result:
-                fusion_score = fusion_result.get('score', 0.0)
-            elif isinstance(fusion_result, dict) and 'error' in fusion_result:
-                # Fusion engine returned an error, use default score
+            # Normalize the fusion score to a float once (error results carry
+            # no score); everything below reads these two values as-is.
+            fusion_score = fusion_result.get('score') if isinstance(fusion_result, dict) else None
+            if isinstance(fusion_score, (int, float)):
+                fusion_score = float(fusion_score)
+            else:
+                if isinstance(fusion_result, dict) and 'error' in fusion_result:
+                    self.logger.warning(f"Fusion engine returned error, using default score: {fusion_result.get('error', 'Unknown error')}")
                 fusion_score = 0.0
-                self.logger.warning(f"Fusion engine returned error, using default score: {fusion_result.get('error', 'Unknown error')}")
             
-            # Ensure confidence is a number
-            fusion_confidence = adjusted_confidence if adjusted_confidence is not None else 0.0
+            # Already a float in [0, 1] (clamped above)
+            fusion_confidence = adjusted_confidence
             
             # Build final signal
             signal = {
                 'strategy_id': strategy_id,
                 'asset_id': asset_id,
                 'asset_type': asset_type,
-                'timestamp': self._get_current_timestamp(),
-                'final_score': float(fusion_score) if fusion_score is not None else 0.0,
+                'timestamp': timestamp,
+                'final_score': fusion_score,
                 'action': final_action,
-                'confidence': float(fusion_confidence) if fusion_confidence is not None else 0.0,
+                'confidence': fusion_confidence,
                 # NOTE: engine_scores preserves the full engine output (score,
                 # confidence, metadata) for every engine. Two contracts the
                 # downstream (NestJS noticeboard + LLM explainer) rely on:
@@ -440,7 +728,7 @@ class SignalGenerator:
                 #      reason='News API 429'`).
                 'engine_scores': {
                     eng: _pass_through_engine_result(engine_scores.get(eng))
-                    for eng in ('sentiment', 'trend', 'fundamental', 'liquidity', 'event_risk')
+                    for eng in _ENGINE_KEYS
                 },
                 'strategy_execution': execution_result,
                 'position_sizing': confidence_result,
@@ -457,13 +745,13 @@ class SignalGenerator:
                     options_result = self.options_engine.calculate(
                         asset_id=asset_id,
                         asset_type=asset_type,
-                        timeframe=strategy_data.get('timeframe', '1d'),
+                        timeframe=timeframe or '1d',
                         signal={
                             'action': final_action,
-                            'final_score': float(fusion_score) if fusion_score else 0.0,
-                            'confidence': float(fusion_confidence) if fusion_confidence else 0.0,
-                            'risk_level': strategy_data.get('risk_level', 'medium'),
-                            'timeframe': strategy_data.get('timeframe', '1d'),
+                            'final_score': fusion_score,
+                            'confidence': fusion_confidence,
+                            'risk_level': risk_level,
+                            'timeframe': timeframe or '1d',
                         },
                         options_chain=options_chain,
                         portfolio_value=portfolio_value,
@@ -477,30 +765,31 @@ class SignalGenerator:
             
         except Exception as e:
             self.logger.error(f"Error generating signal: {str(e)}")
-            # Return a proper signal structure even on error
-            return {
-                'strategy_id': strategy_id,
-                'asset_id': asset_id,
-                'asset_type': asset_type,
-                'timestamp': self._get_current_timestamp(),
-                'final_score': 0.0,
-                'action': 'HOLD',
-                'confidence': 0.0,
-                'engine_scores': {
-                    'sentiment': {'score': 0.0},
-                    'trend': {'score': 0.0},
-                    'fundamental': {'score': 0.0},
-                    'liquidity': {'score': 0.0},
-                    'event_risk': {'score': 0.0}
-                },
-                'error': str(e),
-                'metadata': {
-                    'error': True,
-                    'error_message': str(e)
-                }
+            return self._error_signal(strategy_id, asset_id, asset_type, timestamp, e)
+    
+    def _error_signal(
+        self,
+        strategy_id: str,
+        asset_id: str,
+        asset_type: str,
+        timestamp: str,
+        error: Exception
+    ) -> Dict[str, Any]:
+        """Build a proper signal structure for a failed generation."""
+        return {
+            'strategy_id': strategy_id,
+            'asset_id': asset_id,
+            'asset_type': asset_type,
+            'timestamp': timestamp,
+            **_ERROR_SIGNAL_BASE,
+            'engine_scores': {eng: {'score': 0.0} for eng in _ENGINE_KEYS},
+            'error': str(error),
+            'metadata': {
+                'error': True,
+                'error_message': str(error)
             }
+        }
     
     def _get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current UTC timestamp in ISO format."""
+        return datetime.now(timezone.utc).isoformat()
@@ -2,26 +2,166 @@
 Strategy Executor
 Executes strategy rules against market data and evaluates entry/exit conditions.
 """
-from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple, Union
 import logging
+import operator
+import os
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Indicators:
+    """
+    Trend-engine indicator values handed to the executor.
+    
+    Fixed slots instead of a dict: one small allocation per signal and
+    attribute access on lookup. Names match rule ``indicator`` values;
+    indicators the trend engine doesn't compute resolve to None.
+    """
+    MA20: Optional[float] = None
+    MA50: Optional[float] = None
+    MA200: Optional[float] = None
+    RSI: Optional[float] = None
+    MACD: Optional[float] = None
+    ATR: Optional[float] = None
+    
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Plain-dict view for JSON responses."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+IndicatorValues = Union[Indicators, Dict[str, float]]
+
+
+def _indicator_value(indicators: IndicatorValues, name: str) -> Optional[float]:
+    """Look up an indicator from either an Indicators object or a plain dict."""
+    if isinstance(indicators, dict):
+        return indicators.get(name)
+    return getattr(indicators, name, None)
+
+
+# Absolute tolerance for == / != rule comparisons (float values). Strict:
+# a difference of exactly _ABS_TOL is not equal.
+_ABS_TOL = 1e-3
+
+
+def _eq_eps(a, b):
+    return abs(a - b) < _ABS_TOL  # Float comparison
+
+
+def _ne_eps(a, b):
+    return abs(a - b) >= _ABS_TOL
+
+
+# Integer opcode per rule operator, resolved once when a strategy is loaded
+# (compile_strategy / the parser's vectorized form) instead of string-matching
+# the operator on every evaluation
+_OPS: Dict[str, int] = {
+    '>': 0, '<': 1, '>=': 2, '<=': 3, '==': 4, '!=': 5, 'cross_above': 6, 'cross_below': 7,
+}
+
+# Comparison per opcode; each works on scalars and numpy arrays alike.
+# cross_above / cross_below need price history, so for now they compare the
+# current value only.
+_FNS: Tuple[Callable[[Any, Any], Any], ...] = (
+    operator.gt, operator.lt, operator.ge, operator.le, _eq_eps, _ne_eps, operator.gt, operator.lt,
+)
+
+# Field-path shapes understood by _get_field_value
+_FIELD_FINAL_SCORE = 0   # 'final_score' -> fusion_result['score']
+_FIELD_ENGINE = 1        # 'metadata.engine_details.<engine>.<field>'
+_FIELD_GENERIC = 2       # any other dotted path
+
+
+@lru_cache(maxsize=512)
+def _classify_field_path(field_path: str) -> Tuple[int, tuple]:
+    """
+    Split and classify a rule field path once per distinct path.
+    
+    Returns ``(kind, payload)``: ``(engine, field)`` for _FIELD_ENGINE (None
+    when the path is too short to name a field), the split parts otherwise.
+    """
+    parts = tuple(field_path.split('.'))
+    if parts[0] == 'final_score':
+        return _FIELD_FINAL_SCORE, parts
+    if len(parts) >= 2 and parts[0] == 'metadata' and parts[1] == 'engine_details':
+        return _FIELD_ENGINE, (parts[2], parts[3]) if len(parts) >= 4 else None
+    return _FIELD_GENERIC, parts
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """float(value), or None when it is missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# A compiled rule:
+# (indicators, market_data, engine_scores, fusion_result, field_cache) -> (met, evaluable)
+# field_cache memoizes resolved field paths for the duration of one execute().
+CompiledRule = Callable[
+    [IndicatorValues, Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]], Dict[str, Any]],
+    Tuple[bool, bool]
+]
+
+# Marks a field path not yet resolved in a field_cache (None is a valid result)
+_UNRESOLVED = object()
+
+
 class StrategyExecutor:
     """
     Executes trading strategy rules against market data.
     Evaluates entry and exit conditions to determine signals.
     """
     
-    def __init__(self):
+    def __init__(self, verbose: Optional[bool] = None):
+        """
+        Args:
+            verbose: Evaluate every rule and report per-rule ``conditions``.
+                Off by default (``STRATEGY_EXECUTOR_VERBOSE=true`` enables it):
+                evaluation then stops as soon as the AND/OR outcome is known.
+        """
         self.logger = logging.getLogger(__name__)
+        if verbose is None:
+            verbose = os.getenv("STRATEGY_EXECUTOR_VERBOSE", "false").lower() == "true"
+        self.verbose = verbose
+    
+    def compile_strategy(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pre-compile a parsed strategy's rules for repeated execution.
+        
+        Each rule's operator, target and input lookup are resolved once into a
+        closure, so evaluation skips per-call operator dispatch. Compile once
+        per strategy and reuse the result across assets / bars.
+        
+        Args:
+            strategy: Parsed strategy with entry_rules, exit_rules
+        
+        Returns:
+            Shallow copy of ``strategy`` with the closures under ``_compiled``
+            (kept off the rule dicts, which are echoed back in results)
+        """
+        return {
+            **strategy,
+            '_compiled': {
+                key: tuple(self._compile_rule(rule) for rule in strategy.get(key) or ())
+                for key in ('entry_rules', 'exit_rules')
+            },
+        }
     
     def execute(
         self,
         strategy: Dict[str, Any],
         market_data: Dict[str, Any],
-        indicators: Dict[str, float],
+        indicators: IndicatorValues,
         engine_scores: Optional[Dict[str, Any]] = None,
         fusion_result: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -31,7 +171,7 @@ class StrategyExecutor:
         Args:
             strategy: Parsed strategy with entry_rules, exit_rules
             market_data: Current market data (price, volume, etc.)
-            indicators: Calculated indicator values
+            indicators: Calculated indicator values (Indicators or a plain dict)
             engine_scores: Engine scores (for field-based rules)
             fusion_result: Fusion result (for field-based rules)
         
@@ -39,13 +179,25 @@ class StrategyExecutor:
             Dictionary with signal (BUY/SELL/HOLD) and details
         """
         try:
+            # Vectorized rule forms built by the parser (None per side when the
+            # rules are few or mix field and indicator rules)
+            vectorized = strategy.get('_vectorized') or {}
+            # Closures from compile_strategy, if the caller compiled it
+            compiled = strategy.get('_compiled') or {}
+            # Field values resolved so far; entry and exit rules often read
+            # the same paths (e.g. final_score)
+            field_cache: Dict[str, Any] = {}
+            
             # Evaluate entry conditions
             entry_result = self._evaluate_rules(
                 strategy.get('entry_rules', []),
                 indicators,
                 market_data,
                 engine_scores,
-                fusion_result
+                fusion_result,
+                vectorized=vectorized.get('entry_rules'),
+                compiled=compiled.get('entry_rules'),
+                field_cache=field_cache
             )
             
             # Evaluate exit conditions
@@ -54,7 +206,10 @@ class StrategyExecutor:
                 indicators,
                 market_data,
                 engine_scores,
-                fusion_result
+                fusion_result,
+                vectorized=vectorized.get('exit_rules'),
+                compiled=compiled.get('exit_rules'),
+                field_cache=field_cache
             )
             
             # Determine signal
@@ -67,7 +222,7 @@ class StrategyExecutor:
                 'entry_details': entry_result,
                 'exit_details': exit_result,
                 'current_price': market_data.get('price'),
-                'indicators': indicators
+                'indicators': indicators.as_dict() if isinstance(indicators, Indicators) else indicators
             }
             
         except Exception as e:
@@ -77,23 +232,92 @@ class StrategyExecutor:
                 'error': str(e)
             }
     
+    def execute_batch(
+        self,
+        strategy: Dict[str, Any],
+        indicator_arrays: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Execute indicator rules against many bars at once (backtests).
+        
+        Each rule becomes one vectorized comparison over all bars, combined
+        with the rule list's AND/OR logic. Per bar this matches execute(): a
+        missing (None/NaN) indicator never meets its rule, exit beats entry,
+        and an empty side never fires. Live signals keep using execute().
+        
+        Args:
+            strategy: Parsed strategy with entry_rules, exit_rules
+            indicator_arrays: Indicator name -> per-bar values, all the same
+                length; indicators absent from the dict count as missing
+        
+        Returns:
+            Dictionary with per-bar ``signal`` ('BUY'/'SELL'/'HOLD') and
+            ``entry_conditions_met`` / ``exit_conditions_met`` arrays
+        
+        Raises:
+            ValueError: If a rule is field-based (field values come from
+                per-bar engine output) or malformed
+        """
+        arrays = {name: np.asarray(values, dtype=np.float64) for name, values in indicator_arrays.items()}
+        n_bars = len(next(iter(arrays.values()))) if arrays else 0
+        missing = np.full(n_bars, np.nan)
+        
+        def rules_met(rules: List[Dict[str, Any]]) -> np.ndarray:
+            if not rules:
+                return np.zeros(n_bars, dtype=bool)
+            met = []
+            for rule in rules:
+                opcode = _OPS.get(rule.get('operator'))
+                if 'indicator' not in rule or opcode is None or 'value' not in rule:
+                    raise ValueError(f"Rule not supported in batch execution: {rule}")
+                values = arrays.get(rule['indicator'], missing)
+                with np.errstate(invalid='ignore'):
+                    met.append(_FNS[opcode](values, rule['value']) & ~np.isnan(values))
+            logic_operator = next((rule['logic'] for rule in reversed(rules) if 'logic' in rule), 'AND')
+            if logic_operator == 'OR':
+                return np.logical_or.reduce(met)
+            return np.logical_and.reduce(met)
+        
+        entry_met = rules_met(strategy.get('entry_rules') or [])
+        exit_met = rules_met(strategy.get('exit_rules') or [])
+        
+        return {
+            'signal': np.where(exit_met, 'SELL', np.where(entry_met, 'BUY', 'HOLD')),
+            'entry_conditions_met': entry_met,
+            'exit_conditions_met': exit_met,
+        }
+    
     def _evaluate_rules(
         self,
         rules: List[Dict[str, Any]],
-        indicators: Dict[str, float],
+        indicators: IndicatorValues,
         market_data: Dict[str, Any],
         engine_scores: Optional[Dict[str, Any]] = None,
-        fusion_result: Optional[Dict[str, Any]] = None
+        fusion_result: Optional[Dict[str, Any]] = None,
+        vectorized: Optional[Dict[str, Any]] = None,
+        compiled: Optional[Sequence[CompiledRule]] = None,
+        field_cache: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Evaluate a list of rules.
         
+        Unless the executor is verbose, evaluation stops once the outcome is
+        decided (first failed AND rule after an evaluable one, first met OR
+        rule) and ``conditions`` is left empty; ``indicators_missing`` then
+        counts skips among the rules actually evaluated. ``all_skipped`` is
+        exact either way, since a short-circuit implies an evaluable rule.
+        
         Args:
             rules: List of rule dictionaries
             indicators: Calculated indicator values
             market_data: Market data
             engine_scores: Engine scores (for field-based rules)
             fusion_result: Fusion result (for field-based rules)
+            vectorized: Parser-built array form of ``rules`` (indicator rules
+                only); when given, all rules are compared in one numpy pass
+            compiled: Closures for ``rules`` from compile_strategy; compiled
+                on the fly when not given
+            field_cache: Field-path memo shared across one execute() call
         
         Returns:
             Evaluation result with conditions met status
@@ -101,51 +325,128 @@ class StrategyExecutor:
         if not rules:
             return {'all_met': False, 'conditions': [], 'no_rules': True}
         
-        conditions_met = []
-        logic_operator = 'AND'  # Default
-
-        for rule in rules:
-            # `evaluable` is True when the rule's inputs actually exist
-            # (indicator present OR field path resolves OR rule is pure
-            # fusion-based). A rule that cannot be evaluated is marked
-            # `skipped` so signal_generator can fall back to the fusion
-            # engine's action instead of silently returning HOLD.
-            condition_met, evaluable = self._evaluate_single_rule(
-                rule, indicators, market_data, engine_scores, fusion_result
-            )
-
-            conditions_met.append({
-                'rule': rule,
-                'met': condition_met,
-                'skipped': not evaluable,
-            })
-
-            # Get logic operator (AND/OR)
-            if 'logic' in rule:
-                logic_operator = rule['logic']
-
-        # Determine if all conditions are met based on logic
-        if logic_operator == 'OR':
-            all_met = any(c['met'] for c in conditions_met)
-        else:  # AND (default)
-            all_met = all(c['met'] for c in conditions_met)
-
-        skipped_count = sum(1 for c in conditions_met if c.get('skipped', False))
-
+        # Get logic operator (AND/OR): the last rule that sets one wins
+        logic_operator = next((rule['logic'] for rule in reversed(rules) if 'logic' in rule), 'AND')
+        use_or = logic_operator == 'OR'
+        conditions_met = [] if self.verbose else None
+        
+        vectorized_result = (
+            self._evaluate_indicator_rules_vectorized(vectorized, indicators)
+            if vectorized is not None else None
+        )
+        if vectorized_result is not None:
+            met, evaluable = vectorized_result
+            all_met = any(met) if use_or else all(met)
+            skipped_count = evaluable.count(False)
+            if conditions_met is not None:
+                conditions_met = [
+                    {'rule': rule, 'met': rule_met, 'skipped': not rule_evaluable}
+                    for rule, rule_met, rule_evaluable in zip(rules, met, evaluable)
+                ]
+        else:
+            if compiled is None:
+                compiled = map(self._compile_rule, rules)  # lazy: short-circuit skips the rest
+            
+            if field_cache is None:
+                field_cache = {}
+            short_circuit = conditions_met is None
+            all_met = not use_or
+            skipped_count = 0
+            seen_evaluable = False
+            
+            for rule, evaluate in zip(rules, compiled):
+                # `evaluable` is True when the rule's inputs actually exist
+                # (indicator present OR field path resolves OR rule is pure
+                # fusion-based). A rule that cannot be evaluated is marked
+                # `skipped` so signal_generator can fall back to the fusion
+                # engine's action instead of silently returning HOLD.
+                try:
+                    condition_met, evaluable = evaluate(
+                        indicators, market_data, engine_scores, fusion_result, field_cache
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error evaluating rule: {str(e)}")
+                    condition_met, evaluable = False, True  # unknown error path — don't claim "skipped"
+                
+                if evaluable:
+                    seen_evaluable = True
+                else:
+                    skipped_count += 1
+                
+                if conditions_met is not None:
+                    conditions_met.append({
+                        'rule': rule,
+                        'met': condition_met,
+                        'skipped': not evaluable,
+                    })
+                
+                if use_or:
+                    if condition_met:
+                        all_met = True
+                        if short_circuit:
+                            break
+                elif not condition_met:
+                    all_met = False
+                    # Keep going while every rule so far was skipped:
+                    # all_skipped still depends on the rest.
+                    if short_circuit and seen_evaluable:
+                        break
+        
         return {
             'all_met': all_met,
-            'conditions': conditions_met,
+            'conditions': conditions_met if conditions_met is not None else (),
             'logic': logic_operator,
             # Retained name for backward compat; now counts ANY rule that
             # couldn't be evaluated (indicator OR field missing).
             'indicators_missing': skipped_count,
-            'all_skipped': skipped_count == len(conditions_met) and len(conditions_met) > 0,
+            'all_skipped': skipped_count == len(rules),
         }
     
+    def _evaluate_indicator_rules_vectorized(
+        self,
+        vectorized: Dict[str, Any],
+        indicators: IndicatorValues
+    ) -> Optional[Tuple[List[bool], List[bool]]]:
+        """
+        Evaluate indicator rules in one numpy pass.
+        
+        Same per-rule semantics as _evaluate_single_rule: a missing indicator
+        is not evaluable (met=False, skipped), ``==``/``!=`` use a 0.001
+        tolerance, and crosses compare as plain ``>``/``<``.
+        
+        Returns:
+            ``(met, evaluable)`` lists, one entry per rule, or None when an
+            indicator value isn't a plain number (e.g. a custom indicator's
+            string or dict); the caller then uses the per-rule path, which
+            marks just that rule failed.
+        """
+        names = vectorized['indicators']
+        opcodes = vectorized['opcodes']
+        targets = vectorized['values']
+        
+        raw_values = [_indicator_value(indicators, name) for name in names]
+        if not all(v is None or isinstance(v, (int, float, np.number)) for v in raw_values):
+            return None
+        for name, value in zip(names, raw_values):
+            if value is None:
+                self.logger.warning(f"Indicator {name} not found in data")
+        present = np.fromiter((v is not None for v in raw_values), dtype=bool, count=len(names))
+        current = np.fromiter((np.nan if v is None else v for v in raw_values), dtype=np.float64, count=len(names))
+        
+        # One masked comparison per distinct opcode in the list
+        met = np.zeros(len(names), dtype=bool)
+        with np.errstate(invalid='ignore'):
+            for opcode in np.unique(opcodes):
+                mask = opcodes == opcode
+                met[mask] = _FNS[opcode](current[mask], targets[mask])
+        met &= present
+        
+        return met.tolist(), present.tolist()
+    
     def _evaluate_single_rule(
         self,
         rule: Dict[str, Any],
-        indicators: Dict[str, float],
+        indicators: IndicatorValues,
         market_data: Dict[str, Any],
         engine_scores: Optional[Dict[str, Any]] = None,
         fusion_result: Optional[Dict[str, Any]] = None
@@ -175,66 +476,77 @@ class StrategyExecutor:
         error, not missing runtime data.
         """
         try:
-            operator = rule['operator']
-            target_value = rule['value']
-
-            # Support both indicator-based and field-based rules
-            if 'indicator' in rule:
-                # Indicator-based rule
-                indicator_name = rule['indicator']
-                indicator_value = indicators.get(indicator_name)
-
-                if indicator_value is None:
-                    self.logger.warning(f"Indicator {indicator_name} not found in data")
-                    return (False, False)  # not evaluable
-
-                value_to_compare = indicator_value
-
-            elif 'field' in rule:
-                # Field-based rule (e.g., 'final_score', 'metadata.engine_details.event_risk.score')
-                field_path = rule['field']
-                value_to_compare = self._get_field_value(field_path, engine_scores, fusion_result, market_data)
-
-                if value_to_compare is None:
-                    self.logger.warning(f"Field {field_path} not found in data")
-                    return (False, False)  # not evaluable
-            else:
-                self.logger.warning(f"Rule missing both 'indicator' and 'field': {rule}")
-                # Treat as evaluated-but-failed: the rule is malformed, not
-                # missing runtime data. Falling back to fusion would hide
-                # the authoring bug.
-                return (False, True)
-
-            # Evaluate condition based on operator
-            if operator == '>':
-                met = value_to_compare > target_value
-            elif operator == '<':
-                met = value_to_compare < target_value
-            elif operator == '>=':
-                met = value_to_compare >= target_value
-            elif operator == '<=':
-                met = value_to_compare <= target_value
-            elif operator == '==':
-                met = abs(value_to_compare - target_value) < 0.001  # Float comparison
-            elif operator == '!=':
-                met = abs(value_to_compare - target_value) >= 0.001
-            elif operator == 'cross_above':
-                # Check if indicator crossed above target value
-                # This requires historical data - simplified for now
-                met = value_to_compare > target_value
-            elif operator == 'cross_below':
-                # Check if indicator crossed below target value
-                met = value_to_compare < target_value
-            else:
-                self.logger.warning(f"Unknown operator: {operator}")
-                return (False, True)  # malformed rule, not missing data
-
-            return (met, True)
-
+            return self._compile_rule(rule)(indicators, market_data, engine_scores, fusion_result, {})
         except Exception as e:
             self.logger.error(f"Error evaluating rule: {str(e)}")
             return (False, True)  # unknown error path — don't claim "skipped"
     
+    def _compile_rule(self, rule: Dict[str, Any]) -> CompiledRule:
+        """
+        Build the evaluation closure for one rule.
+        
+        The closure returns ``(met, evaluable)`` exactly as documented on
+        _evaluate_single_rule; comparison errors propagate to the caller.
+        """
+        logger = self.logger
+        get_field_value = self._get_field_value
+        
+        try:
+            operator_name = rule['operator']
+            target_value = rule['value']
+        except Exception as e:
+            error_message = str(e)
+            
+            def evaluate_malformed(indicators, market_data, engine_scores, fusion_result, field_cache):
+                logger.error(f"Error evaluating rule: {error_message}")
+                return (False, True)
+            return evaluate_malformed
+        
+        opcode = _OPS.get(operator_name)
+        compare = _FNS[opcode] if opcode is not None else None
+        
+        def check(value: float) -> Tuple[bool, bool]:
+            if compare is None:
+                logger.warning(f"Unknown operator: {operator_name}")
+                return (False, True)  # malformed rule, not missing data
+            return (compare(value, target_value), True)
+        
+        # Support both indicator-based and field-based rules
+        if 'indicator' in rule:
+            indicator_name = rule['indicator']
+            
+            def evaluate_indicator(indicators, market_data, engine_scores, fusion_result, field_cache):
+                value = _indicator_value(indicators, indicator_name)
+                if value is None:
+                    logger.warning(f"Indicator {indicator_name} not found in data")
+                    return (False, False)  # not evaluable
+                return check(value)
+            return evaluate_indicator
+        
+        if 'field' in rule:
+            # Field-based rule (e.g., 'final_score', 'metadata.engine_details.event_risk.score')
+            field_path = rule['field']
+            
+            def evaluate_field(indicators, market_data, engine_scores, fusion_result, field_cache):
+                value = field_cache.get(field_path, _UNRESOLVED)
+                if value is _UNRESOLVED:
+                    value = field_cache[field_path] = get_field_value(
+                        field_path, engine_scores, fusion_result, market_data
+                    )
+                if value is None:
+                    logger.warning(f"Field {field_path} not found in data")
+                    return (False, False)  # not evaluable
+                return check(value)
+            return evaluate_field
+        
+        def evaluate_incomplete(indicators, market_data, engine_scores, fusion_result, field_cache):
+            logger.warning(f"Rule missing both 'indicator' and 'field': {rule}")
+            # Treat as evaluated-but-failed: the rule is malformed, not
+            # missing runtime data. Falling back to fusion would hide
+            # the authoring bug.
+            return (False, True)
+        return evaluate_incomplete
+    
     def _get_field_value(
         self,
         field_path: str,
@@ -258,36 +570,25 @@ class StrategyExecutor:
             Field value as float, or None if not found
         """
         try:
-            parts = field_path.split('.')
+            kind, payload = _classify_field_path(field_path)
             
             # Special handling for 'final_score' (fusion_result uses 'score')
-            if parts[0] == 'final_score' and fusion_result:
-                value = fusion_result.get('score')
-                if value is not None:
-                    try:
-                        return float(value)
-                    except (ValueError, TypeError):
-                        return None
-                return None
+            if kind == _FIELD_FINAL_SCORE and fusion_result:
+                return _as_float(fusion_result.get('score'))
             
             # Handle 'metadata.engine_details.*' paths
-            if len(parts) >= 2 and parts[0] == 'metadata' and parts[1] == 'engine_details':
+            if kind == _FIELD_ENGINE:
                 # Path like: metadata.engine_details.event_risk.score
-                if len(parts) >= 4 and engine_scores:
-                    engine_name = parts[2]  # e.g., 'event_risk'
-                    field_name = parts[3]    # e.g., 'score'
-                    
-                    if engine_name in engine_scores:
-                        engine_data = engine_scores[engine_name]
-                        if isinstance(engine_data, dict):
-                            value = engine_data.get(field_name)
-                            if value is not None:
-                                try:
-                                    return float(value)
-                                except (ValueError, TypeError):
-                                    return None
+                if payload is None or not engine_scores:
+                    return None
+                engine_name, field_name = payload
+                engine_data = engine_scores.get(engine_name)
+                if isinstance(engine_data, dict):
+                    return _as_float(engine_data.get(field_name))
                 return None
             
+            parts = payload
+            
             # Generic nested path lookup
             # Try fusion_result first
             if fusion_result and parts[0] in fusion_result:
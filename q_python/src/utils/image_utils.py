@@ -2,7 +2,10 @@
 Image utility functions for preprocessing, validation, and enhancement.
 """
 import io
-from typing import Tuple, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional
 from PIL import Image
 import numpy as np
 from logging import getLogger
@@ -21,20 +24,52 @@ def _get_cv2():
             _cv2 = None
     return _cv2
 
+# Sharpening used by enhance_image: 0.1 * sharpen(img) + 0.9 * img folded into
+# one kernel (the blend is linear). Read-only; shared by every call.
+_SHARPEN_KERNEL = np.array([[-1, -1, -1],
+                            [-1,  9, -1],
+                            [-1, -1, -1]], dtype=np.float32) * 0.1
+_SHARPEN_KERNEL[1, 1] += 0.9
+_SHARPEN_KERNEL.setflags(write=False)
+
+# Well-exposed images skip enhancement: grayscale mean brightness in this
+# range and std-dev contrast above the minimum, measured on a thumbnail
+_WELL_EXPOSED_BRIGHTNESS = (80, 175)
+_WELL_EXPOSED_MIN_CONTRAST = 40
+_EXPOSURE_THUMB_SIZE = (128, 128)
+
+# CLAHE objects keep internal work buffers, so one is cached per thread
+# rather than shared across the request thread pool
+_clahe_local = threading.local()
+
+
+def _get_clahe(cv2):
+    clahe = getattr(_clahe_local, "clahe", None)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        _clahe_local.clahe = clahe
+    return clahe
+
+# PIL modes whose pixels don't fit in 8 bits; preprocess_image normalizes
+# these numerically instead of letting PIL truncate them
+_HIGH_DEPTH_MODES = frozenset({'F', 'I', 'I;16', 'I;16B', 'I;16L', 'I;16N'})
+
 try:
     from src.config import get_config
     MAX_IMAGE_WIDTH = get_config("max_image_width", 4000)
     MAX_IMAGE_HEIGHT = get_config("max_image_height", 4000)
     MIN_IMAGE_WIDTH = get_config("min_image_width", 100)
     MIN_IMAGE_HEIGHT = get_config("min_image_height", 100)
-    ALLOWED_FORMATS = get_config("allowed_formats", {'JPEG', 'PNG', 'WEBP', 'BMP'})
+    ALLOWED_FORMATS = frozenset(
+        f.upper() for f in (get_config("allowed_formats") or {'JPEG', 'PNG', 'WEBP', 'BMP'})
+    )
 except ImportError:
     # Fallback if config not available
     MAX_IMAGE_WIDTH = 4000
     MAX_IMAGE_HEIGHT = 4000
     MIN_IMAGE_WIDTH = 100
     MIN_IMAGE_HEIGHT = 100
-    ALLOWED_FORMATS = {'JPEG', 'PNG', 'WEBP', 'BMP'}
+    ALLOWED_FORMATS = frozenset({'JPEG', 'PNG', 'WEBP', 'BMP'})
 
 logger = getLogger(__name__)
 
@@ -49,6 +84,12 @@ def validate_image(image: Image.Image) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # Cheapest check first: a set lookup rejects wrong formats before the
+    # size is read. Formats are upper-cased on both sides (config may list
+    # 'png'); images not opened from a file have no format at all.
+    if (image.format or '').upper() not in ALLOWED_FORMATS:
+        return False, f"Unsupported format. Allowed: {', '.join(ALLOWED_FORMATS)}"
+    
     width, height = image.size
     
     if width < MIN_IMAGE_WIDTH or height < MIN_IMAGE_HEIGHT:
@@ -57,54 +98,62 @@ def validate_image(image: Image.Image) -> Tuple[bool, Optional[str]]:
     if width > MAX_IMAGE_WIDTH or height > MAX_IMAGE_HEIGHT:
         return False, f"Image too large. Maximum size: {MAX_IMAGE_WIDTH}x{MAX_IMAGE_HEIGHT}"
     
-    if image.format not in ALLOWED_FORMATS:
-        return False, f"Unsupported format. Allowed: {', '.join(ALLOWED_FORMATS)}"
-    
     return True, None
 
 
-def preprocess_image(image: Image.Image, enhance: bool = True) -> np.ndarray:
+def preprocess_image(
+    image: Image.Image,
+    enhance: bool = True,
+    max_size: Optional[Tuple[int, int]] = None
+) -> np.ndarray:
     """
     Preprocess image for ML processing.
     
     Args:
         image: PIL Image object
-        enhance: Whether to apply enhancement
+        enhance: Whether to apply enhancement (skipped for images that are
+            already well exposed, see _needs_enhancement)
+        max_size: Optional maximum (width, height); larger images are
+            downscaled on the array (see resize_array_if_needed)
         
     Returns:
-        NumPy array of processed image in uint8 format
+        NumPy array of processed image in uint8 format (RGB, HxWx3), owned
+        by the caller and writable
     """
-    # Convert PIL to numpy array
-    img_array = np.array(image)
+    # 8-bit modes (RGBA, L, P, LA, CMYK, ...) are converted to RGB by PIL in C,
+    # without an intermediate array. Float / 32-bit int modes are kept as-is
+    # so their values can be rescaled below, then expanded from gray.
+    if image.mode != 'RGB' and image.mode not in _HIGH_DEPTH_MODES:
+        image = image.convert('RGB')
+    
+    # Convert PIL to numpy array (no copy where the buffer allows)
+    img_array = np.asarray(image)
     
     # Ensure uint8 format
     if img_array.dtype != np.uint8:
-        # Normalize to 0-255 range if needed
-        if img_array.dtype == np.float64 or img_array.dtype == np.float32:
-            if img_array.max() <= 1.0:
-                img_array = (img_array * 255).astype(np.uint8)
-            else:
-                img_array = np.clip(img_array, 0, 255).astype(np.uint8)
+        if img_array.dtype.kind == 'f':
+            # Normalize to 0-255: [0, 1] floats are scaled, others clipped.
+            # Clip into one fresh buffer, scale it in place, then cast.
+            scale = 255.0 if img_array.max() <= 1.0 else 1.0
+            buf = np.clip(img_array, 0.0, 255.0 / scale)
+            if scale != 1.0:
+                np.multiply(buf, scale, out=buf)
+            img_array = buf.astype(np.uint8)
         else:
             img_array = img_array.astype(np.uint8)
     
-    cv2 = _get_cv2()
-    if cv2 is None:
-        # Fallback: use simple conversions without OpenCV
-        if image.mode == 'RGBA':
-            img_array = img_array[:, :, :3]
-        elif image.mode != 'RGB':
-            # Stack grayscale to RGB
-            if len(img_array.shape) == 2:
-                img_array = np.stack([img_array] * 3, axis=-1)
-    else:
-        if image.mode == 'RGBA':
-            # Convert RGBA to RGB
-            img_array = cv2.cvtColor(img_array, cv2.COLOR_RGBA2RGB)
-        elif image.mode != 'RGB':
+    if img_array.ndim == 2:
+        # High-depth grayscale: stack to RGB
+        cv2 = _get_cv2()
+        if cv2 is None:
+            img_array = np.stack([img_array] * 3, axis=-1)
+        else:
             img_array = cv2.cvtColor(img_array, cv2.COLOR_GRAY2RGB)
     
-    if enhance:
+    if max_size is not None:
+        img_array = resize_array_if_needed(img_array, max_size)
+    
+    if enhance and _needs_enhancement(img_array):
         # Apply basic enhancements
         img_array = enhance_image(img_array)
     
@@ -112,9 +161,57 @@ def preprocess_image(image: Image.Image, enhance: bool = True) -> np.ndarray:
     if img_array.dtype != np.uint8:
         img_array = np.clip(img_array, 0, 255).astype(np.uint8)
     
+    # Nothing above produced a new array (RGB in, no resize or enhancement):
+    # copy out of PIL's read-only buffer so callers can write into the result
+    if not img_array.flags.writeable:
+        img_array = img_array.copy()
+    
     return img_array
 
 
+def _needs_enhancement(img_array: np.ndarray) -> bool:
+    """
+    Cheap pre-check for enhance_image: an image whose brightness and contrast
+    are already in range gains nothing from CLAHE + sharpening. Measured on
+    a small thumbnail so the check costs a fraction of the enhancement.
+    """
+    cv2 = _get_cv2()
+    if cv2 is None:
+        return True
+    thumb = cv2.resize(img_array, _EXPOSURE_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+    mean, std = cv2.meanStdDev(cv2.cvtColor(thumb, cv2.COLOR_RGB2GRAY))
+    low, high = _WELL_EXPOSED_BRIGHTNESS
+    return not (low <= mean[0, 0] <= high and std[0, 0] > _WELL_EXPOSED_MIN_CONTRAST)
+
+
+def preprocess_batch(
+    images: List[Image.Image],
+    enhance: bool = True,
+    max_size: Optional[Tuple[int, int]] = None,
+    workers: Optional[int] = None
+) -> List[np.ndarray]:
+    """
+    Preprocess several images concurrently.
+    
+    preprocess_image spends its time in PIL/OpenCV C code that releases the
+    GIL, so threads scale with cores without any pickling overhead.
+    
+    Args:
+        images: PIL Image objects
+        enhance: Whether to apply enhancement
+        max_size: Optional maximum (width, height), as in preprocess_image
+        workers: Thread count (default: one per CPU, capped at len(images))
+        
+    Returns:
+        Processed arrays in the same order as ``images``
+    """
+    workers = min(workers or os.cpu_count() or 1, len(images))
+    if workers <= 1:
+        return [preprocess_image(image, enhance, max_size) for image in images]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preprocess_") as pool:
+        return list(pool.map(lambda image: preprocess_image(image, enhance, max_size), images))
+
+
 def enhance_image(img_array: np.ndarray) -> np.ndarray:
     """
     Enhance image quality (brightness, contrast, sharpness).
@@ -129,28 +226,24 @@ def enhance_image(img_array: np.ndarray) -> np.ndarray:
     if img_array.dtype != np.uint8:
         img_array = np.clip(img_array, 0, 255).astype(np.uint8)
     
-    # Convert to LAB color space for better enhancement
+    # Convert to YCrCb to equalize luminance only; a linear transform, much
+    # cheaper per pixel than the LAB round-trip
     cv2 = _get_cv2()
     if cv2 is None:
         return img_array
-    lab = cv2.cvtColor(img_array, cv2.COLOR_RGB2LAB)
-    l, a, b = cv2.split(lab)
+    ycrcb = cv2.cvtColor(img_array, cv2.COLOR_RGB2YCrCb)
+    y, cr, cb = cv2.split(ycrcb)
     
     # Apply CLAHE (Contrast Limited Adaptive Histogram Equalization)
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    l = clahe.apply(l)
+    y = _get_clahe(cv2).apply(y)
     
     # Merge channels and convert back to RGB
-    enhanced = cv2.merge([l, a, b])
-    enhanced = cv2.cvtColor(enhanced, cv2.COLOR_LAB2RGB)
+    enhanced = cv2.merge([y, cr, cb])
+    enhanced = cv2.cvtColor(enhanced, cv2.COLOR_YCrCb2RGB)
     
-    # Apply slight sharpening (ensure uint8 operations)
-    kernel = np.array([[-1, -1, -1],
-                       [-1,  9, -1],
-                       [-1, -1, -1]], dtype=np.float32)
-    # Use float32 for calculation, then convert back to uint8
-    enhanced_float = cv2.filter2D(enhanced.astype(np.float32), -1, kernel * 0.1) + enhanced.astype(np.float32) * 0.9
-    enhanced = np.clip(enhanced_float, 0, 255).astype(np.uint8)
+    # Apply slight sharpening: a single uint8 filter2D pass does the blend
+    # and the saturation (no float32 copies of the image)
+    enhanced = cv2.filter2D(enhanced, -1, _SHARPEN_KERNEL)
     
     return enhanced
 
@@ -180,33 +273,101 @@ def resize_image_if_needed(image: Image.Image, max_size: Tuple[int, int] = (2000
     return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
 
-def image_to_bytes(image: Image.Image, format: str = 'JPEG') -> bytes:
+# Encoder settings favouring speed; callers can override per call. PNG is
+# lossless, so a low zlib level only trades size for encode time (level 6,
+# PIL's default, is several times slower). JPEG keeps PIL's quality, with
+# the extra Huffman-optimization pass explicitly off.
+_FAST_SAVE_OPTIONS = {
+    'PNG': {'compress_level': 1},
+    'JPEG': {'optimize': False},
+}
+
+
+def resize_array_if_needed(img_array: np.ndarray, max_size: Tuple[int, int] = (2000, 2000)) -> np.ndarray:
+    """
+    Array counterpart of resize_image_if_needed for callers that already hold
+    pixels as a NumPy array: downscales with OpenCV's INTER_AREA (SIMD, and
+    the alias-free choice for shrinking) without a round-trip through PIL.
+    
+    Args:
+        img_array: NumPy array of image (HxW or HxWxC)
+        max_size: Maximum (width, height)
+        
+    Returns:
+        Resized array (the input itself if already within bounds)
+    """
+    height, width = img_array.shape[:2]
+    max_width, max_height = max_size
+    
+    if width <= max_width and height <= max_height:
+        return img_array
+    
+    # Calculate scaling factor
+    scale = min(max_width / width, max_height / height)
+    new_size = (int(width * scale), int(height * scale))
+    
+    cv2 = _get_cv2()
+    if cv2 is None:
+        return np.asarray(Image.fromarray(img_array).resize(new_size, Image.Resampling.LANCZOS))
+    return cv2.resize(img_array, new_size, interpolation=cv2.INTER_AREA)
+
+
+def image_to_bytes(image: Image.Image, format: str = 'JPEG', **save_options) -> bytes:
     """
     Convert PIL Image to bytes.
     
     Args:
         image: PIL Image object
         format: Image format
+        **save_options: Encoder options passed to ``Image.save``, overriding
+            the fast defaults (e.g. ``compress_level=9`` for a stored PNG)
         
     Returns:
         Image bytes
     """
     buffer = io.BytesIO()
-    image.save(buffer, format=format)
+    image.save(buffer, format=format, **{**_FAST_SAVE_OPTIONS.get(format.upper(), {}), **save_options})
     return buffer.getvalue()
 
 
-def bytes_to_image(image_bytes: bytes) -> Image.Image:
+def _draft_jpeg(image: Image.Image, size: Tuple[int, int]) -> None:
+    """Ask libjpeg to decode ``image`` at the smallest DCT scale >= ``size``."""
+    if image.format == 'JPEG':
+        image.draft(image.mode, size)
+
+
+def bytes_to_image(image_bytes: bytes, target_size: Optional[Tuple[int, int]] = None) -> Image.Image:
     """
     Convert bytes to PIL Image.
     
     Args:
         image_bytes: Image bytes
+        target_size: Optional (width, height) the caller will downscale to.
+            JPEGs are then decoded at a reduced scale no smaller than this,
+            so ``image.size`` may be smaller than the encoded size; run
+            validate_image on an image opened without it.
         
     Returns:
         PIL Image object
     """
-    return Image.open(io.BytesIO(image_bytes))
+    image = Image.open(io.BytesIO(image_bytes))
+    if target_size is not None:
+        _draft_jpeg(image, target_size)
+    return image
+
+
+def _laplacian_variance(gray: np.ndarray) -> float:
+    """
+    Variance of the 4-neighbour Laplacian, matching cv2.Laplacian(ksize=1)
+    with its default reflect-101 border. NumPy-only fallback for when OpenCV
+    is unavailable: whole-array slices, no per-pixel Python loop.
+    """
+    padded = np.pad(gray.astype(np.float32), 1, mode='reflect')
+    laplacian = (
+        padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
+        - 4.0 * padded[1:-1, 1:-1]
+    )
+    return float(laplacian.var(dtype=np.float64))
 
 
 def calculate_image_quality(img_array: np.ndarray) -> float:
@@ -226,23 +387,32 @@ def calculate_image_quality(img_array: np.ndarray) -> float:
             gray = np.dot(img_array[..., :3], [0.2989, 0.5870, 0.1140]).astype(np.uint8)
         else:
             gray = img_array
+        laplacian_var = _laplacian_variance(gray)
+        mean_brightness = float(gray.mean())
+        std_brightness = float(gray.std())
     else:
         # Convert to grayscale for analysis
         if len(img_array.shape) == 3:
             gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
         else:
             gray = img_array
+        
+        # Laplacian variance, brightness and contrast, each from one
+        # meanStdDev pass
+        _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_32F))
+        laplacian_var = laplacian_std[0, 0] ** 2
+        mean, std = cv2.meanStdDev(gray)
+        mean_brightness = mean[0, 0]
+        std_brightness = std[0, 0]
     
     # Calculate sharpness using Laplacian variance
-    laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
     sharpness_score = min(laplacian_var / 500.0, 1.0)  # Normalize
     
     # Calculate brightness (should be in middle range)
-    mean_brightness = np.mean(gray)
     brightness_score = 1.0 - abs(mean_brightness - 127.5) / 127.5
     
     # Calculate contrast
-    contrast_score = np.std(gray) / 128.0
+    contrast_score = std_brightness / 128.0
     contrast_score = min(contrast_score, 1.0)
     
     # Combined quality score
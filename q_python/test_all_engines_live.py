@@ -1,64 +1,88 @@
 """
 Test script to verify all engines work with LIVE data from LunarCrush and StockNews API.
 """
-import requests
-import json
+import asyncio
+import httpx
+import logging
+import orjson
 from datetime import datetime
 import time
 import sys
-import io
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 # API Configuration
 API_URL = "http://localhost:8000/api/v1/signals/generate"
 SENTIMENT_URL = "http://localhost:8000/api/v1/sentiment/analyze"
+HEALTH_URL = "http://localhost:8000/health"
 
-def test_crypto_with_live_data():
-    """Test all engines with LIVE LunarCrush data for crypto."""
-    print("=" * 70)
-    print("TEST 1: CRYPTO (Bitcoin) - Using LIVE LunarCrush Data")
-    print("=" * 70)
+# Tracebacks go to the DEBUG log; pass --verbose to see them.
+logger = logging.getLogger(__name__)
+
+async def _post(client, url, payload, timeout):
+    """POST ``payload`` to ``url`` and return ``(response, elapsed_seconds)``."""
+    start_time = time.time()
+    response = await client.post(url, json=payload, timeout=timeout)
+    return response, time.time() - start_time
+
+
+def display_sentiment(result, source_name):
+    """Display the standalone sentiment engine response."""
+    if isinstance(result, Exception):
+        print(f"  [ERROR] Error testing sentiment: {str(result)}")
+        return
+
+    sentiment_response, _ = result
+    if sentiment_response.status_code == 200:
+        sentiment_data = sentiment_response.json()
+        metadata = sentiment_data.get('metadata', {})
+        
+        print(f"  [OK] Sentiment Score: {sentiment_data.get('score', 'N/A')}")
+        print(f"  [OK] Confidence: {sentiment_data.get('confidence', 'N/A')}")
+        print(f"  [OK] News Source: {metadata.get('news_source', 'N/A')}")
+        print(f"  [OK] Total Texts Analyzed: {metadata.get('total_texts', 0)}")
+        
+        # Show news items if available
+        individual_results = metadata.get('individual_ml_results', [])
+        if individual_results:
+            print(f"\n  [NEWS] Fetched {len(individual_results)} news items from {source_name}:")
+            for i, item in enumerate(individual_results[:5], 1):  # Show first 5
+                source = item.get('source', 'unknown')
+                sentiment = item.get('sentiment', 'N/A')
+                print(f"     {i}. Source: {source}, Sentiment: {sentiment}")
+    else:
+        print(f"  [WARN] Sentiment API returned: {sentiment_response.status_code}")
+        print(f"     {sentiment_response.text}")
+
+
+def display_signal(result, asset_name):
+    """Display the combined all-engines response."""
+    if isinstance(result, Exception):
+        print(f"  [ERROR] Error: {str(result)}")
+        logger.debug("Signal request for %s failed", asset_name, exc_info=result)
+        return
+
+    response, elapsed = result
+    print(f"  [TIME] Execution time: {elapsed:.2f} seconds\n")
     
-    # First, test sentiment engine separately to see fetched news
-    print("\n[Step 1] Testing Sentiment Engine with LIVE LunarCrush data...")
+    if response.status_code == 200:
+        data = response.json()
+        display_results(data, asset_name)
+    else:
+        print(f"  [ERROR] Error: {response.status_code}")
+        print(f"     {response.text}")
+
+
+async def test_crypto_with_live_data(client):
+    """Test all engines with LIVE LunarCrush data for crypto."""
     sentiment_request = {
         "asset_id": "BTC",
         "asset_type": "crypto",
         "news_source": "lunarcrush"  # Explicitly use LunarCrush
     }
-    
-    try:
-        print("  -> Fetching live news from LunarCrush API...")
-        sentiment_response = requests.post(SENTIMENT_URL, json=sentiment_request, timeout=120)
-        
-        if sentiment_response.status_code == 200:
-            sentiment_data = sentiment_response.json()
-            metadata = sentiment_data.get('metadata', {})
-            
-            print(f"  [OK] Sentiment Score: {sentiment_data.get('score', 'N/A')}")
-            print(f"  [OK] Confidence: {sentiment_data.get('confidence', 'N/A')}")
-            print(f"  [OK] News Source: {metadata.get('news_source', 'N/A')}")
-            print(f"  [OK] Total Texts Analyzed: {metadata.get('total_texts', 0)}")
-            
-            # Show news items if available
-            individual_results = metadata.get('individual_ml_results', [])
-            if individual_results:
-                print(f"\n  [NEWS] Fetched {len(individual_results)} news items from LunarCrush:")
-                for i, item in enumerate(individual_results[:5], 1):  # Show first 5
-                    source = item.get('source', 'unknown')
-                    sentiment = item.get('sentiment', 'N/A')
-                    print(f"     {i}. Source: {source}, Sentiment: {sentiment}")
-        else:
-            print(f"  [WARN] Sentiment API returned: {sentiment_response.status_code}")
-            print(f"     {sentiment_response.text}")
-    except Exception as e:
-        print(f"  [ERROR] Error testing sentiment: {str(e)}")
-    
-    # Now test all engines combined
-    print("\n[Step 2] Testing ALL ENGINES combined with LIVE data...")
     signal_request = {
         "strategy_id": "test_live_crypto",
         "asset_id": "BTC",
@@ -78,69 +102,32 @@ def test_crypto_with_live_data():
         }
     }
     
-    try:
-        print("  -> Running all engines (this may take 30-60 seconds)...")
-        start_time = time.time()
-        response = requests.post(API_URL, json=signal_request, timeout=180)
-        elapsed = time.time() - start_time
-        
-        print(f"  [TIME] Execution time: {elapsed:.2f} seconds\n")
-        
-        if response.status_code == 200:
-            data = response.json()
-            display_results(data, "BTC (Crypto)")
-        else:
-            print(f"  [ERROR] Error: {response.status_code}")
-            print(f"     {response.text}")
-    except Exception as e:
-        print(f"  [ERROR] Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    # The sentiment probe and the full-engine call hit different endpoints,
+    # so run them concurrently and print once both are back.
+    sentiment_result, signal_result = await asyncio.gather(
+        _post(client, SENTIMENT_URL, sentiment_request, 120),
+        _post(client, API_URL, signal_request, 180),
+        return_exceptions=True,
+    )
+    
+    print("=" * 70)
+    print("TEST 1: CRYPTO (Bitcoin) - Using LIVE LunarCrush Data")
+    print("=" * 70)
+    
+    print("\n[Step 1] Sentiment Engine with LIVE LunarCrush data...")
+    display_sentiment(sentiment_result, "LunarCrush")
+    
+    print("\n[Step 2] ALL ENGINES combined with LIVE data...")
+    display_signal(signal_result, "BTC (Crypto)")
 
 
-def test_stock_with_live_data():
+async def test_stock_with_live_data(client):
     """Test all engines with LIVE StockNews API data for stocks."""
-    print("\n\n" + "=" * 70)
-    print("TEST 2: STOCK (Apple) - Using LIVE StockNews API Data")
-    print("=" * 70)
-    
-    # First, test sentiment engine separately
-    print("\n[Step 1] Testing Sentiment Engine with LIVE StockNews API data...")
     sentiment_request = {
         "asset_id": "AAPL",
         "asset_type": "stock",
         "news_source": "stock_news_api"  # Explicitly use StockNews API
     }
-    
-    try:
-        print("  -> Fetching live news from StockNews API...")
-        sentiment_response = requests.post(SENTIMENT_URL, json=sentiment_request, timeout=120)
-        
-        if sentiment_response.status_code == 200:
-            sentiment_data = sentiment_response.json()
-            metadata = sentiment_data.get('metadata', {})
-            
-            print(f"  [OK] Sentiment Score: {sentiment_data.get('score', 'N/A')}")
-            print(f"  [OK] Confidence: {sentiment_data.get('confidence', 'N/A')}")
-            print(f"  [OK] News Source: {metadata.get('news_source', 'N/A')}")
-            print(f"  [OK] Total Texts Analyzed: {metadata.get('total_texts', 0)}")
-            
-            # Show news items if available
-            individual_results = metadata.get('individual_ml_results', [])
-            if individual_results:
-                print(f"\n  [NEWS] Fetched {len(individual_results)} news items from StockNews API:")
-                for i, item in enumerate(individual_results[:5], 1):  # Show first 5
-                    source = item.get('source', 'unknown')
-                    sentiment = item.get('sentiment', 'N/A')
-                    print(f"     {i}. Source: {source}, Sentiment: {sentiment}")
-        else:
-            print(f"  [WARN] Sentiment API returned: {sentiment_response.status_code}")
-            print(f"     {sentiment_response.text}")
-    except Exception as e:
-        print(f"  [ERROR] Error testing sentiment: {str(e)}")
-    
-    # Now test all engines combined
-    print("\n[Step 2] Testing ALL ENGINES combined with LIVE data...")
     signal_request = {
         "strategy_id": "test_live_stock",
         "asset_id": "AAPL",
@@ -160,41 +147,40 @@ def test_stock_with_live_data():
         }
     }
     
-    try:
-        print("  -> Running all engines (this may take 30-60 seconds)...")
-        start_time = time.time()
-        response = requests.post(API_URL, json=signal_request, timeout=180)
-        elapsed = time.time() - start_time
-        
-        print(f"  [TIME] Execution time: {elapsed:.2f} seconds\n")
-        
-        if response.status_code == 200:
-            data = response.json()
-            display_results(data, "AAPL (Stock)")
-        else:
-            print(f"  [ERROR] Error: {response.status_code}")
-            print(f"     {response.text}")
-    except Exception as e:
-        print(f"  [ERROR] Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    sentiment_result, signal_result = await asyncio.gather(
+        _post(client, SENTIMENT_URL, sentiment_request, 120),
+        _post(client, API_URL, signal_request, 180),
+        return_exceptions=True,
+    )
+    
+    print("\n\n" + "=" * 70)
+    print("TEST 2: STOCK (Apple) - Using LIVE StockNews API Data")
+    print("=" * 70)
+    
+    print("\n[Step 1] Sentiment Engine with LIVE StockNews API data...")
+    display_sentiment(sentiment_result, "StockNews API")
+    
+    print("\n[Step 2] ALL ENGINES combined with LIVE data...")
+    display_signal(signal_result, "AAPL (Stock)")
 
 
 def display_results(data, asset_name):
     """Display comprehensive results from all engines."""
-    print("=" * 70)
-    print(f"RESULTS FOR {asset_name}")
-    print("=" * 70)
+    # Collect the report and write it once instead of one print() per line.
+    lines = []
+    lines.append("=" * 70)
+    lines.append(f"RESULTS FOR {asset_name}")
+    lines.append("=" * 70)
     
     # Summary
-    print(f"\n[SUMMARY]")
-    print(f"   Final Score: {data.get('final_score', 'N/A')}")
-    print(f"   Action: {data.get('action', 'N/A')}")
-    print(f"   Confidence: {data.get('confidence', 'N/A')}")
-    print(f"   Timestamp: {data.get('timestamp', 'N/A')}")
+    lines.append(f"\n[SUMMARY]")
+    lines.append(f"   Final Score: {data.get('final_score', 'N/A')}")
+    lines.append(f"   Action: {data.get('action', 'N/A')}")
+    lines.append(f"   Confidence: {data.get('confidence', 'N/A')}")
+    lines.append(f"   Timestamp: {data.get('timestamp', 'N/A')}")
     
     # Engine Scores
-    print(f"\n[ENGINE SCORES]")
+    lines.append(f"\n[ENGINE SCORES]")
     engine_scores = data.get('engine_scores', {})
     for engine, score_data in engine_scores.items():
         # Handle both dict format (with 'score' key) and direct numeric format
@@ -203,99 +189,122 @@ def display_results(data, asset_name):
         else:
             score = score_data
         status = "[OK]" if abs(score) > 0.1 else "[--]"
-        print(f"   {status} {engine.upper():15s}: {score:7.4f}")
+        lines.append(f"   {status} {engine.upper():15s}: {score:7.4f}")
     
     # Engine Details
-    print(f"\n[ENGINE DETAILS]")
+    lines.append(f"\n[ENGINE DETAILS]")
     metadata = data.get('metadata', {})
-    engine_details = metadata.get('engine_details', {})
+    ed = metadata.get('engine_details', {})
     
     # Sentiment Engine Details
-    if 'sentiment' in engine_details:
-        sent_data = engine_details['sentiment']
+    sent_data = ed.get('sentiment')
+    if sent_data is not None:
         sent_meta = sent_data.get('metadata', {})
-        print(f"\n   [SENTIMENT ENGINE]")
-        print(f"      Score: {sent_data.get('score', 'N/A')}")
-        print(f"      Confidence: {sent_data.get('confidence', 'N/A')}")
-        print(f"      News Source: {sent_meta.get('news_source', 'N/A')}")
-        print(f"      Total Texts: {sent_meta.get('total_texts', 0)}")
+        lines.append(f"\n   [SENTIMENT ENGINE]")
+        lines.append(f"      Score: {sent_data.get('score', 'N/A')}")
+        lines.append(f"      Confidence: {sent_data.get('confidence', 'N/A')}")
+        lines.append(f"      News Source: {sent_meta.get('news_source', 'N/A')}")
+        lines.append(f"      Total Texts: {sent_meta.get('total_texts', 0)}")
         
         # Show layer breakdown
         layer_breakdown = sent_meta.get('layer_breakdown', {})
         if layer_breakdown:
-            print(f"      Layer Breakdown:")
-            for layer, data in layer_breakdown.items():
-                score = data.get('score', 0)
-                conf = data.get('confidence', 0)
-                print(f"        - {layer}: score={score:.4f}, confidence={conf:.4f}")
+            lines.append(f"      Layer Breakdown:")
+            for layer, layer_data in layer_breakdown.items():
+                score = layer_data.get('score', 0)
+                conf = layer_data.get('confidence', 0)
+                lines.append(f"        - {layer}: score={score:.4f}, confidence={conf:.4f}")
     
     # Technical Engine Details
-    if 'trend' in engine_details:
-        trend_data = engine_details['trend']
+    trend_data = ed.get('trend')
+    if trend_data is not None:
         trend_meta = trend_data.get('metadata', {})
-        print(f"\n   [TECHNICAL ENGINE]")
-        print(f"      Score: {trend_data.get('score', 'N/A')}")
-        print(f"      Confidence: {trend_data.get('confidence', 'N/A')}")
+        lines.append(f"\n   [TECHNICAL ENGINE]")
+        lines.append(f"      Score: {trend_data.get('score', 'N/A')}")
+        lines.append(f"      Confidence: {trend_data.get('confidence', 'N/A')}")
         indicators = trend_meta.get('indicators', {})
         if indicators:
-            print(f"      Indicators:")
-            for ind, val in indicators.items():
-                if val is not None:
-                    print(f"        - {ind}: {val}")
+            lines.append(f"      Indicators:")
+            lines.extend(f"        - {ind}: {val}" for ind, val in indicators.items() if val is not None)
     
     # Fundamental Engine Details
-    if 'fundamental' in engine_details:
-        fund_data = engine_details['fundamental']
+    fund_data = ed.get('fundamental')
+    if fund_data is not None:
         fund_meta = fund_data.get('metadata', {})
-        print(f"\n   [FUNDAMENTAL ENGINE]")
-        print(f"      Score: {fund_data.get('score', 'N/A')}")
-        print(f"      Confidence: {fund_data.get('confidence', 'N/A')}")
+        lines.append(f"\n   [FUNDAMENTAL ENGINE]")
+        lines.append(f"      Score: {fund_data.get('score', 'N/A')}")
+        lines.append(f"      Confidence: {fund_data.get('confidence', 'N/A')}")
         score_breakdown = fund_meta.get('score_breakdown', {})
         if score_breakdown:
-            print(f"      Score Breakdown:")
-            for key, val in score_breakdown.items():
-                if val is not None:
-                    print(f"        - {key}: {val}")
+            lines.append(f"      Score Breakdown:")
+            lines.extend(f"        - {key}: {val}" for key, val in score_breakdown.items() if val is not None)
     
     # Liquidity Engine
-    if 'liquidity' in engine_details:
-        liq_data = engine_details['liquidity']
-        print(f"\n   [LIQUIDITY ENGINE]")
-        print(f"      Score: {liq_data.get('score', 'N/A')}")
-        print(f"      Confidence: {liq_data.get('confidence', 'N/A')}")
+    liq_data = ed.get('liquidity')
+    if liq_data is not None:
+        lines.append(f"\n   [LIQUIDITY ENGINE]")
+        lines.append(f"      Score: {liq_data.get('score', 'N/A')}")
+        lines.append(f"      Confidence: {liq_data.get('confidence', 'N/A')}")
     
     # Event Risk Engine
-    if 'event_risk' in engine_details:
-        event_data = engine_details['event_risk']
+    event_data = ed.get('event_risk')
+    if event_data is not None:
         event_meta = event_data.get('metadata', {})
-        print(f"\n   [EVENT RISK ENGINE]")
-        print(f"      Score: {event_data.get('score', 'N/A')}")
-        print(f"      Confidence: {event_data.get('confidence', 'N/A')}")
+        lines.append(f"\n   [EVENT RISK ENGINE]")
+        lines.append(f"      Score: {event_data.get('score', 'N/A')}")
+        lines.append(f"      Confidence: {event_data.get('confidence', 'N/A')}")
         events = event_meta.get('upcoming_events', [])
         if events:
-            print(f"      Upcoming Events: {len(events)}")
+            lines.append(f"      Upcoming Events: {len(events)}")
             for event in events[:3]:  # Show first 3
-                print(f"        - {event.get('type', 'unknown')}: {event.get('date', 'N/A')}")
+                lines.append(f"        - {event.get('type', 'unknown')}: {event.get('date', 'N/A')}")
     
     # Fusion Result
     fusion_result = metadata.get('fusion_result', {})
     if fusion_result:
-        print(f"\n   [FUSION ENGINE]")
-        print(f"      Final Score: {fusion_result.get('score', 'N/A')}")
-        print(f"      Confidence: {fusion_result.get('confidence', 'N/A')}")
+        lines.append(f"\n   [FUSION ENGINE]")
+        lines.append(f"      Final Score: {fusion_result.get('score', 'N/A')}")
+        lines.append(f"      Confidence: {fusion_result.get('confidence', 'N/A')}")
         weights = fusion_result.get('weights', {})
         if weights:
-            print(f"      Weights Used:")
+            lines.append(f"      Weights Used:")
             for engine, weight in weights.items():
-                print(f"        - {engine}: {weight}")
+                lines.append(f"        - {engine}: {weight}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Save full response
     output_file = f"test_live_{asset_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"\n[SAVED] Full response saved to: {output_file}")
 
 
+async def wait_for_server(client, url, timeout=10):
+    """Poll ``url`` until the server answers, or raise after ``timeout`` seconds."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            await client.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"Server not reachable at {url} after {timeout}s")
+
+
+async def run_tests():
+    """Run the crypto and stock tests concurrently over one pooled client."""
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+    async with httpx.AsyncClient(limits=limits) as client:
+        await wait_for_server(client, HEALTH_URL)
+        # Each test prints its whole report after its own requests finish,
+        # so the two reports do not interleave.
+        await asyncio.gather(
+            test_crypto_with_live_data(client),
+            test_stock_with_live_data(client),
+        )
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 70)
@@ -308,18 +317,8 @@ def main():
     print("  - Python FastAPI server is running on http://localhost:8000")
     print("  - LUNARCRUSH_API_KEY is set in environment")
     print("  - STOCKNEWS_API_KEY is set in environment")
-    print("\nStarting tests in 3 seconds...")
-    time.sleep(3)
-    
-    # Test crypto
-    test_crypto_with_live_data()
-    
-    # Wait a bit between tests
-    print("\n\nWaiting 5 seconds before next test...")
-    time.sleep(5)
-    
-    # Test stock
-    test_stock_with_live_data()
+    print("\nRunning crypto and stock tests concurrently (this may take 30-60 seconds)...")
+    asyncio.run(run_tests())
     
     print("\n\n" + "=" * 70)
     print("[SUCCESS] ALL TESTS COMPLETED")
@@ -327,5 +326,6 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if '--verbose' in sys.argv else logging.INFO)
     main()
 
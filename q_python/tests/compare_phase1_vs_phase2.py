@@ -2,11 +2,15 @@
 Compare Phase 1 (ML only) vs Phase 2 (ML + Keywords + Market) Sentiment Analysis
 Tests on real news data to measure improvement.
 """
+import asyncio
+import logging
 import sys
 from pathlib import Path
 from typing import Dict, Any, List
 import json
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -31,6 +35,63 @@ except ImportError as e:
     from src.services.data.lunarcrush_service import LunarCrushService
     from src.services.sentiment import CryptoKeywordAnalyzer, SentimentAggregator, MarketSignalAnalyzer
 
+import debug_cache
+
+# Tracebacks go to the DEBUG log; pass --verbose to see them.
+logger = logging.getLogger(__name__)
+
+# Re-runs within this window read the news from q_python/.cache/ instead of
+# LunarCrush (only when Q_TEST_CACHE=1, see debug_cache).
+NEWS_CACHE_TTL = 300
+
+
+def _fetch_news(lunarcrush, symbol: str, limit: int) -> List[Dict[str, Any]]:
+    """Fetch coin news, going through the opt-in disk cache when enabled."""
+    fetch = lunarcrush.fetch_coin_news
+    if debug_cache.enabled():
+        fetch = debug_cache.cached(fetch, 'LunarCrushService.fetch_coin_news', NEWS_CACHE_TTL)
+    return fetch(symbol, limit=limit)
+
+
+def _combine(title: str, text: str) -> str:
+    return f"{title}. {text}" if title and text else (text or title)
+
+
+def build_text_data(news_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Shape LunarCrush news items into the text_data SentimentEngine expects."""
+    return [
+        {
+            'text': _combine(item.get('title', ''), item.get('text', item.get('title', ''))),
+            'source': item.get('source', 'unknown'),
+            'title': item.get('title', ''),
+            'url': item.get('url', '')
+        }
+        for item in news_items
+    ]
+
+
+async def _run_phases(engine, symbol: str, text_data: List[Dict[str, Any]]):
+    """
+    Run Phase 1 (batched analyze_text) and Phase 2 (calculate) concurrently.
+    
+    Returns:
+        (phase1_results, phase2_result); each is the call's result or the
+        exception it raised.
+    """
+    phase1 = asyncio.to_thread(
+        engine.analyze_text_batch,
+        [it['text'] for it in text_data],
+        sources=[it['source'] for it in text_data]
+    )
+    phase2 = asyncio.to_thread(
+        engine.calculate,
+        asset_id=symbol,
+        asset_type='crypto',
+        text_data=text_data,
+        exchange='binance'
+    )
+    return await asyncio.gather(phase1, phase2, return_exceptions=True)
+
 
 def compare_phase1_vs_phase2(symbol: str = "BTC", limit: int = 10):
     """
@@ -55,7 +116,7 @@ def compare_phase1_vs_phase2(symbol: str = "BTC", limit: int = 10):
     
     # Fetch real news data
     print(f"\n[1/4] Fetching {limit} news items for {symbol} from LunarCrush...")
-    news_items = lunarcrush.fetch_coin_news(symbol, limit=limit)
+    news_items = _fetch_news(lunarcrush, symbol, limit)
     
     if not news_items:
         print(f"[ERROR] No news items found for {symbol}")
@@ -64,76 +125,60 @@ def compare_phase1_vs_phase2(symbol: str = "BTC", limit: int = 10):
     print(f"[OK] Fetched {len(news_items)} news items")
     
     # Prepare text data
-    text_data = []
-    for item in news_items:
-        title = item.get('title', '')
-        text = item.get('text', title)
-        combined_text = f"{title}. {text}" if title and text else (text or title)
-        source = item.get('source', 'unknown')
-        
-        text_data.append({
-            'text': combined_text,
-            'source': source,
-            'title': title,
-            'url': item.get('url', '')
-        })
+    text_data = build_text_data(news_items)
     
+    # Phase 1 and Phase 2 only read text_data, so run them side by side.
+    # Load FinBERT first so the worker threads don't race the lazy init.
+    engine.initialize()
     print(f"\n[2/4] Running Phase 1 (ML only) analysis...")
+    print(f"[3/4] Running Phase 2 (ML + Keywords + Market) analysis...")
+    phase1_raw, phase2_result = asyncio.run(_run_phases(engine, symbol, text_data))
+    if isinstance(phase1_raw, Exception):
+        phase1_raw = [phase1_raw] * len(text_data)
+    
     phase1_results = []
-    for item in text_data:
-        try:
-            # Phase 1: analyze_text (ML only)
-            result = engine.analyze_text(item['text'], source=item['source'])
+    for item, result in zip(text_data, phase1_raw):
+        if isinstance(result, Exception):
+            print(f"  [WARNING] Phase 1 failed for item: {str(result)}")
             phase1_results.append({
                 'title': item['title'][:60],
                 'source': item['source'],
-                'sentiment': result.get('sentiment', 'neutral'),
-                'score': result.get('score', 0.0),
-                'confidence': result.get('confidence', 0.0)
+                'sentiment': 'neutral',
+                'score': 0.0,
+                'confidence': 0.0,
+                'error': str(result)
             })
-        except Exception as e:
-            print(f"  [WARNING] Phase 1 failed for item: {str(e)}")
+        else:
             phase1_results.append({
                 'title': item['title'][:60],
                 'source': item['source'],
-                'sentiment': 'neutral',
-                'score': 0.0,
-                'confidence': 0.0,
-                'error': str(e)
+                'sentiment': result.get('sentiment', 'neutral'),
+                'score': result.get('score', 0.0),
+                'confidence': result.get('confidence', 0.0)
             })
     
     print(f"[OK] Phase 1 completed: {len(phase1_results)} results")
     
-    print(f"\n[3/4] Running Phase 2 (ML + Keywords + Market) analysis...")
-    try:
-        # Phase 2: calculate (full pipeline)
-        phase2_result = engine.calculate(
-            asset_id=symbol,
-            asset_type='crypto',
-            text_data=text_data,
-            exchange='binance'
-        )
-        
-        phase2_overall = {
-            'sentiment': phase2_result.get('metadata', {}).get('overall_sentiment', 'neutral'),
-            'score': phase2_result.get('score', 0.0),
-            'confidence': phase2_result.get('confidence', 0.0),
-            'layer_breakdown': phase2_result.get('metadata', {}).get('layer_breakdown', {}),
-            'keyword_analysis': phase2_result.get('metadata', {}).get('keyword_analysis'),
-            'market_signals': phase2_result.get('metadata', {}).get('market_signals')
-        }
-        
-        # Get individual results from Phase 2 metadata
-        phase2_individual = phase2_result.get('metadata', {}).get('individual_ml_results', [])
-        
-        print(f"[OK] Phase 2 completed")
-        
-    except Exception as e:
-        print(f"[ERROR] Phase 2 failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    if isinstance(phase2_result, Exception):
+        print(f"[ERROR] Phase 2 failed: {str(phase2_result)}")
+        logger.debug("Phase 2 failed", exc_info=phase2_result)
         return
     
+    phase2_meta = phase2_result.get('metadata', {})
+    phase2_overall = {
+        'sentiment': phase2_meta.get('overall_sentiment', 'neutral'),
+        'score': phase2_result.get('score', 0.0),
+        'confidence': phase2_result.get('confidence', 0.0),
+        'layer_breakdown': phase2_meta.get('layer_breakdown', {}),
+        'keyword_analysis': phase2_meta.get('keyword_analysis'),
+        'market_signals': phase2_meta.get('market_signals')
+    }
+    
+    # Get individual results from Phase 2 metadata
+    phase2_individual = phase2_meta.get('individual_ml_results', [])
+    
+    print(f"[OK] Phase 2 completed")
+    
     print(f"\n[4/4] Comparing results...")
     print("\n" + "="*80)
     print("DETAILED COMPARISON")
@@ -143,15 +188,25 @@ def compare_phase1_vs_phase2(symbol: str = "BTC", limit: int = 10):
     print("\nIndividual News Items Comparison:")
     print("-" * 80)
     
-    for i, (p1, p2_item) in enumerate(zip(phase1_results, phase2_individual[:len(phase1_results)]), 1):
+    # Pull the numeric fields into columns once and diff them in one go;
+    # the loop below only formats.
+    paired = list(zip(phase1_results, phase2_individual))
+    p1_scores = np.fromiter((p1['score'] for p1, _ in paired), dtype=np.float64, count=len(paired))
+    p1_confs = np.fromiter((p1['confidence'] for p1, _ in paired), dtype=np.float64, count=len(paired))
+    p2_scores = np.fromiter((p2.get('score', 0.0) for _, p2 in paired), dtype=np.float64, count=len(paired))
+    p2_confs = np.fromiter((p2.get('confidence', 0.0) for _, p2 in paired), dtype=np.float64, count=len(paired))
+    score_diffs = p2_scores - p1_scores
+    conf_diffs = p2_confs - p1_confs
+    
+    for j, (p1, p2_item) in enumerate(paired):
         p2_sentiment = p2_item.get('sentiment', 'neutral')
-        p2_score = p2_item.get('score', 0.0)
-        p2_conf = p2_item.get('confidence', 0.0)
+        p2_score = p2_scores[j]
+        p2_conf = p2_confs[j]
         
-        score_diff = p2_score - p1['score']
-        conf_diff = p2_conf - p1['confidence']
+        score_diff = score_diffs[j]
+        conf_diff = conf_diffs[j]
         
-        print(f"\n[{i}] {p1['title']}...")
+        print(f"\n[{j + 1}] {p1['title']}...")
         print(f"     Source: {p1['source']}")
         print(f"     Phase 1 (ML only):     {p1['sentiment']:8s} | Score: {p1['score']:6.3f} | Conf: {p1['confidence']:.3f}")
         print(f"     Phase 2 (Full):        {p2_sentiment:8s} | Score: {p2_score:6.3f} | Conf: {p2_conf:.3f}")
@@ -163,8 +218,10 @@ def compare_phase1_vs_phase2(symbol: str = "BTC", limit: int = 10):
     print("="*80)
     
     # Calculate Phase 1 aggregate
-    phase1_avg_score = sum(r['score'] for r in phase1_results) / len(phase1_results) if phase1_results else 0.0
-    phase1_avg_conf = sum(r['confidence'] for r in phase1_results) / len(phase1_results) if phase1_results else 0.0
+    phase1_scores = np.fromiter((r['score'] for r in phase1_results), dtype=np.float64, count=len(phase1_results))
+    phase1_confs = np.fromiter((r['confidence'] for r in phase1_results), dtype=np.float64, count=len(phase1_results))
+    phase1_avg_score = float(phase1_scores.mean()) if phase1_scores.size else 0.0
+    phase1_avg_conf = float(phase1_confs.mean()) if phase1_confs.size else 0.0
     
     phase2_score = phase2_overall['score']
     phase2_conf = phase2_overall['confidence']
@@ -211,8 +268,11 @@ def compare_phase1_vs_phase2(symbol: str = "BTC", limit: int = 10):
     print(f"Confidence Change: {conf_improvement:+.3f} ({conf_improvement/abs(phase1_avg_conf)*100 if phase1_avg_conf != 0 else 0:+.1f}%)")
     
     # Sentiment agreement
-    phase1_sentiments = [r['sentiment'] for r in phase1_results]
-    phase1_most_common = max(set(phase1_sentiments), key=phase1_sentiments.count) if phase1_sentiments else 'neutral'
+    if phase1_results:
+        labels, counts = np.unique([r['sentiment'] for r in phase1_results], return_counts=True)
+        phase1_most_common = str(labels[counts.argmax()])
+    else:
+        phase1_most_common = 'neutral'
     
     print(f"\nSentiment Agreement:")
     print(f"  Phase 1 Most Common: {phase1_most_common}")
@@ -261,7 +321,7 @@ def test_phase2_components_only(symbol: str = "BTC", limit: int = 10):
     
     # Fetch real news data
     print(f"\n[1/3] Fetching {limit} news items for {symbol} from LunarCrush...")
-    news_items = lunarcrush.fetch_coin_news(symbol, limit=limit)
+    news_items = _fetch_news(lunarcrush, symbol, limit)
     
     if not news_items:
         print(f"[ERROR] No news items found for {symbol}")
@@ -272,15 +332,11 @@ def test_phase2_components_only(symbol: str = "BTC", limit: int = 10):
     # Test keyword analyzer
     print(f"\n[2/3] Testing Keyword Analyzer on news items...")
     keyword_results = []
-    for item in news_items:
-        title = item.get('title', '')
-        text = item.get('text', title)
-        combined_text = f"{title}. {text}" if title and text else (text or title)
-        
-        result = keyword_analyzer.analyze(combined_text)
+    for item in build_text_data(news_items):
+        result = keyword_analyzer.analyze(item['text'])
         keyword_results.append({
-            'title': title[:60],
-            'source': item.get('source', 'unknown'),
+            'title': item['title'][:60],
+            'source': item['source'],
             'sentiment': result.get('sentiment', 'neutral'),
             'score': result.get('score', 0.0),
             'confidence': result.get('confidence', 0.0),
@@ -294,10 +350,10 @@ def test_phase2_components_only(symbol: str = "BTC", limit: int = 10):
     
     # Aggregate keyword results
     if keyword_results:
-        keyword_scores = [r['score'] for r in keyword_results]
-        keyword_confidences = [r['confidence'] for r in keyword_results]
-        avg_keyword_score = sum(keyword_scores) / len(keyword_scores) if keyword_scores else 0.0
-        avg_keyword_conf = sum(keyword_confidences) / len(keyword_confidences) if keyword_confidences else 0.0
+        keyword_scores = np.fromiter((r['score'] for r in keyword_results), dtype=np.float64, count=len(keyword_results))
+        keyword_confidences = np.fromiter((r['confidence'] for r in keyword_results), dtype=np.float64, count=len(keyword_results))
+        avg_keyword_score = float(keyword_scores.mean())
+        avg_keyword_conf = float(keyword_confidences.mean())
     else:
         avg_keyword_score = 0.0
         avg_keyword_conf = 0.0
@@ -374,8 +430,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Compare Phase 1 vs Phase 2 sentiment analysis')
     parser.add_argument('--symbol', type=str, default='BTC', help='Crypto symbol to test (default: BTC)')
     parser.add_argument('--limit', type=int, default=10, help='Number of news items to compare (default: 10)')
+    parser.add_argument('--verbose', action='store_true', help='Log tracebacks for failures')
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
     
     try:
         compare_phase1_vs_phase2(symbol=args.symbol, limit=args.limit)
@@ -383,6 +441,5 @@ if __name__ == "__main__":
         print("\n\nComparison interrupted by user")
     except Exception as e:
         print(f"\n[ERROR] Comparison failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Comparison failed", exc_info=e)
 
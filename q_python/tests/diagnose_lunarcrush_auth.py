@@ -4,12 +4,20 @@ Diagnose LunarCrush API connection and authentication
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# On a terminal stdout flushes every line; buffer instead and flush once per
+# test section, right before its request. (Piped output is already
+# block-buffered.)
+sys.stdout.reconfigure(line_buffering=False)
+
 from src.config import LUNARCRUSH_API_KEY
 
 print("=" * 80)
@@ -33,11 +41,45 @@ headers_bearer = {
     'Content-Type': 'application/json'
 }
 
+
+# Transient failures (5xx, connection resets) are retried with exponential
+# backoff so one blip doesn't spoil the diagnostic. 429 is not retried: urllib3
+# would sleep out the server's Retry-After uncapped, and reporting the rate
+# limit is this script's job. The last response is still returned when retries
+# run out rather than raised.
+_RETRY_KWARGS = dict(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    raise_on_status=False,
+)
+try:
+    RETRY = Retry(backoff_jitter=0.5, backoff_max=30, **_RETRY_KWARGS)
+except TypeError:  # urllib3 < 2 has no jitter / configurable cap
+    RETRY = Retry(**_RETRY_KWARGS)
+
+
+def _session(headers=None):
+    """Session with a small keep-alive pool, so calls after the first skip the TLS handshake."""
+    sess = requests.Session()
+    sess.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=RETRY))
+    if headers:
+        sess.headers.update(headers)
+    return sess
+
+
+# Bearer-auth calls share one session; the query-param test gets its own so
+# it is sent without the Authorization header.
+session = _session(headers_bearer)
+plain_session = _session()
+
 print(f"URL: {url}")
 print(f"Headers: {{'Authorization': 'Bearer {LUNARCRUSH_API_KEY[:20]}...'}}")
 
+sys.stdout.flush()
 try:
-    response = requests.get(url, headers=headers_bearer, timeout=10)
+    response = session.get(url, timeout=10)
     print(f"\n✅ Status Code: {response.status_code}")
     print(f"Response Headers:\n  {json.dumps(dict(response.headers), indent=2)}")
     
@@ -70,8 +112,9 @@ url_with_params = f"https://lunarcrush.com/api4/public/topic/BTC/news/v1"
 
 print(f"URL: {url_with_params}?key={LUNARCRUSH_API_KEY[:20]}...")
 
+sys.stdout.flush()
 try:
-    response = requests.get(url_with_params, params=params, timeout=10)
+    response = plain_session.get(url_with_params, params=params, timeout=10)
     print(f"\n✅ Status Code: {response.status_code}")
     
     if response.status_code == 429:
@@ -101,20 +144,26 @@ info_endpoints = [
     "https://lunarcrush.com/api/v4/account",
 ]
 
-for info_url in info_endpoints:
-    try:
-        response = requests.get(
-            info_url,
-            headers=headers_bearer,
-            timeout=5
-        )
+# Probe all candidates at once and report the first one that answers.
+sys.stdout.flush()
+with ThreadPoolExecutor(max_workers=len(info_endpoints)) as ex:
+    futures = {ex.submit(session.get, info_url, timeout=5): info_url for info_url in info_endpoints}
+    for future in as_completed(futures):
+        try:
+            response = future.result()
+        except Exception:
+            continue
         if response.status_code in [200, 401, 403]:
+            info_url = futures[future]
             print(f"\n{info_url}: {response.status_code}")
             if response.status_code == 200:
                 print(f"Response: {response.json()}")
+            for other in futures:
+                other.cancel()
             break
-    except:
-        pass
+
+session.close()
+plain_session.close()
 
 print("\n" + "="*80)
 print("✅ Diagnostic complete. Check results above.")
@@ -0,0 +1,163 @@
+"""
+Smoke tests for CustomStrategyParser.
+
+Covers rule validation and the module-level parsed-strategy cache: repeated
+parses of an unchanged strategy are served from the LRU, while an edited
+strategy (same id, different rules) is parsed fresh. The compiled-strategy
+cache beside it is keyed the same way.
+
+Run from the q_python directory:
+
+    .venv/Scripts/python.exe -m tests.test_custom_strategy_parser
+"""
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from src.services.strategies import custom_strategy_parser as csp  # noqa: E402
+from src.services.strategies.custom_strategy_parser import CustomStrategyParser  # noqa: E402
+from src.services.strategies.strategy_executor import Indicators, StrategyExecutor  # noqa: E402
+
+
+def _make_strategy(rsi_threshold: float = 30):
+    return {
+        'entry_rules': [{'indicator': 'RSI', 'operator': '<', 'value': rsi_threshold}],
+        'exit_rules': [{'field': 'final_score', 'operator': '<', 'value': '-0.3'}],
+        'indicators': [{'name': 'RSI', 'parameters': {'period': 14}}],
+        'timeframe': '1h',
+    }
+
+
+def test_parse_converts_values_to_float() -> None:
+    parsed = CustomStrategyParser().parse(_make_strategy())
+    assert parsed['entry_rules'][0]['value'] == 30.0
+    assert parsed['exit_rules'][0]['value'] == -0.3
+    assert parsed['exit_rules'][0]['field'] == 'final_score'
+    assert parsed['timeframe'] == '1h'
+    assert parsed['required_indicators'] == ['RSI']
+    print("  PASS: parse -> numeric values coerced, field rules kept")
+
+
+def test_invalid_rule_rejected() -> None:
+    parser = CustomStrategyParser()
+    bad = {'entry_rules': [{'indicator': 'RSI', 'operator': '~', 'value': 30}]}
+    try:
+        parser.parse(bad)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("invalid operator should raise ValueError")
+    result = parser.validate_syntax(bad)
+    assert result['valid'] is False
+    assert result['errors'] == ["Entry rule 1 is invalid"]
+    print("  PASS: invalid operator -> ValueError / validation error")
+
+
+def test_parse_cache_hit_and_invalidation() -> None:
+    csp._PARSE_CACHE.clear()
+    first = CustomStrategyParser().parse(_make_strategy(), strategy_id='s1')
+    second = CustomStrategyParser().parse(_make_strategy(), strategy_id='s1')
+    assert first == second
+    assert first is not second
+    assert len(csp._PARSE_CACHE) == 1
+
+    edited = CustomStrategyParser().parse(_make_strategy(rsi_threshold=25), strategy_id='s1')
+    assert edited['entry_rules'][0]['value'] == 25.0
+    assert len(csp._PARSE_CACHE) == 2
+    print("  PASS: parse cache -> hit on identical payload, miss on edit")
+
+
+def test_compiled_strategy_cached() -> None:
+    csp._PARSE_CACHE.clear()
+    csp._COMPILED_CACHE.clear()
+    compiles = []
+
+    def compile_strategy(parsed):
+        compiles.append(parsed)
+        return StrategyExecutor().compile_strategy(parsed)
+
+    parser = CustomStrategyParser()
+    first = parser.parse_compiled(_make_strategy(), compile_strategy, strategy_id='s1')
+    second = CustomStrategyParser().parse_compiled(_make_strategy(), compile_strategy, strategy_id='s1')
+    assert len(compiles) == 1, f"expected one compile, got {len(compiles)}"
+    assert first is not second
+    assert first['_compiled'] is second['_compiled']
+    assert first['entry_rules'] == parser.parse(_make_strategy(), strategy_id='s1')['entry_rules']
+
+    parser.parse_compiled(_make_strategy(rsi_threshold=25), compile_strategy, strategy_id='s1')
+    assert len(compiles) == 2
+    print("  PASS: compiled strategy cached under the parse key")
+
+
+def test_required_engines_from_rules() -> None:
+    parser = CustomStrategyParser()
+    parsed = parser.parse({
+        'entry_rules': [{'indicator': 'RSI', 'operator': '<', 'value': 30}],
+        'exit_rules': [
+            {'field': 'metadata.engine_details.event_risk.score', 'operator': '<', 'value': -0.5},
+            {'field': 'final_score', 'operator': '<', 'value': -0.3},
+        ],
+    })
+    assert parser.required_engines(parsed) == frozenset({'trend', 'event_risk'})
+
+    unknown = parser.parse({'entry_rules': [{'field': 'custom.path', 'operator': '>', 'value': 1}]})
+    assert parser.required_engines(unknown) == frozenset(
+        {'sentiment', 'trend', 'fundamental', 'liquidity', 'event_risk'}
+    )
+    print("  PASS: required_engines -> mapped from rules, unknown path needs all")
+
+
+def test_vectorized_rules_match_per_rule_path() -> None:
+    operators = ['>', '<', '>=', '<=', '==', '!=', 'cross_above', 'cross_below', '>']
+    indicators_used = ['RSI', 'MA20', 'MA50', 'MA200', 'RSI', 'MACD', 'ATR', 'RSI', 'BB']
+    parsed = CustomStrategyParser().parse({
+        'entry_rules': [
+            {'indicator': name, 'operator': op, 'value': 50}
+            for name, op in zip(indicators_used, operators)
+        ],
+        'exit_rules': [{'indicator': 'RSI', 'operator': '>', 'value': 70}],
+    })
+    assert parsed['_vectorized']['entry_rules'] is not None
+    assert parsed['_vectorized']['exit_rules'] is None  # too few rules
+
+    values = Indicators(MA20=60.0, MA50=40.0, MA200=50.0, RSI=50.0005, MACD=None, ATR=55.0)
+    ex = StrategyExecutor(verbose=True)
+    vectorized = ex.execute(parsed, {}, values)
+    per_rule = ex.execute({k: v for k, v in parsed.items() if k != '_vectorized'}, {}, values)
+    assert vectorized['entry_details'] == per_rule['entry_details']
+    assert vectorized['exit_details'] == per_rule['exit_details']
+    print("  PASS: vectorized rules -> same conditions as per-rule evaluation")
+
+
+def main() -> int:
+    failures = []
+    for test in [
+        test_parse_converts_values_to_float,
+        test_invalid_rule_rejected,
+        test_parse_cache_hit_and_invalidation,
+        test_compiled_strategy_cached,
+        test_required_engines_from_rules,
+        test_vectorized_rules_match_per_rule_path,
+    ]:
+        print(f"\n[{test.__name__}]")
+        try:
+            test()
+        except AssertionError as e:
+            print(f"  FAIL: {e}")
+            failures.append(test.__name__)
+        except Exception as e:
+            print(f"  ERROR: {type(e).__name__}: {e}")
+            failures.append(test.__name__)
+
+    print()
+    if failures:
+        print(f"FAILED: {len(failures)} test(s) -- {failures}")
+        return 1
+    print("All custom_strategy_parser tests passed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,13 +8,34 @@ Test file to call external news APIs and print responses
 import sys
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pprint
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.services.data.lunarcrush_service import LunarCrushService
-from src.services.data.stock_news_service import StockNewsService
+from src.services.data.lunarcrush_service import get_lunarcrush_service
+from src.services.data.stock_news_service import get_stock_news_service
+
+# Q_TEST_CACHE=1 serves repeat runs from q_python/.cache/ instead of the APIs.
+from debug_cache import install_service as cached_service  # noqa: E402
+
+
+def print_news_item(idx, news, text_label):
+    """Print one news item; ``text_label`` names the body field in the output."""
+    title, source, url, published = (
+        news.get(k, 'N/A') for k in ('title', 'source', 'url', 'published_at')
+    )
+    text = news.get('text')
+    body = f"{text[:100]}..." if text else "N/A"
+    print(
+        f"News #{idx}:\n"
+        f"  Title: {title}\n"
+        f"  Source: {source}\n"
+        f"  URL: {url}\n"
+        f"  Published: {published}\n"
+        f"  {text_label}: {body}\n"
+    )
 
 
 def test_lunarcrush_crypto_news():
@@ -24,36 +45,35 @@ def test_lunarcrush_crypto_news():
     print("="*80 + "\n")
     
     try:
-        lunarcrush = LunarCrushService()
+        lunarcrush = cached_service(get_lunarcrush_service())
         
         # Test single coin
         symbols = ['BTC', 'ETH', 'SOL']
         
-        for symbol in symbols:
-            print(f"\n📰 Fetching news for {symbol}...")
+        # News and social metrics for every symbol are independent requests;
+        # fetch them all at once and print in order afterwards.
+        with ThreadPoolExecutor(max_workers=2 * len(symbols)) as ex:
+            news_futures = [ex.submit(lunarcrush.fetch_coin_news, symbol, limit=5) for symbol in symbols]
+            metrics_futures = [ex.submit(lunarcrush.fetch_social_metrics, symbol) for symbol in symbols]
+        
+        for symbol, news_future in zip(symbols, news_futures):
+            print(f"\n📰 News for {symbol}")
             print("-" * 60)
             
-            news_items = lunarcrush.fetch_coin_news(symbol, limit=5)
+            news_items = news_future.result()
             
             print(f"✅ Retrieved {len(news_items)} news items for {symbol}\n")
             
             for idx, news in enumerate(news_items, 1):
-                print(f"News #{idx}:")
-                print(f"  Title: {news.get('title', 'N/A')}")
-                print(f"  Source: {news.get('source', 'N/A')}")
-                print(f"  URL: {news.get('url', 'N/A')}")
-                print(f"  Published: {news.get('published_at', 'N/A')}")
-                print(f"  Description: {news.get('text', 'N/A')[:100]}..." if news.get('text') else "  Description: N/A")
-                print()
+                print_news_item(idx, news, 'Description')
         
         # Test social metrics
         print("\n" + "="*60)
         print("📊 Testing LunarCrush Social Metrics")
         print("="*60 + "\n")
         
-        for symbol in symbols:
-            print(f"Fetching metrics for {symbol}...")
-            metrics = lunarcrush.fetch_social_metrics(symbol)
+        for symbol, metrics_future in zip(symbols, metrics_futures):
+            metrics = metrics_future.result()
             
             print(f"✅ Metrics for {symbol}:")
             print(f"  Galaxy Score: {metrics.get('galaxy_score', 'N/A')}")
@@ -76,27 +96,24 @@ def test_stocknewsapi_stock_news():
     print("="*80 + "\n")
     
     try:
-        stock_news = StockNewsService()
+        stock_news = cached_service(get_stock_news_service())
         
         # Test multiple stocks
         symbols = ['AAPL', 'TSLA', 'GOOGL']
         
-        for symbol in symbols:
-            print(f"\n📰 Fetching news for {symbol}...")
+        with ThreadPoolExecutor(max_workers=len(symbols)) as ex:
+            news_futures = [ex.submit(stock_news.fetch_news, symbol, limit=5) for symbol in symbols]
+        
+        for symbol, news_future in zip(symbols, news_futures):
+            print(f"\n📰 News for {symbol}")
             print("-" * 60)
             
-            news_items = stock_news.fetch_news(symbol, limit=5)
+            news_items = news_future.result()
             
             print(f"✅ Retrieved {len(news_items)} news items for {symbol}\n")
             
             for idx, news in enumerate(news_items, 1):
-                print(f"News #{idx}:")
-                print(f"  Title: {news.get('title', 'N/A')}")
-                print(f"  Source: {news.get('source', 'N/A')}")
-                print(f"  URL: {news.get('url', 'N/A')}")
-                print(f"  Published: {news.get('published_at', 'N/A')}")
-                print(f"  Text: {news.get('text', 'N/A')[:100]}..." if news.get('text') else "  Text: N/A")
-                print()
+                print_news_item(idx, news, 'Text')
     
     except Exception as e:
         print(f"❌ Error testing StockNewsAPI: {str(e)}")
@@ -104,15 +121,17 @@ def test_stocknewsapi_stock_news():
         traceback.print_exc()
 
 
-def serialize_for_json(item):
-    """Convert datetime objects to strings for JSON serialization"""
-    result = {}
-    for k, v in item.items():
-        if hasattr(v, 'isoformat'):  # datetime object
-            result[k] = v.isoformat()
-        else:
-            result[k] = v
-    return result
+def json_default(value):
+    """json ``default`` hook: datetimes as ISO strings, anything else via str()."""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def dump_json(items):
+    """Stream ``items`` to stdout as indented JSON."""
+    json.dump(items, sys.stdout, indent=2, default=json_default)
+    sys.stdout.write('\n')
 
 
 def test_raw_api_responses():
@@ -122,21 +141,27 @@ def test_raw_api_responses():
     print("="*80 + "\n")
     
     try:
+        lunarcrush = cached_service(get_lunarcrush_service())
+        stock_news = cached_service(get_stock_news_service())
+        
+        # Different hosts, independent requests: fetch both at once.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            lunarcrush_future = ex.submit(lunarcrush.fetch_coin_news, 'BTC', limit=2)
+            stock_news_future = ex.submit(stock_news.fetch_news, 'AAPL', limit=2)
+        
         # Test LunarCrush raw response
         print("📡 LunarCrush Raw API Response for BTC:")
         print("-" * 60)
-        lunarcrush = LunarCrushService()
-        response = lunarcrush.fetch_coin_news('BTC', limit=2)
-        print(json.dumps([serialize_for_json(item) for item in response[:2]], indent=2))
+        response = lunarcrush_future.result()
+        dump_json(response[:2])
         
         print("\n\n")
         
         # Test StockNewsAPI raw response
         print("📡 StockNewsAPI Raw API Response for AAPL:")
         print("-" * 60)
-        stock_news = StockNewsService()
-        response = stock_news.fetch_news('AAPL', limit=2)
-        print(json.dumps([serialize_for_json(item) for item in response[:2]], indent=2))
+        response = stock_news_future.result()
+        dump_json(response[:2])
     
     except Exception as e:
         print(f"❌ Error: {str(e)}")
@@ -151,7 +176,7 @@ def test_title_description_separation():
     print("="*80 + "\n")
     
     try:
-        stock_news = StockNewsService()
+        stock_news = cached_service(get_stock_news_service())
         response = stock_news.fetch_news('AAPL', limit=3)
         
         print("Checking StockNewsAPI Response (AAPL):\n")
@@ -0,0 +1,156 @@
+"""
+Smoke test for the process-wide FRED latest-value cache.
+
+Run from the q_python directory:
+
+    .venv/Scripts/python.exe -m tests.test_fred_cache
+"""
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import pandas as pd  # noqa: E402
+
+from src.services.macro import fred_service as fred_module  # noqa: E402
+from src.services.macro.fred_service import FredService  # noqa: E402
+
+
+class _FakeFred:
+    """Stands in for fredapi.Fred and counts get_series calls."""
+
+    def __init__(self, values=None):
+        self.calls = []
+        self.values = values or {'FEDFUNDS': 5.33, 'CPIAUCSL': 310.0, 'DGS10': 4.2, 'DGS2': 4.5}
+
+    def get_series(self, series_id, start=None, end=None):
+        self.calls.append(series_id)
+        if series_id not in self.values:
+            return pd.Series(dtype=float)
+        value = self.values[series_id]
+        if isinstance(value, list):
+            index = pd.date_range('2026-01-01', periods=len(value), freq='MS')
+            return pd.Series(value, index=index)
+        return pd.Series([value], index=[pd.Timestamp('2026-01-01')])
+
+
+def _service(fake: _FakeFred) -> FredService:
+    svc = FredService(api_key=None)
+    svc.fred = fake
+    return svc
+
+
+def test_latest_value_shared_across_instances() -> None:
+    """Two FredService instances → one FRED fetch per series."""
+    fred_module._latest_cache.clear()
+    fake = _FakeFred()
+
+    first = _service(fake).get_latest_value('FEDFUNDS')
+    second = _service(fake).get_latest_value('FEDFUNDS')
+
+    assert first == second == {'value': 5.33, 'date': '2026-01-01', 'series_id': 'FEDFUNDS'}
+    assert fake.calls == ['FEDFUNDS'], f"expected 1 fetch, got {fake.calls}"
+    print("  PASS: latest value cached across instances")
+
+
+def test_yield_curve_cached() -> None:
+    """calculate_yield_curve fetches DGS10/DGS2 once."""
+    fred_module._latest_cache.clear()
+    fake = _FakeFred()
+    svc = _service(fake)
+
+    first = svc.calculate_yield_curve()
+    second = svc.calculate_yield_curve()
+
+    assert first == second
+    assert first['is_inverted'] is True
+    assert fake.calls == ['DGS10', 'DGS2'], f"unexpected fetches {fake.calls}"
+    print("  PASS: yield curve cached")
+
+
+def test_misses_not_cached() -> None:
+    """A series with no data is retried on the next call."""
+    fred_module._latest_cache.clear()
+    fake = _FakeFred(values={})
+    svc = _service(fake)
+
+    assert svc.get_latest_value('GDP') is None
+    fake.values['GDP'] = 28000.0
+    assert svc.get_latest_value('GDP')['value'] == 28000.0
+    print("  PASS: misses are not cached")
+
+
+def test_expired_entry_refetched() -> None:
+    """Entries older than FRED_CACHE_TTL_SECS are fetched again."""
+    fred_module._latest_cache.clear()
+    fake = _FakeFred()
+    svc = _service(fake)
+
+    svc.get_latest_value('CPIAUCSL')
+    value, ts = fred_module._latest_cache['CPIAUCSL']
+    fred_module._latest_cache['CPIAUCSL'] = (value, ts - fred_module.FRED_CACHE_TTL_SECS - 1)
+    svc.get_latest_value('CPIAUCSL')
+
+    assert fake.calls.count('CPIAUCSL') == 2, f"expected refetch, got {fake.calls}"
+    print("  PASS: expired entry refetched")
+
+
+def test_previous_value() -> None:
+    """get_previous_value returns the observation before the latest one."""
+    fred_module._latest_cache.clear()
+    fake = _FakeFred(values={'FEDFUNDS': [5.33, float('nan'), 5.08, 4.83], 'GDP': 28000.0})
+    svc = _service(fake)
+
+    previous = svc.get_previous_value('FEDFUNDS')
+    assert previous == {'value': 5.08, 'date': '2026-03-01', 'series_id': 'FEDFUNDS'}, previous
+    assert svc.get_latest_value('FEDFUNDS')['value'] == 4.83
+    assert svc.get_previous_value('GDP') is None  # single observation
+    print("  PASS: previous value")
+
+
+def test_primary_indicators_fetched_concurrently() -> None:
+    """fetch_all_primary_indicators fetches every series once, off-thread."""
+    fred_module._latest_cache.clear()
+    fake = _FakeFred(values={'FEDFUNDS': 5.33, 'CPIAUCSL': 310.0, 'DGS10': 4.2,
+                             'DGS2': 4.5, 'PAYEMS': 159000.0, 'GDP': 28000.0})
+    indicators = _service(fake).fetch_all_primary_indicators()
+
+    assert set(indicators) == {'cpi', 'fedfunds', 'yield_curve', 'nfp', 'gdp'}
+    assert all(v is not None for v in indicators.values()), indicators
+    assert indicators['yield_curve']['is_inverted'] is True
+    assert sorted(fake.calls) == sorted(['CPIAUCSL', 'FEDFUNDS', 'DGS10', 'DGS2', 'PAYEMS', 'GDP'])
+    print("  PASS: primary indicators fetched concurrently")
+
+
+def main() -> int:
+    failures = []
+    for test in [
+        test_latest_value_shared_across_instances,
+        test_yield_curve_cached,
+        test_misses_not_cached,
+        test_expired_entry_refetched,
+        test_previous_value,
+        test_primary_indicators_fetched_concurrently,
+    ]:
+        print(f"\n[{test.__name__}]")
+        try:
+            test()
+        except AssertionError as e:
+            print(f"  FAIL: {e}")
+            failures.append(test.__name__)
+        except Exception as e:
+            print(f"  ERROR: {type(e).__name__}: {e}")
+            failures.append(test.__name__)
+    fred_module._latest_cache.clear()
+
+    print()
+    if failures:
+        print(f"FAILED: {len(failures)} test(s) — {failures}")
+        return 1
+    print("All FRED cache tests passed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
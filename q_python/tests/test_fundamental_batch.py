@@ -0,0 +1,166 @@
+"""
+Smoke test for FundamentalEngine.calculate_batch.
+
+The batch path must give the same answer as calling calculate() per asset,
+in input order, while sharing one Finnhub fundamentals fetch across stocks.
+No network calls: the Finnhub, LunarCrush and CoinGecko services are stubbed.
+
+Run from the q_python directory:
+
+    .venv/Scripts/python.exe -m tests.test_fundamental_batch
+"""
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from src.services.engines.fundamental_engine import FundamentalEngine  # noqa: E402
+
+_METRICS = {
+    'AAPL': {'pe_ratio': 28.0, 'price_to_book': 40.0, 'roe': 150.0, 'gross_margin': 45.0},
+    'MSFT': {'pe_ratio': 32.0, 'roe': 35.0, 'debt_to_equity': 0.4, 'revenue_growth_ttm_yoy': 15.0},
+    'F': {'pe_ratio': 7.0, 'price_to_book': 1.1, 'dividend_yield': 5.0},
+    'EMPTY': {},
+}
+
+
+class _FakeFinnhub:
+    def __init__(self, fail: bool = False):
+        self.api_key = 'test-key'
+        self.fail = fail
+        self.calls = []
+
+    def fetch_company_fundamentals_batch(self, symbols):
+        self.calls.append(list(symbols))
+        if self.fail:
+            raise RuntimeError("finnhub down")
+        return {s: _METRICS[s] for s in symbols if s in _METRICS}
+
+
+class _FakeLunarCrush:
+    def __init__(self):
+        self.bulk_calls = 0
+
+    def fetch_coins_list_bulk(self):
+        self.bulk_calls += 1
+        return []
+
+    def fetch_social_metrics(self, symbol):
+        return {'galaxy_score': 60, 'alt_rank': 50, 'social_volume': 1000}
+
+
+class _FakeCoinGecko:
+    def get_developer_activity_score(self, symbol):
+        return {'activity_score': 50}
+
+    def get_tokenomics_score(self, symbol):
+        return {'tokenomics_score': 40}
+
+
+def _engine(fail: bool = False) -> FundamentalEngine:
+    engine = FundamentalEngine()
+    engine.finnhub_service = _FakeFinnhub(fail)
+    engine.lunarcrush_service = _FakeLunarCrush()
+    engine.coingecko_service = _FakeCoinGecko()
+    return engine
+
+
+def _assets():
+    return [
+        {'asset_id': 'MSFT', 'asset_type': 'stock'},
+        {'asset_id': 'btc-uuid', 'asset_type': 'crypto', 'asset_symbol': 'BTC'},
+        {'asset_id': 'aapl', 'asset_type': 'stock'},
+        {'asset_id': 'NOPE', 'asset_type': 'stock'},
+        {'asset_id': 'F', 'asset_type': 'stock'},
+        {'asset_id': 'EMPTY', 'asset_type': 'stock'},
+        {'asset_id': 'MSFT', 'asset_type': 'stock'},
+    ]
+
+
+def test_batch_matches_calculate_in_input_order() -> None:
+    """Each batch result equals calculate() for the asset at the same index."""
+    assets = _assets()
+    engine = _engine()
+    results = engine.calculate_batch(assets)
+
+    assert len(results) == len(assets)
+    for asset, result in zip(assets, results):
+        assert result == engine.calculate(**asset), (asset, result)
+    assert results[0]['score'] is not None and results[0] == results[6]
+    assert results[0] != results[2] != results[4]
+    print("  PASS: batch results match calculate() in input order")
+
+
+def test_batch_shares_one_finnhub_call() -> None:
+    """Stocks share one fetch over unique symbols; missing or empty ones are no-data."""
+    engine = _engine()
+    results = engine.calculate_batch(_assets())
+
+    assert engine.finnhub_service.calls == [['MSFT', 'AAPL', 'NOPE', 'F', 'EMPTY']]
+    assert results[3]['metadata']['status'] == 'no_data'
+    assert results[5]['metadata']['status'] == 'no_data'
+    print("  PASS: one shared Finnhub call")
+
+
+def test_batch_fetch_failure_falls_back_per_asset() -> None:
+    """A raising batch fetch falls back to calculate() for every stock."""
+    assets = _assets()
+    engine = _engine(fail=True)
+    results = engine.calculate_batch(assets)
+
+    # One failed batch call, then one per-stock call from calculate().
+    assert len(engine.finnhub_service.calls) == 1 + 6
+    assert engine.finnhub_service.calls[1:] == [
+        ['MSFT'], ['AAPL'], ['NOPE'], ['F'], ['EMPTY'], ['MSFT'],
+    ]
+    for asset, result in zip(assets, results):
+        assert result == engine.calculate(**asset), (asset, result)
+    assert results[0]['metadata']['status'] == 'error'
+    assert results[1]['score'] is not None
+    print("  PASS: batch failure falls back per asset")
+
+
+def test_crypto_bulk_warmup_needs_two_assets() -> None:
+    """The LunarCrush bulk warm-up only runs for two or more crypto assets."""
+    one = [{'asset_id': 'BTC', 'asset_type': 'crypto'}]
+    two = one + [{'asset_id': 'ETH', 'asset_type': 'crypto'}]
+
+    engine = _engine()
+    engine.calculate_batch(one)
+    assert engine.lunarcrush_service.bulk_calls == 0
+
+    engine.calculate_batch(two)
+    assert engine.lunarcrush_service.bulk_calls == 1
+    assert engine.finnhub_service.calls == []
+    print("  PASS: bulk warm-up gated on two crypto assets")
+
+
+def main() -> int:
+    failures = []
+    for test in [
+        test_batch_matches_calculate_in_input_order,
+        test_batch_shares_one_finnhub_call,
+        test_batch_fetch_failure_falls_back_per_asset,
+        test_crypto_bulk_warmup_needs_two_assets,
+    ]:
+        print(f"\n[{test.__name__}]")
+        try:
+            test()
+        except AssertionError as e:
+            print(f"  FAIL: {e}")
+            failures.append(test.__name__)
+        except Exception as e:
+            print(f"  ERROR: {type(e).__name__}: {e}")
+            failures.append(test.__name__)
+
+    print()
+    if failures:
+        print(f"FAILED: {len(failures)} test(s) — {failures}")
+        return 1
+    print("All fundamental batch tests passed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
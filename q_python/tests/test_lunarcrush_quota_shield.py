@@ -16,6 +16,8 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import requests
+
 # Make `src` importable when running this file directly.
 HERE = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.dirname(HERE))
@@ -23,6 +25,7 @@ sys.path.insert(0, os.path.dirname(HERE))
 from src.services.data.lunarcrush_service import (  # noqa: E402
     LunarCrushService,
     LunarCrushQuotaGate,
+    _retry_after_secs,
     get_lunarcrush_service,
 )
 
@@ -210,6 +213,45 @@ def test_force_minute_drain() -> None:
     print("  PASS: force_minute_drain")
 
 
+def test_retry_after_holds_gate() -> None:
+    """A 429 carrying Retry-After keeps the gate closed past the minute rollover."""
+    state_path = os.path.join(HERE, "_tmp_quota_retry_after.json")
+    if os.path.exists(state_path):
+        os.remove(state_path)
+    svc = _fresh_service(state_path, rpm=10, daily=100)
+
+    def fake_http(symbol: str):
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "120"
+        raise requests.exceptions.HTTPError("429 Too Many Requests", response=response)
+
+    svc._fetch_social_metrics_http = fake_http  # type: ignore[assignment]
+
+    assert svc.fetch_social_metrics("BTC") == {}
+    assert svc.get_stats()["stats"]["http_429s"] == 1
+    assert svc._gate.snapshot()["blocked_for_secs"] > 60
+
+    # Simulate the minute window rolling over: tokens refill, Retry-After still holds.
+    svc._gate._minute_window -= 1
+    assert svc._gate.try_acquire() is False
+    svc._gate._blocked_until = 0.0
+    assert svc._gate.try_acquire() is True
+
+    # Bogus headers are clamped (or ignored) rather than closing the gate for good.
+    def retry_after(value: str):
+        response = requests.Response()
+        response.headers["Retry-After"] = value
+        return _retry_after_secs(requests.exceptions.HTTPError(response=response))
+
+    assert retry_after("inf") == 3600.0
+    assert retry_after("1e12") == 3600.0
+    assert retry_after("-5") == 0.0
+    assert retry_after("nan") is None
+    assert retry_after("Wed, 21 Oct 2026 07:28:00 GMT") is None
+    print("  PASS: Retry-After holds gate")
+
+
 def test_singleton_identity() -> None:
     """get_lunarcrush_service() must return the same instance across calls."""
     a = get_lunarcrush_service()
@@ -334,6 +376,7 @@ def main() -> int:
         test_stale_served_when_quota_blocked,
         test_state_persists_across_restart,
         test_force_minute_drain,
+        test_retry_after_holds_gate,
         test_singleton_identity,
         test_bulk_general_news_single_call,
         test_bulk_coins_list_warms_cache,
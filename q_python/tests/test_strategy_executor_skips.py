@@ -15,10 +15,13 @@ Run from the q_python directory:
 import os
 import sys
 
+import numpy as np
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.dirname(HERE))
 
-from src.services.strategies.strategy_executor import StrategyExecutor  # noqa: E402
+from src.services.strategies.custom_strategy_parser import CustomStrategyParser  # noqa: E402
+from src.services.strategies.strategy_executor import Indicators, StrategyExecutor  # noqa: E402
 
 
 def _make_fusion_result(score: float):
@@ -36,7 +39,7 @@ def _make_engine_scores(sentiment: float = 0.0):
 
 
 def test_indicator_missing_marked_skipped() -> None:
-    ex = StrategyExecutor()
+    ex = StrategyExecutor(verbose=True)
     rules = [{'indicator': 'RSI', 'operator': '<', 'value': 30}]
     result = ex._evaluate_rules(
         rules, indicators={'RSI': None}, market_data={}, engine_scores=None, fusion_result=None,
@@ -48,7 +51,7 @@ def test_indicator_missing_marked_skipped() -> None:
 
 
 def test_indicator_present_and_matching() -> None:
-    ex = StrategyExecutor()
+    ex = StrategyExecutor(verbose=True)
     rules = [{'indicator': 'RSI', 'operator': '<', 'value': 30}]
     result = ex._evaluate_rules(
         rules, indicators={'RSI': 25.0}, market_data={}, engine_scores=None, fusion_result=None,
@@ -59,8 +62,25 @@ def test_indicator_present_and_matching() -> None:
     print("  PASS: indicator-present + matches -> skipped=False, met=True")
 
 
+def test_indicators_object_lookup() -> None:
+    """The executor accepts the slotted Indicators object as well as a dict;
+    indicators the trend engine doesn't compute are treated as missing."""
+    ex = StrategyExecutor(verbose=True)
+    rules = [
+        {'indicator': 'RSI', 'operator': '<', 'value': 30},
+        {'indicator': 'STOCH', 'operator': '>', 'value': 80},
+    ]
+    result = ex._evaluate_rules(
+        rules, indicators=Indicators(RSI=25.0), market_data={}, engine_scores=None, fusion_result=None,
+    )
+    assert result['conditions'][0]['met'] is True
+    assert result['conditions'][0]['skipped'] is False
+    assert result['conditions'][1]['skipped'] is True
+    print("  PASS: Indicators object -> attribute lookup, unknown name skipped")
+
+
 def test_field_path_present_and_matching() -> None:
-    ex = StrategyExecutor()
+    ex = StrategyExecutor(verbose=True)
     rules = [{'field': 'final_score', 'operator': '>', 'value': 0.2}]
     result = ex._evaluate_rules(
         rules, indicators={}, market_data={}, engine_scores=None,
@@ -75,7 +95,7 @@ def test_field_path_present_and_matching() -> None:
 def test_field_path_missing_marked_skipped() -> None:
     """Phase-3 regression: a field path that doesn't resolve must be
     reported as skipped=True, not silently met=False."""
-    ex = StrategyExecutor()
+    ex = StrategyExecutor(verbose=True)
     rules = [{
         'field': 'metadata.engine_details.nonexistent_engine.score',
         'operator': '>',
@@ -95,7 +115,7 @@ def test_field_path_missing_marked_skipped() -> None:
 
 
 def test_mixed_rules_partial_skip() -> None:
-    ex = StrategyExecutor()
+    ex = StrategyExecutor(verbose=True)
     rules = [
         {'indicator': 'RSI', 'operator': '<', 'value': 30},
         {'field': 'metadata.engine_details.nonexistent.score', 'operator': '>', 'value': 0.1},
@@ -116,7 +136,7 @@ def test_mixed_rules_partial_skip() -> None:
 def test_malformed_rule_is_evaluable_failed_not_skipped() -> None:
     """A rule missing both 'indicator' and 'field' is an author bug, not
     missing runtime data. It should be evaluable=True, met=False."""
-    ex = StrategyExecutor()
+    ex = StrategyExecutor(verbose=True)
     rules = [{'operator': '>', 'value': 0.1}]
     result = ex._evaluate_rules(
         rules, indicators={}, market_data={}, engine_scores=None, fusion_result=None,
@@ -130,7 +150,7 @@ def test_malformed_rule_is_evaluable_failed_not_skipped() -> None:
 def test_execute_integration_all_field_paths_missing() -> None:
     """End-to-end via execute(): entry rules all have unresolvable field
     paths → executor flags all_skipped so signal_generator can fall back."""
-    ex = StrategyExecutor()
+    ex = StrategyExecutor(verbose=True)
     strategy = {
         'entry_rules': [
             {'field': 'metadata.engine_details.phantom.score', 'operator': '>', 'value': 0.1},
@@ -150,16 +170,139 @@ def test_execute_integration_all_field_paths_missing() -> None:
     print("  PASS: integration -> all-field-paths-missing flags all_skipped for fallback")
 
 
+def test_compiled_strategy_matches_uncompiled() -> None:
+    """compile_strategy closures give the same result as on-the-fly
+    evaluation, and keep the echoed rule dicts free of callables."""
+    ex = StrategyExecutor(verbose=True)
+    strategy = {
+        'entry_rules': [
+            {'indicator': 'RSI', 'operator': '<', 'value': 30},
+            {'field': 'final_score', 'operator': '==', 'value': 0.5},
+            {'indicator': 'MACD', 'operator': 'cross_above', 'value': 0.0},
+        ],
+        'exit_rules': [{'field': 'metadata.engine_details.sentiment.score', 'operator': '<', 'value': -0.2}],
+    }
+    kwargs = dict(
+        market_data={'price': 100.0},
+        indicators={'RSI': 25.0, 'MACD': None},
+        engine_scores=_make_engine_scores(sentiment=-0.4),
+        fusion_result=_make_fusion_result(0.5),
+    )
+    compiled = ex.compile_strategy(strategy)
+    assert 'entry_rules' in compiled['_compiled']
+    assert ex.execute(strategy=compiled, **kwargs) == ex.execute(strategy=strategy, **kwargs)
+    assert all(not callable(v) for rule in strategy['entry_rules'] for v in rule.values())
+    print("  PASS: compiled strategy -> same result as per-call evaluation")
+
+
+def test_equality_tolerance_is_strict() -> None:
+    """A difference of exactly 0.001 is not equal on any evaluation path."""
+    ex = StrategyExecutor(verbose=True)
+    strategy = {
+        'entry_rules': [{'indicator': 'RSI', 'operator': '==', 'value': 0}],
+        'exit_rules': [{'indicator': 'RSI', 'operator': '!=', 'value': 0}],
+    }
+    indicators = Indicators(RSI=0.001)
+    for strat in (strategy, ex.compile_strategy(strategy)):
+        result = ex.execute(strat, {}, indicators)
+        assert result['entry_details']['all_met'] is False
+        assert result['exit_details']['all_met'] is True
+    batch = ex.execute_batch(strategy, {'RSI': np.array([0.001, 0.0005])})
+    assert batch['signal'].tolist() == ['SELL', 'BUY']
+    print("  PASS: == / != tolerance -> strict at exactly 0.001")
+
+
+def test_vectorized_non_numeric_indicator_matches_per_rule() -> None:
+    """A non-numeric indicator value fails only its own rule on the
+    vectorized path, exactly as on the per-rule path."""
+    ex = StrategyExecutor(verbose=True)
+    rules = [{'indicator': 'RSI', 'operator': '<', 'value': 30, 'logic': 'OR'}] + [
+        {'indicator': 'MA20', 'operator': '>', 'value': v, 'logic': 'OR'} for v in range(8)
+    ]
+    parsed = CustomStrategyParser().parse({'entry_rules': rules})
+    assert parsed['_vectorized']['entry_rules'] is not None
+    indicators = {'RSI': {'custom': 1}, 'MA20': 'n/a'}
+
+    vectorized = ex.execute(parsed, {}, indicators)
+    per_rule = ex.execute(dict(parsed, _vectorized={}), {}, indicators)
+    assert vectorized == per_rule
+    assert vectorized['entry_details']['all_met'] is False
+    assert vectorized['entry_details']['all_skipped'] is False
+    print("  PASS: vectorized non-numeric indicator -> same as per-rule path")
+
+
+def test_non_verbose_short_circuits() -> None:
+    """Without verbose, AND stops at the first failed evaluable rule and OR
+    at the first met one; skipped rules before it still count."""
+    ex = StrategyExecutor(verbose=False)
+    and_rules = [
+        {'indicator': 'MACD', 'operator': '>', 'value': 0},
+        {'indicator': 'RSI', 'operator': '<', 'value': 30},
+        {'indicator': 'ATR', 'operator': '>', 'value': 1},
+    ]
+    result = ex._evaluate_rules(
+        and_rules, indicators={'RSI': 50.0}, market_data={}, engine_scores=None, fusion_result=None,
+    )
+    assert result['all_met'] is False
+    assert result['conditions'] == ()
+    assert result['indicators_missing'] == 1  # ATR never evaluated
+    assert result['all_skipped'] is False
+
+    or_rules = [dict(rule, logic='OR') for rule in and_rules]
+    result = ex._evaluate_rules(
+        or_rules, indicators={'RSI': 20.0}, market_data={}, engine_scores=None, fusion_result=None,
+    )
+    assert result['all_met'] is True
+    assert result['logic'] == 'OR'
+
+    result = ex._evaluate_rules(
+        and_rules, indicators={}, market_data={}, engine_scores=None, fusion_result=None,
+    )
+    assert result['all_skipped'] is True
+    assert result['indicators_missing'] == 3
+    print("  PASS: non-verbose -> short-circuits, all_skipped still exact")
+
+
+def test_execute_batch_matches_per_bar_execute() -> None:
+    """execute_batch over N bars gives the same signal as execute() per bar,
+    including bars where an indicator is missing."""
+    ex = StrategyExecutor()
+    strategy = {
+        'entry_rules': [
+            {'indicator': 'RSI', 'operator': '<', 'value': 30, 'logic': 'AND'},
+            {'indicator': 'MA20', 'operator': '>', 'value': 100, 'logic': 'AND'},
+        ],
+        'exit_rules': [{'indicator': 'RSI', 'operator': '>=', 'value': 70}],
+    }
+    rsi = [25.0, 75.0, 25.0, None, 50.0]
+    ma20 = [120.0, 120.0, 90.0, 120.0, None]
+    batch = ex.execute_batch(strategy, {
+        'RSI': np.array(rsi, dtype=float), 'MA20': np.array(ma20, dtype=float),
+    })
+    per_bar = [
+        ex.execute(strategy, {}, Indicators(RSI=r, MA20=m))['signal']
+        for r, m in zip(rsi, ma20)
+    ]
+    assert batch['signal'].tolist() == per_bar == ['BUY', 'SELL', 'HOLD', 'HOLD', 'HOLD']
+    print("  PASS: execute_batch -> same signals as per-bar execute()")
+
+
 def main() -> int:
     failures = []
     for test in [
         test_indicator_missing_marked_skipped,
         test_indicator_present_and_matching,
+        test_indicators_object_lookup,
         test_field_path_present_and_matching,
         test_field_path_missing_marked_skipped,
         test_mixed_rules_partial_skip,
         test_malformed_rule_is_evaluable_failed_not_skipped,
         test_execute_integration_all_field_paths_missing,
+        test_compiled_strategy_matches_uncompiled,
+        test_equality_tolerance_is_strict,
+        test_vectorized_non_numeric_indicator_matches_per_rule,
+        test_non_verbose_short_circuits,
+        test_execute_batch_matches_per_bar_execute,
     ]:
         print(f"\n[{test.__name__}]")
         try: